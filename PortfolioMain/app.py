@@ -18,10 +18,20 @@ load_dotenv()
 from config.secrets import load_secrets
 load_secrets()
 
-from flask import Flask, render_template, request, send_file, redirect, url_for, jsonify
+from flask import Flask, render_template, request, send_file, redirect, url_for, jsonify, Response, stream_with_context
 import json
+import hashlib
 
-from bedrock.rag import ask_portfolio
+from bedrock.rag import ask_portfolio, stream_portfolio
+from coalesce.singleflight import single_flight
+from rtdb.cache import ReadCache, cache_key
+from rtdb.invalidation import InvalidationJournal
+from rtdb.mirror import LiveMirror
+from rtdb.query import query_string
+from rtdb.session import TIMEOUT, get_session
+from rtdb.snapshot import Snapshot, common_path
+from frontend import assets, bundle, images
+from frontend.render_cache import RenderCache
 
 
 
@@ -31,10 +41,32 @@ from email.message import EmailMessage
 
 app = Flask(__name__)
 
-# Dev config for instant reload
-app.config['TEMPLATES_AUTO_RELOAD'] = True
+# Dev config for instant reload (None: follow app.debug, so production skips the
+# per-render template mtime check)
+app.config['TEMPLATES_AUTO_RELOAD'] = None
 app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0
 
+# url_for('static', ...) returns content-hashed URLs, served with immutable caching
+asset_manifest = assets.install(app)
+
+# One CSS and one JS file instead of ~17 requests, once `python -m frontend.bundle` has run
+ASSET_BUNDLES = all(name in asset_manifest.files for name in (bundle.CSS_BUNDLE, bundle.JS_BUNDLE))
+
+@app.context_processor
+def inject_asset_bundles():
+    # Debug keeps the individual files so edits show up without a rebuild
+    return {'asset_bundles': ASSET_BUNDLES and not app.debug}
+
+# Resized WebP/AVIF copies of the images under static/assets/img (`python -m frontend.images`)
+IMAGE_VARIANTS = images.load_variants(os.path.join(app.static_folder, 'assets', 'img'))
+
+@app.context_processor
+def inject_image_sources():
+    def image_sources(path, variants=None):
+        # Uploaded certifications carry their own variants; everything else uses the batch manifest
+        return images.image_sources(variants or IMAGE_VARIANTS.get(path), url_for)
+    return {'image_sources': image_sources}
+
 # ---------- Simple SMTP configuration (edit these values) ----------
 # For Gmail:
 #  - Enable 2FA on your Google account
@@ -47,8 +79,20 @@ TO_EMAIL = "swastikkulkarni737@gmail.com"       # Where you want to receive the
 
 # Firebase wrapper class to connect to Firebase Realtime Database
 class FirebaseApplication:
-    def __init__(self, url, auth=None):
+    def __init__(self, url, auth=None, cache=None, journal=None, session=None, timeout=TIMEOUT, flight=None,
+                 mirror=None):
         self.url = url.rstrip('/')
+        # Pooled keep-alive session (rtdb.session.get_session() unless one is given)
+        self._session = session
+        self.timeout = timeout
+        # Optional rtdb.cache.ReadCache; values it returns are shared, don't mutate them
+        self.cache = cache
+        # Optional rtdb.invalidation.InvalidationJournal the admin app publishes writes to
+        self.journal = journal
+        # Optional coalesce.singleflight.SingleFlight: concurrent GETs of one URL share a request
+        self.flight = flight
+        # Optional rtdb.mirror.LiveMirror: while it is current, plain reads come from it
+        self.mirror = mirror
     
     def _build_path(self, path, key=None):
         """Build the full URL path"""
@@ -59,18 +103,117 @@ class FirebaseApplication:
             url = f"{self.url}/{path}/{key}.json"
         return url
     
-    def get(self, path, key=None):
-        """GET request to fetch data from Firebase"""
+    @property
+    def http(self):
+        return self._session or get_session()
+
+    def _path_of(self, url):
+        """Database path a built URL points at ('https://.../a/b.json' -> '/a/b')"""
+        return url[len(self.url):-len('.json')] or '/'
+
+    def get(self, path, key=None, **query):
+        """GET request to fetch data from Firebase (served from the cache when enabled)
+
+        `query` takes rtdb.query.query_string() arguments: shallow=True,
+        order_by='$key', limit_to_first=1, equal_to=...
+        """
+        if not query and self._live():
+            return self.mirror.get(path, key)
         url = self._build_path(path, key)
+        query = query_string(**query)
+        fetch_url = f"{url}?{query}" if query else url
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            return response.json() if response.text else None
+            if self.cache is None:
+                return self._fetch(fetch_url)
+            if self.journal is not None:
+                self.journal.apply(self.cache)
+            return self.cache.get_or_load(cache_key(self._path_of(url), query), lambda: self._fetch(fetch_url))
         except requests.exceptions.RequestException:
             return None
 
+    def first_key(self, path):
+        """Key of the first child of `path`, fetched without any of the children's data"""
+        keys = self.mirror.get(path) if self._live() else self.get(path, shallow=True)
+        return min(keys) if isinstance(keys, dict) and keys else None
+
+    def first_child(self, path):
+        """(key, value) of the first child of `path` by key, or (None, None); downloads only that child"""
+        data = self.mirror.get(path) if self._live() else self.get(path, order_by='$key', limit_to_first=1)
+        if not isinstance(data, dict) or not data:
+            return None, None
+        key = min(data)
+        return key, data[key]
+
+    def _live(self):
+        """Whether reads can be answered from the mirror (starting its stream on first use)"""
+        return self.mirror is not None and self.mirror.start().ready
+
+    def _fetch(self, url):
+        if self.flight is not None:
+            return self.flight.do(f"firebase:{self._read_version()}:{url}", lambda: self._request(url))
+        return self._request(url)
+
+    def _read_version(self):
+        """
+        Invalidations applied so far. Part of the flight key, so a read after an
+        invalidation never joins a GET started before it (and caches its stale
+        result); the journal position means the same in every worker.
+        """
+        if self.journal is not None:
+            return self.journal.position
+        return self.cache.generation if self.cache is not None else None
+
+    def _request(self, url):
+        response = self.http.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json() if response.text else None
+
+    def snapshot(self, paths=None):
+        """Fetch every path in `paths` (or the whole database) with a single GET.
+
+        The common ancestor of the requested paths is downloaded once and
+        wrapped in a Snapshot, whose get() mirrors this class's get().
+        """
+        base = common_path(paths) if paths else '/'
+        return Snapshot(base, self.get(base))
+
+# Public content changes rarely: serve reads from memory and refresh in the background.
+# Admin edits are pushed through the invalidation journal, so the TTL only bounds
+# staleness for changes made outside the admin app (e.g. the Firebase console).
+FIREBASE_CACHE_TTL = int(os.getenv('FIREBASE_CACHE_TTL', '3600'))
+FIREBASE_CACHE_STALE_TTL = int(os.getenv('FIREBASE_CACHE_STALE_TTL', '600'))
+
+FIREBASE_URL = 'https://portfolio-536e2-default-rtdb.firebaseio.com/'
+
+# FIREBASE_MIRROR=1 keeps the whole database in memory, updated live over Firebase's
+# streaming API (one connection per worker); the cache below serves reads until the
+# mirror has loaded, and whenever it falls behind
+FIREBASE_MIRROR = os.getenv('FIREBASE_MIRROR', '0') == '1'
+
 # Initialize Firebase connection (same database as admin)
-fb = FirebaseApplication('https://portfolio-536e2-default-rtdb.firebaseio.com/', None)
+fb = FirebaseApplication(
+    FIREBASE_URL, None,
+    cache=ReadCache(
+        default_ttl=FIREBASE_CACHE_TTL,
+        ttls={'/links': 5 * FIREBASE_CACHE_TTL},  # social links barely ever change
+        stale_ttl=FIREBASE_CACHE_STALE_TTL,
+        max_entries=128,
+    ),
+    journal=InvalidationJournal(),
+    flight=single_flight(),
+    mirror=LiveMirror(FIREBASE_URL) if FIREBASE_MIRROR else None,
+)
+
+# Every subtree the home page renders from; fetched together by fb.snapshot()
+HOME_PATHS = [
+    '/landing',
+    '/about',
+    '/experience',
+    '/resume',
+    '/links/-OOvwHeVJtSsrjh3QnWR/links',
+    '/certifications',
+    '/projects',
+]
 
 
 def send_contact_email(name: str, email: str, subject: str, message: str) -> bool:
@@ -108,232 +251,253 @@ def send_contact_email(name: str, email: str, subject: str, message: str) -> boo
         print(f"❌ Failed to send contact email: {exc}")
         return False
 
+# Rendered home pages, re-rendered only when the Firebase snapshot changes.
+# The template source and asset versions are part of the version so deploys
+# that only change markup or static files still get new ETags.
+with open(os.path.join(app.root_path, 'templates', 'index.html'), 'rb') as _template:
+    home_pages = RenderCache(salt=hashlib.sha256(_template.read()).hexdigest() + asset_manifest.version)
+
 # --- Home Page ---
-@app.route('/')
-def home():
-    try:
-        # Fetch all data from Firebase (same structure as admin uses)
-        landing_data = fb.get('/landing', None) or {}
-        about_data = fb.get('/about', None) or {}
-        experience_data = fb.get('/experience', None) or {}
-        education_data = fb.get('/resume/education', None) or {}
-        links = fb.get('/links/-OOvwHeVJtSsrjh3QnWR/links', None) or {}
-
-        # Extract contact/social links
-        email = links.get('email', '') if isinstance(links, dict) else ''
-        phone = links.get('phone', '') if isinstance(links, dict) else ''
-        linkedin = links.get('linkedin', '') if isinstance(links, dict) else ''
-        telegram = links.get('telegram', '') if isinstance(links, dict) else ''
-        whatsapp = links.get('whatsapp', '') if isinstance(links, dict) else ''
-        github = links.get('github', '') if isinstance(links, dict) else ''
-
-        # Extract skills from landing page (for typed items)
-        raw_skills = landing_data.get('skills-list', {}) if isinstance(landing_data, dict) else {}
-        skills = []
-        if isinstance(raw_skills, dict):
-            for block in raw_skills.values():
+def build_home_data(snap):
+    """Turn a snapshot of HOME_PATHS into the `data` dict index.html renders"""
+    landing_data = snap.get('/landing', None) or {}
+    about_data = snap.get('/about', None) or {}
+    experience_data = snap.get('/experience', None) or {}
+    education_data = snap.get('/resume/education', None) or {}
+    links = snap.get('/links/-OOvwHeVJtSsrjh3QnWR/links', None) or {}
+
+    # Extract contact/social links
+    email = links.get('email', '') if isinstance(links, dict) else ''
+    phone = links.get('phone', '') if isinstance(links, dict) else ''
+    linkedin = links.get('linkedin', '') if isinstance(links, dict) else ''
+    telegram = links.get('telegram', '') if isinstance(links, dict) else ''
+    whatsapp = links.get('whatsapp', '') if isinstance(links, dict) else ''
+    github = links.get('github', '') if isinstance(links, dict) else ''
+
+    # Extract skills from landing page (for typed items)
+    raw_skills = landing_data.get('skills-list', {}) if isinstance(landing_data, dict) else {}
+    skills = []
+    if isinstance(raw_skills, dict):
+        for block in raw_skills.values():
+            if isinstance(block, dict) and 'skills' in block:
+                if isinstance(block.get('skills'), list):
+                    skills.extend(block.get('skills', []))
+    
+    # Format skills for typed.js (comma-separated string)
+    typed_items = ', '.join(skills) if skills else 'AWS Solutions Architect, Web Developer, Cloud Enthusiast'
+
+    # Extract bio from landing page
+    raw_bio = landing_data.get('bio', {}) if isinstance(landing_data, dict) else {}
+    bio = ''
+    if isinstance(raw_bio, dict) and raw_bio:
+        try:
+            bio_value = next(iter(raw_bio.values()))
+            if isinstance(bio_value, dict):
+                bio = bio_value.get('bio', '')
+            elif isinstance(bio_value, str):
+                bio = bio_value
+        except (StopIteration, AttributeError):
+            bio = ''
+
+    # Extract about section data
+    about_bio = ''
+    about_heading = ''
+    if isinstance(about_data, dict):
+        raw_about_bio = about_data.get('bio', {})
+        if isinstance(raw_about_bio, dict) and raw_about_bio:
+            try:
+                bio_val = next(iter(raw_about_bio.values()))
+                if isinstance(bio_val, dict):
+                    about_bio = bio_val.get('bio', '')
+                elif isinstance(bio_val, str):
+                    about_bio = bio_val
+            except (StopIteration, AttributeError):
+                pass
+        
+        raw_about_heading = about_data.get('heading', {})
+        if isinstance(raw_about_heading, dict) and raw_about_heading:
+            try:
+                heading_val = next(iter(raw_about_heading.values()))
+                if isinstance(heading_val, dict):
+                    about_heading = heading_val.get('heading', '')
+                elif isinstance(heading_val, str):
+                    about_heading = heading_val
+            except (StopIteration, AttributeError):
+                pass
+
+    # Extract about skills
+    about_skills = []
+    if isinstance(about_data, dict):
+        raw_about_skills = about_data.get('skills', {})
+        if isinstance(raw_about_skills, dict):
+            for block in raw_about_skills.values():
                 if isinstance(block, dict) and 'skills' in block:
                     if isinstance(block.get('skills'), list):
-                        skills.extend(block.get('skills', []))
-        
-        # Format skills for typed.js (comma-separated string)
-        typed_items = ', '.join(skills) if skills else 'AWS Solutions Architect, Web Developer, Cloud Enthusiast'
+                        about_skills.extend(block.get('skills', []))
 
-        # Extract bio from landing page
-        raw_bio = landing_data.get('bio', {}) if isinstance(landing_data, dict) else {}
-        bio = ''
-        if isinstance(raw_bio, dict) and raw_bio:
+    # Get skill categories
+    skill_categories = ['Cloud & DevOps', 'Web Development']
+    if isinstance(about_data, dict):
+        raw_about_cats = about_data.get('skill_categories', {})
+        if isinstance(raw_about_cats, dict):
             try:
-                bio_value = next(iter(raw_bio.values()))
-                if isinstance(bio_value, dict):
-                    bio = bio_value.get('bio', '')
-                elif isinstance(bio_value, str):
-                    bio = bio_value
+                cat_val = next(iter(raw_about_cats.values()))
+                if isinstance(cat_val, dict) and 'categories' in cat_val:
+                    fetched_cats = cat_val.get('categories')
+                    if fetched_cats is not None:
+                        skill_categories = fetched_cats
             except (StopIteration, AttributeError):
-                bio = ''
-
-        # Extract about section data
-        about_bio = ''
-        about_heading = ''
-        if isinstance(about_data, dict):
-            raw_about_bio = about_data.get('bio', {})
-            if isinstance(raw_about_bio, dict) and raw_about_bio:
-                try:
-                    bio_val = next(iter(raw_about_bio.values()))
-                    if isinstance(bio_val, dict):
-                        about_bio = bio_val.get('bio', '')
-                    elif isinstance(bio_val, str):
-                        about_bio = bio_val
-                except (StopIteration, AttributeError):
-                    pass
-            
-            raw_about_heading = about_data.get('heading', {})
-            if isinstance(raw_about_heading, dict) and raw_about_heading:
-                try:
-                    heading_val = next(iter(raw_about_heading.values()))
-                    if isinstance(heading_val, dict):
-                        about_heading = heading_val.get('heading', '')
-                    elif isinstance(heading_val, str):
-                        about_heading = heading_val
-                except (StopIteration, AttributeError):
-                    pass
-
-        # Extract about skills
-        about_skills = []
-        if isinstance(about_data, dict):
-            raw_about_skills = about_data.get('skills', {})
-            if isinstance(raw_about_skills, dict):
-                for block in raw_about_skills.values():
-                    if isinstance(block, dict) and 'skills' in block:
-                        if isinstance(block.get('skills'), list):
-                            about_skills.extend(block.get('skills', []))
-
-        # Get skill categories
-        skill_categories = ['Cloud & DevOps', 'Web Development']
-        if isinstance(about_data, dict):
-            raw_about_cats = about_data.get('skill_categories', {})
-            if isinstance(raw_about_cats, dict):
-                try:
-                    cat_val = next(iter(raw_about_cats.values()))
-                    if isinstance(cat_val, dict) and 'categories' in cat_val:
-                        fetched_cats = cat_val.get('categories')
-                        if fetched_cats is not None:
-                            skill_categories = fetched_cats
-                except (StopIteration, AttributeError):
-                    pass
-
-        # Get Professional Summary
-        professional_summary = ''
-        try:
-            raw_summary = fb.get('/resume/professional_summary', None) or {}
-            if raw_summary:
-                summary_data = next(iter(raw_summary.values()))
-                if isinstance(summary_data, dict):
-                    professional_summary = summary_data.get('summary', '')
-        except Exception as e:
-            print(f"Error getting professional summary: {e}")
-            professional_summary = 'AWS Solutions Architect (Associate Certified) with strong expertise in designing and deploying scalable, secure, and fault-tolerant cloud architectures. Experienced in building 3-tier AWS applications, automation, and full-stack web solutions with measurable business impact. Adept at bridging technical design with client requirements to deliver cost-optimized, resilient systems.'
-        
-        # Get Technical Skills
-        technical_skills = []
-        try:
-            raw_tech_skills = fb.get('/resume/technical_skills', None) or {}
-            if raw_tech_skills:
-                for block in raw_tech_skills.values():
-                    if isinstance(block, dict) and 'skills' in block:
-                        if isinstance(block.get('skills'), list):
-                            technical_skills.extend(block.get('skills', []))
-        except Exception as e:
-            print(f"Error getting technical skills: {e}")
-            # Default technical skills if none found
-            technical_skills = [
-                {'name': 'Cloud & DevOps', 'percentage': 95},
-                {'name': 'Programming & Scripting', 'percentage': 85},
-                {'name': 'Databases', 'percentage': 90},
-                {'name': 'Web Development', 'percentage': 80}
-            ]
-
-        # Get Certifications
-        certifications_data = fb.get('/certifications', None) or {}
-        certifications = certifications_data if isinstance(certifications_data, dict) else {}
-        
-        # Get Projects
-        projects_data = fb.get('/projects', None) or {}
-        projects = projects_data if isinstance(projects_data, dict) else {}
+                pass
+
+    # Get Professional Summary
+    professional_summary = ''
+    try:
+        raw_summary = snap.get('/resume/professional_summary', None) or {}
+        if raw_summary:
+            summary_data = next(iter(raw_summary.values()))
+            if isinstance(summary_data, dict):
+                professional_summary = summary_data.get('summary', '')
+    except Exception as e:
+        print(f"Error getting professional summary: {e}")
+        professional_summary = 'AWS Solutions Architect (Associate Certified) with strong expertise in designing and deploying scalable, secure, and fault-tolerant cloud architectures. Experienced in building 3-tier AWS applications, automation, and full-stack web solutions with measurable business impact. Adept at bridging technical design with client requirements to deliver cost-optimized, resilient systems.'
+    
+    # Get Technical Skills
+    technical_skills = []
+    try:
+        raw_tech_skills = snap.get('/resume/technical_skills', None) or {}
+        if raw_tech_skills:
+            for block in raw_tech_skills.values():
+                if isinstance(block, dict) and 'skills' in block:
+                    if isinstance(block.get('skills'), list):
+                        technical_skills.extend(block.get('skills', []))
+    except Exception as e:
+        print(f"Error getting technical skills: {e}")
+        # Default technical skills if none found
+        technical_skills = [
+            {'name': 'Cloud & DevOps', 'percentage': 95},
+            {'name': 'Programming & Scripting', 'percentage': 85},
+            {'name': 'Databases', 'percentage': 90},
+            {'name': 'Web Development', 'percentage': 80}
+        ]
+
+    # Get Certifications
+    certifications_data = snap.get('/certifications', None) or {}
+    certifications = certifications_data if isinstance(certifications_data, dict) else {}
+    
+    # Get Projects
+    projects_data = snap.get('/projects', None) or {}
+    projects = projects_data if isinstance(projects_data, dict) else {}
 
 
-        # Get Profile Details for About section
-        raw_profile = fb.get('/about/profile', None) or {}
-        profile_details = next(iter(raw_profile.values())) if raw_profile else {}
+    # Get Profile Details for About section
+    raw_profile = snap.get('/about/profile', None) or {}
+    profile_details = next(iter(raw_profile.values())) if raw_profile else {}
+    
+    # Merge profile details, providing defaults if not set
+    profile = {
+        'name': profile_details.get('name', 'JOHN SATHVIK') if profile_details.get('name') else 'JOHN SATHVIK',
+        'title': profile_details.get('title', 'AWS Solutions Architect') if profile_details.get('title') else 'AWS Solutions Architect',
+        'location': profile_details.get('location', 'St. Louis, Missouri, United States') if profile_details.get('location') else 'St. Louis, Missouri, United States',
+        'specialization': profile_details.get('specialization', 'Cloud Architecture & Web Development') if profile_details.get('specialization') else 'Cloud Architecture & Web Development',
+        'experience_level': profile_details.get('experience_level', 'Mid-level Professional') if profile_details.get('experience_level') else 'Mid-level Professional',
+        'education': profile_details.get('education', 'Computer Science, MS') if profile_details.get('education') else 'Computer Science, MS',
+        'languages': profile_details.get('languages', 'English, Telugu, Hindi') if profile_details.get('languages') else 'English, Telugu, Hindi'
+    }
+    # Process experience descriptions to split bullet points
+    def process_description(desc):
+        """Convert description string with bullet points into a list of items"""
+        if not desc:
+            return []
         
-        # Merge profile details, providing defaults if not set
-        profile = {
-            'name': profile_details.get('name', 'JOHN SATHVIK') if profile_details.get('name') else 'JOHN SATHVIK',
-            'title': profile_details.get('title', 'AWS Solutions Architect') if profile_details.get('title') else 'AWS Solutions Architect',
-            'location': profile_details.get('location', 'St. Louis, Missouri, United States') if profile_details.get('location') else 'St. Louis, Missouri, United States',
-            'specialization': profile_details.get('specialization', 'Cloud Architecture & Web Development') if profile_details.get('specialization') else 'Cloud Architecture & Web Development',
-            'experience_level': profile_details.get('experience_level', 'Mid-level Professional') if profile_details.get('experience_level') else 'Mid-level Professional',
-            'education': profile_details.get('education', 'Computer Science, MS') if profile_details.get('education') else 'Computer Science, MS',
-            'languages': profile_details.get('languages', 'English, Telugu, Hindi') if profile_details.get('languages') else 'English, Telugu, Hindi'
-        }
-        # Process experience descriptions to split bullet points
-        def process_description(desc):
-            """Convert description string with bullet points into a list of items"""
-            if not desc:
-                return []
-            
-            # If already a list, return as-is
-            if isinstance(desc, list):
-                return desc
+        # If already a list, return as-is
+        if isinstance(desc, list):
+            return desc
+        
+        # If it's a string, split by newlines and bullet characters
+        if isinstance(desc, str):
+            # Split by newlines first
+            lines = desc.split('\n')
+            bullets = []
             
-            # If it's a string, split by newlines and bullet characters
-            if isinstance(desc, str):
-                # Split by newlines first
-                lines = desc.split('\n')
-                bullets = []
+            for line in lines:
+                # Strip whitespace
+                line = line.strip()
                 
-                for line in lines:
-                    # Strip whitespace
-                    line = line.strip()
-                    
-                    # Skip empty lines
-                    if not line:
-                        continue
-                    
-                    # Remove common bullet characters from the start
-                    for bullet_char in ['• ', '- ', '* ', '· ', '→ ', '> ']:
-                        if line.startswith(bullet_char):
-                            line = line[len(bullet_char):].strip()
-                            break
-                    
-                    # Add non-empty lines to bullets list
-                    if line:
-                        bullets.append(line)
+                # Skip empty lines
+                if not line:
+                    continue
                 
-                return bullets if bullets else [desc]
+                # Remove common bullet characters from the start
+                for bullet_char in ['• ', '- ', '* ', '· ', '→ ', '> ']:
+                    if line.startswith(bullet_char):
+                        line = line[len(bullet_char):].strip()
+                        break
+                
+                # Add non-empty lines to bullets list
+                if line:
+                    bullets.append(line)
             
-            return [str(desc)]
+            return bullets if bullets else [desc]
         
-        # Apply processing to all experience descriptions
-        if isinstance(experience_data, dict):
-            for exp_key, exp in experience_data.items():
-                if isinstance(exp, dict) and 'description' in exp:
-                    exp['description'] = process_description(exp['description'])
-
-        # Prepare data dictionary for template
-        data = {
-            'profile': profile,
-            'name': profile['name'],  # Use dynamic name
-            'specialization': profile['specialization'], # Use dynamic specialization
-
-            'bio': bio,
-            'about_bio': about_bio,
-            'about_heading': about_heading,
-            'skills': skills,
-            'typed_items': typed_items,  # For the typed.js animation
-            'about_skills': about_skills,
-            'skill_categories': skill_categories,
-            'experiences': experience_data if isinstance(experience_data, dict) else {},
-            'education': education_data if isinstance(education_data, dict) else {},
-            'professional_summary': professional_summary,
-            'technical_skills': technical_skills,
-            'certifications': certifications,
-            'projects': projects,
-            'email': email,
-            'phone': phone,
-            'linkedin': linkedin,
-            'telegram': telegram,
-            'whatsapp': whatsapp,
-            'github': github
+        return [str(desc)]
+    
+    # Apply processing to all experience descriptions
+    # (copy each entry: experience_data is shared with the Firebase read cache)
+    if isinstance(experience_data, dict):
+        experience_data = {
+            exp_key: dict(exp, description=process_description(exp['description']))
+            if isinstance(exp, dict) and 'description' in exp else exp
+            for exp_key, exp in experience_data.items()
         }
 
-        # Debug: Print what we're sending to template
-        print(f"DEBUG: about_skills count: {len(about_skills)}")
-        print(f"DEBUG: about_skills: {about_skills}")
-        print(f"DEBUG: about_skills type: {type(about_skills)}")
-        print(f"DEBUG: about_skills is truthy: {bool(about_skills)}")
+    # Prepare data dictionary for template
+    data = {
+        'profile': profile,
+        'name': profile['name'],  # Use dynamic name
+        'specialization': profile['specialization'], # Use dynamic specialization
+
+        'bio': bio,
+        'about_bio': about_bio,
+        'about_heading': about_heading,
+        'skills': skills,
+        'typed_items': typed_items,  # For the typed.js animation
+        'about_skills': about_skills,
+        'skill_categories': skill_categories,
+        'experiences': experience_data if isinstance(experience_data, dict) else {},
+        'education': education_data if isinstance(education_data, dict) else {},
+        'professional_summary': professional_summary,
+        'technical_skills': technical_skills,
+        'certifications': certifications,
+        'projects': projects,
+        'email': email,
+        'phone': phone,
+        'linkedin': linkedin,
+        'telegram': telegram,
+        'whatsapp': whatsapp,
+        'github': github
+    }
+
+    # Debug: Print what we're sending to template
+    print(f"DEBUG: about_skills count: {len(about_skills)}")
+    print(f"DEBUG: about_skills: {about_skills}")
+    print(f"DEBUG: about_skills type: {type(about_skills)}")
+    print(f"DEBUG: about_skills is truthy: {bool(about_skills)}")
+
+    return data
 
-        return render_template('index.html', data=data)
+
+@app.route('/')
+def home():
+    try:
+        # Fetch all data from Firebase in one round trip (same structure as admin uses)
+        snap = fb.snapshot(HOME_PATHS)
+        if app.debug:
+            # Dev: always re-render so template edits show up immediately
+            return render_template('index.html', data=build_home_data(snap))
+
+        # Only render when the snapshot content changed; otherwise reuse the stored bytes
+        page = home_pages.page(snap.tree, lambda: render_template('index.html', data=build_home_data(snap)))
+        return home_pages.respond(page, request)
     
     except Exception as e:
         # Log error and return template with fallback data
@@ -414,11 +578,10 @@ def contact():
 @app.route('/download_resume')
 def download_resume():
     # Get resume info from Firebase
-    raw_resume = fb.get('/about/resume', None) or {}
+    _, resume_data = fb.first_child('/about/resume')
     resume_filename = 'Resume.pdf'  # Default to PDF
     
-    if raw_resume:
-        resume_data = next(iter(raw_resume.values()))
+    if isinstance(resume_data, dict):
         resume_filename = resume_data.get('filename', 'Resume.pdf')
     
     resume_path = os.path.join(app.root_path, 'static', 'resume', resume_filename)
@@ -432,16 +595,19 @@ def download_resume():
 # --- Social Links ---
 @app.route('/github')
 def github():
-    links = fb.get('/links/-OOvwHeVJtSsrjh3QnWR/links', None) or {}
-    github_url = links.get('github', 'https://github.com') if isinstance(links, dict) else 'https://github.com'
+    # Just the one value, not the whole links record
+    github_url = fb.get('/links/-OOvwHeVJtSsrjh3QnWR/links/github', None)
+    if not isinstance(github_url, str) or not github_url:
+        github_url = 'https://github.com'
     if not github_url.startswith('http'):
         github_url = f'https://{github_url}'
     return redirect(github_url)
 
 @app.route('/linkedin')
 def linkedin():
-    links = fb.get('/links/-OOvwHeVJtSsrjh3QnWR/links', None) or {}
-    linkedin_url = links.get('linkedin', 'https://linkedin.com') if isinstance(links, dict) else 'https://linkedin.com'
+    linkedin_url = fb.get('/links/-OOvwHeVJtSsrjh3QnWR/links/linkedin', None)
+    if not isinstance(linkedin_url, str) or not linkedin_url:
+        linkedin_url = 'https://linkedin.com'
     if not linkedin_url.startswith('http'):
         linkedin_url = f'https://{linkedin_url}'
     return redirect(linkedin_url)
@@ -466,6 +632,34 @@ def chat_query():
         print(f"Error in chat_query: {e}")
         return jsonify({'answer': "Sorry, I'm having trouble connecting to my brain right now."}), 500
 
+def sse_event(data, event=None):
+    """One Server-Sent Events frame; JSON keeps newlines in `data` on one line"""
+    frame = f"event: {event}\n" if event else ""
+    return f"{frame}data: {json.dumps(data)}\n\n"
+
+@app.route('/chat_stream', methods=['POST'])
+def chat_stream():
+    """Same as /chat_query, but relays the answer as it is generated (text/event-stream)"""
+    data = request.get_json(silent=True)
+    question = str((data or {}).get('question', '')).strip()
+    if not question:
+        return jsonify({'answer': "Please ask a valid question."}), 400
+
+    def events():
+        try:
+            for text in stream_portfolio(question):
+                yield sse_event({'text': text})
+            yield sse_event({}, event='done')
+        except Exception as e:
+            print(f"Error in chat_stream: {e}")
+            yield sse_event({'answer': "Sorry, I'm having trouble connecting to my brain right now."}, event='error')
+
+    response = Response(stream_with_context(events()), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    # Stop nginx from buffering the stream until it ends
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
 # --- Run Flask App ---
 if __name__ == '__main__':
     app.run(debug=True)
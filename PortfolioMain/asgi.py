@@ -0,0 +1,134 @@
+"""ASGI entry point for the chat endpoints (/chat_query and /chat_stream).
+
+    uvicorn PortfolioMain.asgi:app --host 127.0.0.1 --port 8001
+
+Same requests and responses as the Flask routes in app.py, but served from
+one event loop (bedrock/aio.py), so a single process holds hundreds of
+open chat requests instead of one per gunicorn worker. Everything else
+stays on the Flask app; nginx sends only the chat paths here:
+
+    location ~ ^/chat_(query|stream)$ {
+        proxy_pass http://127.0.0.1:8001;
+        proxy_buffering off;
+    }
+"""
+import json
+import os
+import sys
+
+# Same path setup as app.py: find config/ and bedrock/ from either directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+if os.path.basename(current_dir) == 'PortfolioMain':
+    sys.path.insert(1, os.path.abspath(os.path.join(current_dir, '..')))
+else:
+    sys.path.insert(1, current_dir)
+
+from bedrock import aio
+
+# Questions are a sentence or two; anything bigger is not a chat request
+MAX_BODY = 16 * 1024
+
+ERROR_ANSWER = "Sorry, I'm having trouble connecting to my brain right now."
+
+
+async def read_json(receive):
+    """Request body parsed as JSON, or None if it is missing, too big or invalid"""
+    body = b''
+    while True:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            return None
+        body += message.get('body', b'')
+        if len(body) > MAX_BODY:
+            return None
+        if not message.get('more_body'):
+            break
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else None
+
+
+async def send_json(send, status, data, headers=()):
+    body = json.dumps(data).encode('utf-8')
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [(b'content-type', b'application/json'),
+                    (b'content-length', str(len(body)).encode())] + list(headers),
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+def sse_event(data, event=None):
+    """One Server-Sent Events frame; JSON keeps newlines in `data` on one line"""
+    frame = f"event: {event}\n" if event else ""
+    return f"{frame}data: {json.dumps(data)}\n\n".encode('utf-8')
+
+
+async def chat_query(receive, send):
+    data = await read_json(receive)
+    if not data or 'question' not in data:
+        return await send_json(send, 400, {'answer': "Please provide a valid question in JSON format."})
+
+    question = str(data.get('question', '')).strip()
+    if not question:
+        return await send_json(send, 400, {'answer': "Please ask a valid question."})
+
+    try:
+        answer = await aio.ask_portfolio(question)
+        await send_json(send, 200, {'answer': answer})
+    except Exception as e:
+        print(f"Error in chat_query: {e}")
+        await send_json(send, 500, {'answer': ERROR_ANSWER})
+
+
+async def chat_stream(receive, send):
+    data = await read_json(receive)
+    question = str((data or {}).get('question', '')).strip()
+    if not question:
+        return await send_json(send, 400, {'answer': "Please ask a valid question."})
+
+    await send({
+        'type': 'http.response.start',
+        'status': 200,
+        'headers': [(b'content-type', b'text/event-stream; charset=utf-8'),
+                    (b'cache-control', b'no-cache'),
+                    # Stop nginx from buffering the stream until it ends
+                    (b'x-accel-buffering', b'no')],
+    })
+    try:
+        async for text in aio.stream_portfolio(question):
+            await send({'type': 'http.response.body', 'body': sse_event({'text': text}), 'more_body': True})
+        tail = sse_event({}, event='done')
+    except Exception as e:
+        print(f"Error in chat_stream: {e}")
+        tail = sse_event({'answer': ERROR_ANSWER}, event='error')
+    await send({'type': 'http.response.body', 'body': tail})
+
+
+ROUTES = {
+    '/chat_query': chat_query,
+    '/chat_stream': chat_stream,
+}
+
+
+async def app(scope, receive, send):
+    if scope['type'] == 'lifespan':
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+    if scope['type'] != 'http':
+        return
+
+    handler = ROUTES.get(scope['path'])
+    if handler is None:
+        return await send_json(send, 404, {'error': 'Not found'})
+    if scope['method'] != 'POST':
+        return await send_json(send, 405, {'error': 'Method not allowed'}, headers=[(b'allow', b'POST')])
+    await handler(receive, send)
@@ -0,0 +1,168 @@
+"""Build the public portfolio as a directory of static files.
+
+    python PortfolioMain/export.py --out build/site
+    python PortfolioMain/export.py --out build/site --from-json snapshot.json
+    python PortfolioMain/export.py --dump-snapshot snapshot.json
+
+The output can be served by nginx with no Python in the request path:
+
+    index.html                 rendered home page (plus .gz/.br variants
+                               of every text file, for gzip_static/brotli_static)
+    static/...                 every static file, under its original and its
+                               content-hashed name (the page references the latter)
+    github/, linkedin/,
+    download_resume/           redirect pages replacing the Flask routes
+
+Only POST /contact, /chat_stream and /chat_query still need to be proxied to
+the app. The chat widget tries /chat_stream first and falls back to /chat_query,
+so the proxy must pass the event stream through unbuffered (the app sends
+X-Accel-Buffering: no for nginx; other proxies need buffering turned off).
+"""
+import argparse
+import html
+import json
+import os
+import shutil
+import sys
+
+# Running as `python PortfolioMain/export.py` puts this folder on sys.path,
+# so the Flask app is importable as `app` (it sets up the rest of sys.path)
+import app as portfolio
+
+from flask import render_template
+
+from frontend import compress
+from rtdb.snapshot import Snapshot
+
+LINKS_PATH = '/links/-OOvwHeVJtSsrjh3QnWR/links'
+
+# Top-level keys of the Firebase tree, used to tell a snapshot dump from the
+# old flat data/portfolio_data.json format
+TREE_KEYS = {'landing', 'about', 'experience', 'resume', 'links', 'certifications', 'projects'}
+
+REDIRECT_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8">
+<meta http-equiv="refresh" content="0; url={url}">
+<link rel="canonical" href="{url}">
+<title>Redirecting</title></head>
+<body><a href="{url}">{url}</a></body></html>
+"""
+
+
+def legacy_to_tree(flat):
+    """Map the flat portfolio_data.json layout onto the Firebase tree"""
+    return {
+        'about': {
+            'profile': {'export': {'name': flat.get('name', ''),
+                                   'specialization': flat.get('specialization', '')}},
+            'bio': {'export': {'bio': flat.get('about', '')}},
+        },
+        'links': {'-OOvwHeVJtSsrjh3QnWR': {'links': {'github': flat.get('github', ''),
+                                                      'linkedin': flat.get('linkedin', '')}}},
+    }
+
+
+def load_tree(json_path=None):
+    """Portfolio tree from a JSON file, or a live snapshot from Firebase"""
+    if json_path:
+        with open(json_path, encoding='utf-8') as f:
+            data = json.load(f)
+        if not any(isinstance(data.get(key), dict) for key in TREE_KEYS):
+            data = legacy_to_tree(data)
+        return data
+    snap = portfolio.fb.snapshot(portfolio.HOME_PATHS)
+    if not snap:
+        raise SystemExit("Could not read the portfolio from Firebase")
+    return snap.tree
+
+
+def public_tree(tree):
+    """Copy of `tree` without the admin credentials stored next to the contact links"""
+    tree = json.loads(json.dumps(tree))
+    links = Snapshot('/', tree).get(LINKS_PATH)
+    if isinstance(links, dict):
+        links.pop('admin_username', None)
+        links.pop('admin_password', None)
+    return tree
+
+
+def copy_static(static_dir, out_dir, manifest):
+    """Copy every static file under its original name and, if versioned, its hashed name"""
+    for root, _dirs, names in os.walk(static_dir):
+        for name in names:
+            src = os.path.join(root, name)
+            rel = os.path.relpath(src, static_dir).replace(os.sep, '/')
+            targets = {rel, manifest.url_path(rel)}
+            for target in targets:
+                dest = os.path.join(out_dir, *target.split('/'))
+                os.makedirs(os.path.dirname(dest), exist_ok=True)
+                shutil.copy2(src, dest)
+
+
+def write_redirect(out_dir, route, url):
+    os.makedirs(os.path.join(out_dir, route), exist_ok=True)
+    with open(os.path.join(out_dir, route, 'index.html'), 'w', encoding='utf-8') as f:
+        f.write(REDIRECT_PAGE.format(url=html.escape(url, quote=True)))
+
+
+def absolute_link(url, default):
+    url = url or default
+    return url if url.startswith('http') else f'https://{url}'
+
+
+def export_site(out_dir, tree):
+    app = portfolio.app
+    # The app fingerprints url_for('static', ...) with this manifest (frontend.assets.install)
+    manifest = app.extensions['asset_manifest']
+    snap = Snapshot('/', tree)
+
+    with app.test_request_context('/'):
+        page = render_template('index.html', data=portfolio.build_home_data(snap))
+    static_url = app.static_url_path
+    raw_resume = snap.get('/about/resume') or {}
+    resume = next(iter(raw_resume.values())) if isinstance(raw_resume, dict) and raw_resume else {}
+    resume_name = resume.get('filename', 'Resume.pdf') if isinstance(resume, dict) else 'Resume.pdf'
+    if not os.path.exists(os.path.join(app.static_folder, 'resume', resume_name)):
+        resume_name = 'Resume.pdf'
+    resume_url = f"{static_url}/{manifest.url_path('resume/' + resume_name)}"
+
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, 'index.html'), 'w', encoding='utf-8') as f:
+        f.write(page)
+    copy_static(app.static_folder, os.path.join(out_dir, static_url.strip('/')), manifest)
+
+    links = snap.get(LINKS_PATH) or {}
+    links = links if isinstance(links, dict) else {}
+    write_redirect(out_dir, 'github', absolute_link(links.get('github'), 'https://github.com'))
+    write_redirect(out_dir, 'linkedin', absolute_link(links.get('linkedin'), 'https://linkedin.com'))
+    write_redirect(out_dir, 'download_resume', resume_url)
+
+    # .gz/.br siblings for nginx's gzip_static / brotli_static
+    compress.precompress_dir(out_dir)
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the portfolio as static files.")
+    parser.add_argument('--out', help="output directory (e.g. build/site)")
+    parser.add_argument('--from-json', metavar='FILE',
+                        help="render from a JSON dump instead of live Firebase data")
+    parser.add_argument('--dump-snapshot', metavar='FILE',
+                        help="save the Firebase data (minus admin credentials) to FILE")
+    args = parser.parse_args(argv)
+    if not args.out and not args.dump_snapshot:
+        parser.error("nothing to do: pass --out and/or --dump-snapshot")
+
+    tree = load_tree(args.from_json)
+    if args.dump_snapshot:
+        with open(args.dump_snapshot, 'w', encoding='utf-8') as f:
+            json.dump(public_tree(tree), f, indent=2, ensure_ascii=False)
+        print(f"Snapshot written to {args.dump_snapshot}")
+    if args.out:
+        manifest = export_site(args.out, tree)
+        print(f"Site exported to {args.out} ({len(manifest.files)} versioned assets)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
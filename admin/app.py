@@ -1,6 +1,7 @@
 from flask import Flask, render_template, request, redirect, url_for, session, flash, send_from_directory
 import requests
 import json
+import hmac
 import os
 import sys
 import uuid
@@ -25,6 +26,15 @@ load_dotenv()
 from config.secrets import load_secrets
 load_secrets()
 
+from rtdb.cache import cache_key
+from rtdb.credentials import CredentialCache
+from rtdb.invalidation import InvalidationJournal
+from rtdb.query import query_string
+from rtdb.session import TIMEOUT, get_session
+from rtdb.snapshot import join_path, split_path
+from frontend import images
+from bedrock.indexer import IndexUpdater
+
 
 from datetime import timedelta
 
@@ -39,8 +49,17 @@ app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0
 
 # Firebase wrapper class to replace python-firebase
 class FirebaseApplication:
-    def __init__(self, url, auth=None):
+    def __init__(self, url, auth=None, cache=None, journal=None, session=None, timeout=TIMEOUT, indexer=None):
         self.url = url.rstrip('/')
+        # Pooled keep-alive session (rtdb.session.get_session() unless one is given)
+        self._session = session
+        self.timeout = timeout
+        # Optional rtdb.cache.ReadCache, invalidated by every write below
+        self.cache = cache
+        # Optional rtdb.invalidation.InvalidationJournal: tells the public app what changed
+        self.journal = journal
+        # Optional bedrock.indexer.IndexUpdater: re-indexes edited records for the chatbot
+        self.indexer = indexer
     
     def _build_path(self, path, key=None):
         """Build the full URL path"""
@@ -51,25 +70,69 @@ class FirebaseApplication:
             url = f"{self.url}/{path}/{key}.json"
         return url
     
-    def get(self, path, key=None):
-        """GET request"""
+    @property
+    def http(self):
+        return self._session or get_session()
+
+    def _path_of(self, url):
+        """Database path a built URL points at ('https://.../a/b.json' -> '/a/b')"""
+        return url[len(self.url):-len('.json')] or '/'
+
+    def _invalidate(self, url, children=None):
+        """Invalidate the path `url` points at, or each of its `children` when given"""
+        base = self._path_of(url)
+        paths = [join_path(split_path(base) + split_path(c)) for c in children] if children else [base]
+        if self.cache is not None:
+            for path in paths:
+                self.cache.invalidate(path)
+        if self.journal is not None:
+            self.journal.publish(*paths)
+        if self.indexer is not None:
+            for path in paths:
+                # _fetch raises on errors, so a failed read is never indexed as a deletion
+                self.indexer.schedule(path, lambda p: self._fetch(self._build_path(p)))
+
+    def get(self, path, key=None, **query):
+        """GET request (`query`: rtdb.query.query_string() arguments, e.g. shallow=True)"""
         url = self._build_path(path, key)
+        query = query_string(**query)
+        fetch_url = f"{url}?{query}" if query else url
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            return response.json() if response.text else None
+            if self.cache is None:
+                return self._fetch(fetch_url)
+            return self.cache.get_or_load(cache_key(self._path_of(url), query), lambda: self._fetch(fetch_url))
         except requests.exceptions.RequestException:
             return None
+
+    def first_key(self, path):
+        """Key of the first child of `path`, fetched without any of the children's data"""
+        keys = self.get(path, shallow=True)
+        return min(keys) if isinstance(keys, dict) and keys else None
+
+    def first_child(self, path):
+        """(key, value) of the first child of `path` by key, or (None, None); downloads only that child"""
+        data = self.get(path, order_by='$key', limit_to_first=1)
+        if not isinstance(data, dict) or not data:
+            return None, None
+        key = min(data)
+        return key, data[key]
+
+    def _fetch(self, url):
+        response = self.http.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json() if response.text else None
     
     def post(self, path, data):
         """POST request (creates new entry)"""
         url = self._build_path(path)
         try:
-            response = requests.post(url, json=data)
+            response = self.http.post(url, timeout=self.timeout, json=data)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException:
             return None
+        finally:
+            self._invalidate(url)
     
     def put(self, path, key=None, data=None):
         """PUT request (updates/replaces)
@@ -99,23 +162,181 @@ class FirebaseApplication:
             put_data = key if key is not None else data
         
         try:
-            response = requests.put(url, json=put_data)
+            response = self.http.put(url, timeout=self.timeout, json=put_data)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException:
             return None
+        finally:
+            self._invalidate(url)
     
+    def patch(self, path, updates):
+        """PATCH request (multi-location update, applied atomically)
+
+        `updates` maps paths relative to `path` to their new values, e.g.
+        fb.patch('/links/<id>/links', {'github': url, 'linkedin': url}).
+        A value of None deletes that child. One round trip for all of them.
+        """
+        url = self._build_path(path)
+        try:
+            response = self.http.patch(url, timeout=self.timeout, json=updates)
+            response.raise_for_status()
+            return response.json()
+        except requests.exceptions.RequestException:
+            return None
+        finally:
+            self._invalidate(url, children=list(updates))
+
+    def transaction(self, path, fn, max_retries=5):
+        """Conditional read-modify-write of `path` (ETag / if-match)
+
+        fn(current value) returns the new value, or None to write nothing. The
+        PUT only succeeds if `path` is unchanged since it was read; otherwise
+        Firebase answers 412 with the current value and ETag, and fn is run
+        again on that, up to `max_retries` times. fn must not rely on state from
+        an earlier call. Returns (committed, value): the written value, or the
+        last value read (None if even the read failed). committed is None
+        instead of False when a request failed rather than the write losing
+        to another one.
+
+        The PUTs go through a session that doesn't resend writes: a retried
+        if-match PUT whose first attempt landed would come back 412 and apply
+        fn a second time. A PUT that fails outright may still have landed.
+        """
+        url = self._build_path(path)
+        http = self._session or get_session(conditional=True)
+        committed = False
+        current = None
+        try:
+            response = http.get(url, timeout=self.timeout, headers={'X-Firebase-ETag': 'true'})
+            response.raise_for_status()
+            for attempt in range(max_retries + 1):
+                etag = response.headers.get('ETag')
+                current = response.json() if response.text else None
+                value = fn(current)
+                if value is None:
+                    return False, current
+                response = http.put(url, timeout=self.timeout, json=value,
+                                    headers={'if-match': etag})
+                if response.status_code != 412:
+                    response.raise_for_status()
+                    committed = True
+                    return True, response.json()
+            return False, response.json() if response.text else None
+        except requests.exceptions.RequestException:
+            return None, current
+        finally:
+            if committed:
+                self._invalidate(url)
+
+    def batch(self, path='/'):
+        """Collect writes under `path` and send them as one patch() when the block exits"""
+        return Batch(self, path)
+
     def delete(self, path, key=None):
         """DELETE request"""
         url = self._build_path(path, key)
         try:
-            response = requests.delete(url)
+            response = self.http.delete(url, timeout=self.timeout)
             response.raise_for_status()
             return True
         except requests.exceptions.RequestException:
             return False
+        finally:
+            self._invalidate(url)
+
+class Batch:
+    """
+    with fb.batch('/about') as batch:
+        batch.set('/about/skill_categories/<key>/categories', cats)
+        batch.set('/about/skills/<key>/skills', skills)
+
+    Nothing is sent if the block raises; `result` holds the patch() response.
+    """
+    def __init__(self, fb, path='/'):
+        self.fb = fb
+        self.path = path
+        self.updates = {}
+        self.result = None
+
+    def set(self, path, value):
+        parts, base = split_path(path), split_path(self.path)
+        if parts[:len(base)] != base or len(parts) == len(base):
+            raise ValueError(f"{path} is not below the batch path {self.path}")
+        self.updates['/'.join(parts[len(base):])] = value
+
+    def delete(self, path):
+        self.set(path, None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None and self.updates:
+            self.result = self.fb.patch(self.path, self.updates)
+        return False
+
+# No read cache here: the admin handlers read-modify-write, so they always need
+# what is in the database right now (pass cache=ReadCache(...) to opt in)
+# Edits are also pushed into the chatbot's local vector index, if one was built
+# (python -m bedrock.indexer); CHAT_INDEX_AUTOUPDATE=0 turns that off
+fb = FirebaseApplication('https://portfolio-536e2-default-rtdb.firebaseio.com/', None,
+                         journal=InvalidationJournal(),
+                         indexer=IndexUpdater() if os.getenv('CHAT_INDEX_AUTOUPDATE', '1') != '0' else None)
+
+ADMIN_LINKS_PATH = '/links/-OOvwHeVJtSsrjh3QnWR/links'
+
+# Fingerprint of the stored admin credentials, checked on every admin request without
+# a Firebase read; dropped on credential writes from any admin worker (via the journal)
+credentials = CredentialCache(ADMIN_LINKS_PATH, fb.get, app.secret_key,
+                              ttl=int(os.getenv('ADMIN_CREDENTIALS_TTL', '30')),
+                              journal=InvalidationJournal())
+
+def update_list(path, field, change, max_retries=5):
+    """
+    Edit the list `field` of the first record under `path` (how the admin
+    stores its single-record lists, e.g. /landing/skills-list/<key>/skills)
+    with fb.transaction(). change(items) edits the list in place and returns
+    False to leave it as is. Returns fb.transaction()'s (committed, records);
+    committed is None if the database couldn't be reached.
+    """
+    def apply(raw):
+        if not raw:
+            return None
+        key = next(iter(raw))
+        items = raw[key].get(field) or []
+        if change(items) is False:
+            return None
+        raw[key][field] = items
+        return raw
+    return fb.transaction(path, apply, max_retries)
+
+
+def at_index(idx, edit=None):
+    """
+    change() for update_list() replacing item `idx` with edit(item), or
+    removing it if `edit` is None; nothing is written if `idx` doesn't exist.
+    Pass max_retries=0 with it: after a conflicting write the index the admin
+    picked may point at a different item, so don't retry, ask them to reload.
+    """
+    def change(items):
+        if not 0 <= idx < len(items):
+            return False
+        if edit is None:
+            items.pop(idx)
+        else:
+            items[idx] = edit(items[idx])
+    return change
+
+
+CONFLICT_MESSAGE = "This list was changed by someone else in the meantime. Please reload and try again."
+SAVE_ERROR_MESSAGE = "Could not reach the database; the change may not have been saved. Please reload and check."
+
+
+def not_saved_message(committed):
+    """Flash message for an update_list() that didn't commit"""
+    return SAVE_ERROR_MESSAGE if committed is None else CONFLICT_MESSAGE
 
-fb = FirebaseApplication('https://portfolio-536e2-default-rtdb.firebaseio.com/', None)
 
 def login_required(f):
     @wraps(f)
@@ -131,20 +352,21 @@ def login_required(f):
         if session.get('is_guest'):
             return f(*args, **kwargs)
 
-        current_db_links = fb.get('/links/-OOvwHeVJtSsrjh3QnWR/links', None)
-        if not current_db_links:
+        db_fingerprint = credentials.current()
+        if not db_fingerprint:
              # Safety fallback: if DB unreadable, force re-login
              session.clear()
              flash("Session expired or database error. Please login again.")
              return redirect(url_for('admin_login'))
 
-        db_username = current_db_links.get('admin_username')
-        db_password = current_db_links.get('admin_password')
-        
-        session_username = session.get('admin_username')
-        session_password = session.get('admin_password')
+        session_fingerprint = session.get('admin_credentials')
+        if session_fingerprint is None and 'admin_password' in session:
+            # Sessions from before fingerprints carry the password itself: convert them
+            session_fingerprint = credentials.fingerprint(session.get('admin_username'),
+                                                          session.pop('admin_password'))
+            session['admin_credentials'] = session_fingerprint
 
-        if session_username != db_username or session_password != db_password:
+        if not hmac.compare_digest(session_fingerprint or '', db_fingerprint):
             session.clear()
             flash("Credentials changed. Please login again.")
             return redirect(url_for('admin_login'))
@@ -212,9 +434,9 @@ def admin_login():
                 session.permanent = True
                 session['admin_logged_in'] = True
                 session['is_guest'] = False  # Explicitly clear guest mode flag
-                # Store credentials in session for strict validation
+                # Store a credential fingerprint (not the password) for strict validation
                 session['admin_username'] = stored_username
-                session['admin_password'] = stored_password
+                session['admin_credentials'] = credentials.fingerprint(stored_username, stored_password)
                 # Debug logging
                 print(f"DEBUG - Admin login successful for user: {stored_username}")
                 print(f"DEBUG - Session contents: {dict(session)}")
@@ -254,9 +476,8 @@ def admin_intro():
                 
                 new_order = data['reorder_skills']
                 if isinstance(new_order, list) and new_order:
-                    raw = fb.get('/landing/skills-list', None) or {}
-                    if raw:
-                        key = next(iter(raw))
+                    key = fb.first_key('/landing/skills-list')
+                    if key:
                         fb.put(f'/landing/skills-list/{key}', 'skills', new_order)
                         return {'status': 'success'}, 200
                     else:
@@ -266,42 +487,35 @@ def admin_intro():
         if 'new_skill' in form:
             new_skill = form['new_skill'].strip()
             if new_skill:
-                raw = fb.get('/landing/skills-list', None) or {}
-                if raw:
-                    key = next(iter(raw))
-                    skills = raw[key].get('skills', [])
-                    skills.append(new_skill)
-                    fb.put(f'/landing/skills-list/{key}', 'skills', skills)
-                else:
+                committed, raw = update_list('/landing/skills-list', 'skills',
+                                             lambda skills: skills.append(new_skill))
+                if committed is not None and not raw:
                     fb.post('/landing/skills-list', {'skills': [new_skill]})
-                flash('Skill added successfully!', 'success')
+                if committed or (committed is not None and not raw):
+                    flash('Skill added successfully!', 'success')
+                else:
+                    flash(not_saved_message(committed), 'warning')
         elif 'edited_skill' in form:
             idx = int(form['edit_index'])
             edited = form['edited_skill'].strip()
-            raw = fb.get('/landing/skills-list', None) or {}
-            if raw:
-                key = next(iter(raw))
-                skills = raw[key].get('skills', [])
-                if 0 <= idx < len(skills):
-                    skills[idx] = edited
-                    fb.put(f'/landing/skills-list/{key}', 'skills', skills)
-                    flash('Skill updated successfully!', 'success')
+            committed, raw = update_list('/landing/skills-list', 'skills', at_index(idx, lambda skill: edited),
+                                         max_retries=0)
+            if committed:
+                flash('Skill updated successfully!', 'success')
+            elif raw or committed is None:
+                flash(not_saved_message(committed), 'warning')
         elif 'delete_index' in form:
             idx = int(form['delete_index'])
-            raw = fb.get('/landing/skills-list', None) or {}
-            if raw:
-                key = next(iter(raw))
-                skills = raw[key].get('skills', [])
-                if 0 <= idx < len(skills):
-                    skills.pop(idx)
-                    fb.put(f'/landing/skills-list/{key}', 'skills', skills)
-                    flash('Skill deleted successfully!', 'success')
+            committed, raw = update_list('/landing/skills-list', 'skills', at_index(idx), max_retries=0)
+            if committed:
+                flash('Skill deleted successfully!', 'success')
+            elif raw or committed is None:
+                flash(not_saved_message(committed), 'warning')
         elif 'edited_bio' in form:
             new_bio = form['edited_bio'].strip()
             if new_bio:
-                raw_bio = fb.get('/landing/bio', None) or {}
-                if raw_bio:
-                    bio_key = next(iter(raw_bio))
+                bio_key = fb.first_key('/landing/bio')
+                if bio_key:
                     fb.put(f'/landing/bio/{bio_key}', 'bio', new_bio)
                 else:
                     fb.post('/landing/bio', {'bio': new_bio})
@@ -313,8 +527,8 @@ def admin_intro():
     for block in raw.values():
         skills.extend(block.get('skills', []))
 
-    raw_bio = fb.get('/landing/bio', None) or {}
-    bio = next(iter(raw_bio.values())).get('bio', '') if raw_bio else ''
+    _, bio_data = fb.first_child('/landing/bio')
+    bio = bio_data.get('bio', '') if bio_data else ''
 
     # Get profile image path
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -371,11 +585,12 @@ def admin_about():
             file.save(resume_path)
             
             # Store resume info in Firebase
-            raw_resume = fb.get('/about/resume', None) or {}
-            if raw_resume:
-                key = next(iter(raw_resume))
-                fb.put(f'/about/resume/{key}', 'filename', resume_filename)
-                fb.put(f'/about/resume/{key}', 'file_type', file_ext[1:].upper())
+            key = fb.first_key('/about/resume')
+            if key:
+                fb.patch(f'/about/resume/{key}', {
+                    'filename': resume_filename,
+                    'file_type': file_ext[1:].upper()
+                })
             else:
                 fb.post('/about/resume', {
                     'filename': resume_filename,
@@ -402,9 +617,8 @@ def admin_about():
                 'education': request.form.get('profile_education', '').strip(),
                 'languages': request.form.get('profile_languages', '').strip()
             }
-            raw_profile = fb.get('/about/profile', None) or {}
-            if raw_profile:
-                key = next(iter(raw_profile))
+            key = fb.first_key('/about/profile')
+            if key:
                 fb.put('/about', f'profile/{key}', profile_data)
             else:
                 fb.post('/about/profile', profile_data)
@@ -413,9 +627,8 @@ def admin_about():
             
         if 'edited_bio_heading' in request.form:
             new_heading = request.form['edited_bio_heading'].strip()
-            raw_head = fb.get('/about/heading', None) or {}
-            if raw_head:
-                key = next(iter(raw_head))
+            key = fb.first_key('/about/heading')
+            if key:
                 fb.put(f'/about/heading/{key}', 'heading', new_heading)
             else:
                 fb.post('/about/heading', {'heading': new_heading})
@@ -423,9 +636,8 @@ def admin_about():
 
         elif 'edited_bio' in request.form:
             new_bio = request.form['edited_bio'].strip()
-            raw = fb.get('/about/bio', None) or {}
-            if raw:
-                key = next(iter(raw))
+            key = fb.first_key('/about/bio')
+            if key:
                 fb.put(f'/about/bio/{key}', 'bio', new_bio)
             else:
                 fb.post('/about/bio', {'bio': new_bio})
@@ -434,26 +646,25 @@ def admin_about():
 
         return redirect(url_for('admin_about'))
 
-    raw_bio = fb.get('/about/bio', None) or {}
-    bio = next(iter(raw_bio.values())).get('bio', '') if raw_bio else ''
+    _, bio_data = fb.first_child('/about/bio')
+    bio = bio_data.get('bio', '') if bio_data else ''
 
-    raw_head = fb.get('/about/heading', None) or {}
-    heading = next(iter(raw_head.values())).get('heading', '') if raw_head else ''
+    _, head_data = fb.first_child('/about/heading')
+    heading = head_data.get('heading', '') if head_data else ''
 
 
     # Get resume info
-    raw_resume = fb.get('/about/resume', None) or {}
+    _, resume_data = fb.first_child('/about/resume')
     current_resume = None
     resume_type = None
-    if raw_resume:
-        resume_data = next(iter(raw_resume.values()))
+    if resume_data:
         current_resume = resume_data.get('filename', '')
         resume_type = resume_data.get('file_type', '')
 
 
     # Get profile details
-    raw_profile = fb.get('/about/profile', None) or {}
-    profile = next(iter(raw_profile.values())) if raw_profile else {}
+    _, profile = fb.first_child('/about/profile')
+    profile = profile or {}
     return render_template('admin-about.html', bio=bio, heading=heading, current_resume=current_resume, resume_type=resume_type, profile=profile)
 
 
@@ -476,18 +687,13 @@ def admin_skills():
         pct = int(request.form['new_percentage'])
         category = request.form.get('new_category', 'Cloud & DevOps').strip()
         if title and desc and 0 <= pct <= 100:
-            raw = fb.get('/about/skills', None) or {}
-            if raw:
-                key = next(iter(raw))
-                skills = raw[key].get('skills', [])
-                skills.append({
-                    'Skill': title,
-                    'Description': desc,
-                    'percentage': pct,
-                    'category': category
-                })
-                fb.put(f'/about/skills/{key}', 'skills', skills)
-            else:
+            committed, raw = update_list('/about/skills', 'skills', lambda skills: skills.append({
+                'Skill': title,
+                'Description': desc,
+                'percentage': pct,
+                'category': category
+            }))
+            if committed is not None and not raw:
                 fb.post('/about/skills', {
                     'skills': [{
                         'Skill': title,
@@ -496,7 +702,10 @@ def admin_skills():
                         'category': category
                     }]
                 })
-            flash('Skill added successfully!', 'success')
+            if committed or (committed is not None and not raw):
+                flash('Skill added successfully!', 'success')
+            else:
+                flash(not_saved_message(committed), 'warning')
 
     elif request.method == 'POST':
         # GUEST GUARD
@@ -506,14 +715,11 @@ def admin_skills():
 
         if 'delete_index' in request.form:
             idx = int(request.form['delete_index'])
-            raw = fb.get('/about/skills', None) or {}
-            if raw:
-                key = next(iter(raw))
-                skills = raw[key].get('skills', [])
-                if 0 <= idx < len(skills):
-                    skills.pop(idx)
-                    fb.put(f'/about/skills/{key}', 'skills', skills)
-                    flash('Skill deleted successfully!', 'success')
+            committed, raw = update_list('/about/skills', 'skills', at_index(idx), max_retries=0)
+            if committed:
+                flash('Skill deleted successfully!', 'success')
+            elif raw or committed is None:
+                flash(not_saved_message(committed), 'warning')
 
         elif 'edited_skill' in request.form and 'edited_description' in request.form and 'edited_percentage' in request.form:
             idx   = int(request.form['edit_index'])
@@ -521,33 +727,30 @@ def admin_skills():
             desc  = request.form['edited_description'].strip()
             pct   = int(request.form['edited_percentage'])
             category = request.form.get('edited_category', 'Cloud & DevOps').strip()
-            raw   = fb.get('/about/skills', None) or {}
-            if raw:
-                key    = next(iter(raw))
-                skills = raw[key].get('skills', [])
-                if 0 <= idx < len(skills):
-                    skills[idx]['Skill']       = title
-                    skills[idx]['Description'] = desc
-                    skills[idx]['percentage']  = pct
-                    skills[idx]['category']    = category
-                    fb.put(f'/about/skills/{key}', 'skills', skills)
-                    flash('Skill updated successfully!', 'success')
+            edit = lambda skill: dict(skill, Skill=title, Description=desc, percentage=pct, category=category)
+            committed, raw = update_list('/about/skills', 'skills', at_index(idx, edit), max_retries=0)
+            if committed:
+                flash('Skill updated successfully!', 'success')
+            elif raw or committed is None:
+                flash(not_saved_message(committed), 'warning')
 
         elif 'new_category_name' in request.form:
             cat_name = request.form['new_category_name'].strip()
             if cat_name:
-                raw_cats = fb.get('/about/skill_categories', None) or {}
-                if raw_cats:
-                    key = next(iter(raw_cats))
-                    cats = raw_cats[key].get('categories', [])
-                    if cats is None:
-                        cats = []
-                    if cat_name not in cats:
-                        cats.append(cat_name)
-                        fb.put(f'/about/skill_categories/{key}', 'categories', cats)
+                def add_category(cats):
+                    if cat_name in cats:
+                        return False
+                    cats.append(cat_name)
+                committed, raw_cats = update_list('/about/skill_categories', 'categories', add_category)
+                if committed is None:
+                    flash(SAVE_ERROR_MESSAGE, 'warning')
+                elif raw_cats:
+                    if committed:
                         flash('Category added successfully!', 'success')
-                    else:
+                    elif cat_name in (raw_cats[next(iter(raw_cats))].get('categories') or []):
                         flash('Category already exists!', 'warning')
+                    else:
+                        flash(CONFLICT_MESSAGE, 'warning')
                 else:
                     fb.post('/about/skill_categories', {
                         'categories': ['Cloud & DevOps', 'Web Development', cat_name]
@@ -557,16 +760,20 @@ def admin_skills():
         elif 'delete_category_name' in request.form:
             cat_name = request.form['delete_category_name'].strip()
             if cat_name:
-                raw_cats = fb.get('/about/skill_categories', None) or {}
-                if raw_cats:
-                    key = next(iter(raw_cats))
-                    cats = raw_cats[key].get('categories', [])
-                    if cats is None:
-                        cats = []
-                    if cat_name in cats:
-                        cats.remove(cat_name)
-                        fb.put(f'/about/skill_categories/{key}', 'categories', cats)
+                def remove_category(cats):
+                    if cat_name not in cats:
+                        return False
+                    cats.remove(cat_name)
+                committed, raw_cats = update_list('/about/skill_categories', 'categories', remove_category)
+                if committed is None:
+                    flash(SAVE_ERROR_MESSAGE, 'warning')
+                elif raw_cats:
+                    if committed:
                         flash('Category deleted successfully!', 'success')
+                    elif cat_name not in (raw_cats[next(iter(raw_cats))].get('categories') or []):
+                        flash(f'Category "{cat_name}" not found.', 'danger')
+                    else:
+                        flash(CONFLICT_MESSAGE, 'warning')
                 else:
                     cats = ['Cloud & DevOps', 'Web Development']
                     if cat_name in cats:
@@ -590,25 +797,27 @@ def admin_skills():
                         cats = []
                     
                     if old_name in cats:
-                        # Replace string at index
-                        idx = cats.index(old_name)
-                        cats[idx] = new_name
-                        fb.put(f'/about/skill_categories/{key}', 'categories', cats)
-                        
-                        # Update all skills referencing the old category
-                        raw_skills = fb.get('/about/skills', None) or {}
-                        if raw_skills:
-                            skills_key = next(iter(raw_skills))
-                            skills = raw_skills[skills_key].get('skills', [])
-                            made_changes = False
-                            
-                            for skill in skills:
-                                if skill.get('category') == old_name:
-                                    skill['category'] = new_name
-                                    made_changes = True
-                                    
-                            if made_changes:
-                                fb.put(f'/about/skills/{skills_key}', 'skills', skills)
+                        # Rename the category and its skills in one atomic write
+                        with fb.batch('/about') as batch:
+                            # Replace string at index
+                            idx = cats.index(old_name)
+                            cats[idx] = new_name
+                            batch.set(f'/about/skill_categories/{key}/categories', cats)
+
+                            # Update all skills referencing the old category
+                            raw_skills = fb.get('/about/skills', None) or {}
+                            if raw_skills:
+                                skills_key = next(iter(raw_skills))
+                                skills = raw_skills[skills_key].get('skills', [])
+                                made_changes = False
+
+                                for skill in skills:
+                                    if skill.get('category') == old_name:
+                                        skill['category'] = new_name
+                                        made_changes = True
+
+                                if made_changes:
+                                    batch.set(f'/about/skills/{skills_key}/skills', skills)
                                 
                         flash(f'Category "{old_name}" renamed to "{new_name}" and skills updated!', 'success')
                     else:
@@ -663,9 +872,8 @@ def admin_resume():
             if 'reorder_tech_skills' in data:
                 new_skills = data['reorder_tech_skills']
                 if isinstance(new_skills, list):
-                    raw = fb.get('/resume/technical_skills', None) or {}
-                    if raw:
-                        key = next(iter(raw))
+                    key = fb.first_key('/resume/technical_skills')
+                    if key:
                         fb.put(f'/resume/technical_skills/{key}', 'skills', new_skills)
                         return {'status': 'success'}, 200
                     return {'status': 'error', 'message': 'No technical skills found'}, 400
@@ -674,9 +882,8 @@ def admin_resume():
         # Handle Professional Summary update
         if 'edited_professional_summary' in request.form:
             new_summary = request.form['edited_professional_summary'].strip()
-            raw_summary = fb.get('/resume/professional_summary', None) or {}
-            if raw_summary:
-                key = next(iter(raw_summary))
+            key = fb.first_key('/resume/professional_summary')
+            if key:
                 fb.put(f'/resume/professional_summary/{key}', 'summary', new_summary)
             else:
                 fb.post('/resume/professional_summary', {'summary': new_summary})
@@ -688,22 +895,23 @@ def admin_resume():
             skill_name = request.form['new_tech_skill_name'].strip()
             skill_pct = int(request.form['new_tech_skill_percentage'])
             if skill_name and 0 <= skill_pct <= 100:
-                raw = fb.get('/resume/technical_skills', None) or {}
-                if raw:
-                    key = next(iter(raw))
-                    skills = raw[key].get('skills', [])
-                    skills.append({
-                        'name': skill_name,
-                        'percentage': skill_pct
-                    })
-                    fb.put(f'/resume/technical_skills/{key}', 'skills', skills)
-                else:
+                committed, raw = update_list('/resume/technical_skills', 'skills', lambda skills: skills.append({
+                    'name': skill_name,
+                    'percentage': skill_pct
+                }))
+                if committed is None:
+                    flash(SAVE_ERROR_MESSAGE, 'warning')
+                    return redirect(url_for('admin_resume'))
+                if not raw:
                     fb.post('/resume/technical_skills', {
                         'skills': [{
                             'name': skill_name,
                             'percentage': skill_pct
                         }]
                     })
+                elif not committed:
+                    flash(CONFLICT_MESSAGE, 'warning')
+                    return redirect(url_for('admin_resume'))
             flash('Technical skill added successfully!', 'success')
             return redirect(url_for('admin_resume'))
         
@@ -712,28 +920,22 @@ def admin_resume():
             idx = int(request.form['edit_tech_skill_index'])
             skill_name = request.form['edited_tech_skill_name'].strip()
             skill_pct = int(request.form['edited_tech_skill_percentage'])
-            raw = fb.get('/resume/technical_skills', None) or {}
-            if raw:
-                key = next(iter(raw))
-                skills = raw[key].get('skills', [])
-                if 0 <= idx < len(skills):
-                    skills[idx]['name'] = skill_name
-                    skills[idx]['percentage'] = skill_pct
-                    fb.put(f'/resume/technical_skills/{key}', 'skills', skills)
-            flash('Technical skill updated successfully!', 'success')
+            edit = lambda skill: dict(skill, name=skill_name, percentage=skill_pct)
+            committed, raw = update_list('/resume/technical_skills', 'skills', at_index(idx, edit), max_retries=0)
+            if committed:
+                flash('Technical skill updated successfully!', 'success')
+            elif raw or committed is None:
+                flash(not_saved_message(committed), 'warning')
             return redirect(url_for('admin_resume'))
         
         # Handle Delete Technical Skill
         elif 'delete_tech_skill_index' in request.form:
             idx = int(request.form['delete_tech_skill_index'])
-            raw = fb.get('/resume/technical_skills', None) or {}
-            if raw:
-                key = next(iter(raw))
-                skills = raw[key].get('skills', [])
-                if 0 <= idx < len(skills):
-                    skills.pop(idx)
-                    fb.put(f'/resume/technical_skills/{key}', 'skills', skills)
-            flash('Technical skill deleted successfully!', 'success')
+            committed, raw = update_list('/resume/technical_skills', 'skills', at_index(idx), max_retries=0)
+            if committed:
+                flash('Technical skill deleted successfully!', 'success')
+            elif raw or committed is None:
+                flash(not_saved_message(committed), 'warning')
             return redirect(url_for('admin_resume'))
         
         # Handle Update submission for Experience
@@ -805,9 +1007,8 @@ def admin_resume():
     # Get Professional Summary
     professional_summary = ''
     try:
-        raw_summary = fb.get('/resume/professional_summary', None) or {}
-        if raw_summary:
-            summary_data = next(iter(raw_summary.values()))
+        _, summary_data = fb.first_child('/resume/professional_summary')
+        if summary_data:
             if isinstance(summary_data, dict):
                 professional_summary = summary_data.get('summary', '')
     except Exception as e:
@@ -891,6 +1092,7 @@ def admin_certification():
 
         # Handle file upload
         image_path = None
+        image_variants = {}
         if 'cert_image' in request.files:
             file = request.files['cert_image']
             if file and file.filename:
@@ -906,7 +1108,8 @@ def admin_certification():
                 
                 # Define the path to save the image
                 base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-                portfolio_dir = os.path.join(base_dir, 'main', 'project', 'static', 'assets', 'img', 'portfolio')
+                static_dir = os.path.join(base_dir, 'PortfolioMain', 'static')
+                portfolio_dir = os.path.join(static_dir, 'assets', 'img', 'portfolio')
                 
                 # Create directory if it doesn't exist
                 os.makedirs(portfolio_dir, exist_ok=True)
@@ -918,6 +1121,10 @@ def admin_certification():
                 
                 # Save the file
                 file.save(file_path)
+
+                # Resized WebP/AVIF copies for the public page's srcset
+                if images.is_source_image(unique_filename):
+                    image_variants = images.generate_variants(file_path, static_dir)
         
         # Edit button clicked
         if 'edit_key' in request.form:
@@ -934,6 +1141,7 @@ def admin_certification():
                 existing_cert = fb.get(f'/certifications/{key}', None)
                 if existing_cert:
                     image_path = existing_cert.get('image', '')
+                    image_variants = existing_cert.get('image_variants', {})
                 else:
                     flash('Error: Could not find existing certification.', 'error')
                     return redirect(url_for('admin_certification'))
@@ -941,6 +1149,7 @@ def admin_certification():
             updated = {
                 "title": request.form['title'],
                 "image": image_path,
+                "image_variants": image_variants,
                 "filter": request.form['filter'],
                 "url": request.form.get('url', '')  # Optional
             }
@@ -958,6 +1167,7 @@ def admin_certification():
                 fb.post('/certifications', {
                     "title": title,
                     "image": image_path,
+                    "image_variants": image_variants,
                     "filter": filter_category,
                     "url": url
                 })
@@ -1081,19 +1291,12 @@ def admin_contact():
             flash("Guest Mode: Read-only access. Changes are not saved.", "warning")
             return redirect(url_for('admin_contact'))
 
-        # Get the links data
-        links = fb.get('/links/-OOvwHeVJtSsrjh3QnWR/links', None) or {}
-        
         # Update contact information
         if 'email' in request.form or 'phone' in request.form:
             email = request.form.get('email', '').strip()
             phone = request.form.get('phone', '').strip()
             
-            links['email'] = email
-            links['phone'] = phone
-            
-            fb.put('/links/-OOvwHeVJtSsrjh3QnWR/links', 'email', email)
-            fb.put('/links/-OOvwHeVJtSsrjh3QnWR/links', 'phone', phone)
+            fb.patch(ADMIN_LINKS_PATH, {'email': email, 'phone': phone})
             
             flash('Contact information updated successfully!', 'success')
             return redirect(url_for('admin_contact'))
@@ -1105,10 +1308,12 @@ def admin_contact():
             telegram = request.form.get('telegram', '').strip()
             whatsapp = request.form.get('whatsapp', '').strip()
             
-            fb.put('/links/-OOvwHeVJtSsrjh3QnWR/links', 'linkedin', linkedin)
-            fb.put('/links/-OOvwHeVJtSsrjh3QnWR/links', 'github', github)
-            fb.put('/links/-OOvwHeVJtSsrjh3QnWR/links', 'telegram', telegram)
-            fb.put('/links/-OOvwHeVJtSsrjh3QnWR/links', 'whatsapp', whatsapp)
+            fb.patch(ADMIN_LINKS_PATH, {
+                'linkedin': linkedin,
+                'github': github,
+                'telegram': telegram,
+                'whatsapp': whatsapp,
+            })
             
             flash('Social media links updated successfully!', 'success')
             return redirect(url_for('admin_contact'))
@@ -1130,9 +1335,9 @@ def admin_contact():
                 msg_parts.append("Password")
             
             if updates:
-                # Update Firebase
-                for key, val in updates.items():
-                    fb.put('/links/-OOvwHeVJtSsrjh3QnWR/links', key, val)
+                # Update Firebase (username and password together, in one write)
+                fb.patch(ADMIN_LINKS_PATH, updates)
+                credentials.invalidate(ADMIN_LINKS_PATH)
                 
                 # Clear session and redirect to login
                 session.clear()
@@ -0,0 +1,64 @@
+"""asyncio facade over the chat pipeline (bedrock/rag.py).
+
+botocore is blocking, so rather than a second, aioboto3-based copy of the
+pipeline the existing functions run on a bounded thread pool and are
+awaited from the event loop. A waiting chat question then costs a
+coroutine, not a whole worker process; at most CHAT_ASYNC_THREADS
+questions talk to Bedrock at the same time and the rest queue cheaply.
+Keep AWS_MAX_POOL_CONNECTIONS (config/aws_clients.py) at least as large so
+the threads do not wait on connections.
+"""
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from . import rag
+
+THREADS = int(os.getenv("CHAT_ASYNC_THREADS", "16"))
+
+_executor = ThreadPoolExecutor(max_workers=THREADS, thread_name_prefix="chat")
+_DONE = object()
+
+
+async def run(fn, *args):
+    """Await `fn(*args)` run on the chat thread pool"""
+    return await asyncio.get_running_loop().run_in_executor(_executor, fn, *args)
+
+
+async def ask_portfolio(question: str) -> str:
+    return await run(rag.ask_portfolio, question)
+
+
+async def stream_portfolio(question: str):
+    """
+    Async generator over rag.stream_portfolio(): a pool thread drives the
+    blocking stream and hands each fragment to the event loop as it arrives.
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    cancelled = False
+
+    def pump():
+        try:
+            for text in rag.stream_portfolio(question):
+                if cancelled:
+                    # The client went away; stop reading from Bedrock
+                    break
+                loop.call_soon_threadsafe(queue.put_nowait, text)
+        except Exception as e:
+            loop.call_soon_threadsafe(queue.put_nowait, e)
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, _DONE)
+
+    loop.run_in_executor(_executor, pump)
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        # Lets the thread stop at the next fragment if the consumer left early
+        cancelled = True
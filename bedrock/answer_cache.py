@@ -0,0 +1,180 @@
+"""Cache of chat answers keyed on a normalized form of the question.
+
+"What AWS projects has he done?" and "what aws project's has he done" map
+to the same key, so repeated questions skip both the knowledge base
+retrieve and the model call. Entries expire after a TTL, the least
+recently used are evicted past `max_entries`, and every entry records the
+version (prompt + knowledge base) it was generated under: a lookup with a
+different version is a miss.
+
+With `path` set, entries are also written to a SQLite file so they survive
+restarts and are shared between worker processes.
+"""
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+# Longest first; a suffix is only stripped if at least 3 letters remain
+STEM_SUFFIXES = ("ations", "ation", "ments", "ment", "ings", "ing", "ies", "ied", "ed", "s")
+STEM_MIN_LENGTH = 3
+# "-es" is only a plural ending after these ("boxes", "watches"); "services" just loses the "s"
+ES_PLURAL = re.compile(r"(?:ss|x|z|ch|sh)es$")
+
+
+def stem(word):
+    """Very light suffix stripping, enough to merge plurals and verb forms"""
+    if len(word) <= STEM_MIN_LENGTH + 1 or word.endswith("ss"):
+        return word
+    if ES_PLURAL.search(word):
+        return word[:-2]
+    for suffix in STEM_SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= STEM_MIN_LENGTH:
+            base = word[:-len(suffix)]
+            return base + "y" if suffix in ("ies", "ied") else base
+    return word
+
+
+def fold_accents(text):
+    """"résumé" -> "resume"; marks on non-Latin letters (Devanagari vowel signs...) are kept"""
+    folded = []
+    for ch in text:
+        base = unicodedata.normalize("NFKD", ch)[0]
+        folded.append(base if base.isascii() else ch)
+    return "".join(folded)
+
+
+def tokens(text):
+    """
+    Words, in any script and with their combining marks ("क्या"), keeping a
+    trailing "+" or "#" ("c++", "c#"); plus non-ASCII symbols such as emoji.
+    Everything else (punctuation, ASCII symbols, spaces) separates words.
+    """
+    found, word = [], ""
+    for ch in text:
+        kind = unicodedata.category(ch)[0]
+        if word and (kind == "M" or ch in "+#" or (ch.isalnum() and not word.endswith(("+", "#")))):
+            word += ch
+            continue
+        if word:
+            found.append(word)
+            word = ""
+        if ch.isalnum():
+            word = ch
+        elif kind == "S" and not ch.isascii():
+            found.append(ch)
+    if word:
+        found.append(word)
+    return found
+
+
+def normalize_question(question):
+    """
+    Case-folded, accent- and punctuation-free, stemmed form of `question`.
+    Empty if nothing but punctuation is left; callers must not use that as a key.
+    """
+    text = fold_accents(unicodedata.normalize("NFKC", question).casefold())
+    # Apostrophes join ("what's" -> "whats"); any other punctuation separates words
+    text = re.sub(r"['’]", "", text)
+    return " ".join(stem(word) if word.isascii() else word for word in tokens(text))
+
+
+class AnswerCache:
+    def __init__(self, max_entries=512, ttl=86400, path=None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.path = path
+        self._entries = OrderedDict()  # key -> (version, answer, created)
+        self._lock = threading.Lock()
+        self._db = None
+        self.hits = 0
+        self.misses = 0
+        if path:
+            self._open_db(path)
+
+    def _open_db(self, path):
+        try:
+            db = sqlite3.connect(path, timeout=5, check_same_thread=False, isolation_level=None)
+            # WAL lets gunicorn workers read while another one writes
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("CREATE TABLE IF NOT EXISTS answers ("
+                       "key TEXT PRIMARY KEY, version TEXT NOT NULL, "
+                       "answer TEXT NOT NULL, created REAL NOT NULL)")
+            self._db = db
+        except sqlite3.Error as e:
+            print(f"Answer cache: SQLite unavailable at {path}, using memory only: {e}")
+
+    def _valid(self, entry, version):
+        return entry is not None and entry[0] == version and time.time() - entry[2] < self.ttl
+
+    def get(self, question, version):
+        """Cached answer for `question` under `version`, or None"""
+        key = normalize_question(question)
+        if self.ttl <= 0 or not key:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if not self._valid(entry, version) and self._db is not None:
+                # Another worker may have answered it since
+                entry = self._load(key)
+            if self._valid(entry, version):
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            # Missing, expired or from an older prompt/knowledge base
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+
+    def put(self, question, version, answer):
+        key = normalize_question(question)
+        if self.ttl <= 0 or not answer or not key:
+            return
+        entry = (version, answer, time.time())
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            if self._db is not None:
+                self._store(key, entry)
+
+    def _load(self, key):
+        try:
+            return self._db.execute(
+                "SELECT version, answer, created FROM answers WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            print(f"Answer cache read failed: {e}")
+            return None
+
+    def _store(self, key, entry):
+        try:
+            self._db.execute("INSERT OR REPLACE INTO answers (key, version, answer, created) "
+                             "VALUES (?, ?, ?, ?)", (key, *entry))
+            # Keep the file small: drop expired rows and rows from older versions
+            self._db.execute("DELETE FROM answers WHERE created < ? OR version != ?",
+                             (time.time() - self.ttl, entry[0]))
+        except sqlite3.Error as e:
+            print(f"Answer cache write failed: {e}")
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                try:
+                    self._db.execute("DELETE FROM answers")
+                except sqlite3.Error as e:
+                    print(f"Answer cache clear failed: {e}")
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
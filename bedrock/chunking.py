@@ -0,0 +1,136 @@
+"""Turn the portfolio's Firebase tree into text chunks for the local vector index.
+
+Every record the chatbot should know about (a project, a job, a
+certification, the summaries, ...) becomes one or more chunks:
+
+    {"id": "/projects/-Nx..#0", "source": "/projects/-Nx..", "text": "Project: ..."}
+
+`source` is the record's Firebase path, so a record that changes can be
+re-chunked on its own.
+"""
+import re
+
+from rtdb.snapshot import split_path, walk
+
+# Longer records are split on paragraph/sentence boundaries into windows of
+# about this many characters, with a little overlap for context
+CHUNK_CHARS = 800
+OVERLAP_CHARS = 120
+
+# Collections whose children are individual records
+RECORD_COLLECTIONS = (
+    "/projects",
+    "/experience",
+    "/certifications",
+    "/resume/education",
+    "/resume/professional_summary",
+    "/resume/technical_skills",
+    "/about/bio",
+    "/about/heading",
+    "/about/profile",
+    "/about/skills",
+    "/landing/bio",
+    "/landing/skills-list",
+)
+
+
+def _clean(value):
+    return re.sub(r"\s+", " ", str(value)).strip() if value else ""
+
+
+def _skills(value):
+    skills = value.get("skills") if isinstance(value, dict) else None
+    if not isinstance(skills, list):
+        return ""
+    names = []
+    for skill in skills:
+        if isinstance(skill, dict):
+            name = _clean(skill.get("name"))
+            if name and skill.get("percentage") is not None:
+                name = f"{name} ({skill['percentage']}%)"
+        else:
+            name = _clean(skill)
+        if name:
+            names.append(name)
+    return ", ".join(names)
+
+
+def _lines(*pairs):
+    return "\n".join(f"{label}: {_clean(text)}" for label, text in pairs if _clean(text))
+
+
+def record_text(collection, value):
+    """Readable text for one record of `collection`, or "" if there is nothing to index"""
+    if isinstance(value, str):
+        return _clean(value)
+    if not isinstance(value, dict):
+        return ""
+    get = value.get
+    if collection == "/projects":
+        return _lines(("Project", get("title")), ("Description", get("description")), ("Link", get("url")))
+    if collection == "/experience":
+        return _lines(("Experience", " at ".join(filter(None, [_clean(get("role")), _clean(get("company"))]))),
+                      ("Period", get("duration")), ("Location", get("location")),
+                      ("Responsibilities", get("description")))
+    if collection == "/certifications":
+        return _lines(("Certification", get("title")), ("Category", get("filter")), ("Credential", get("url")))
+    if collection == "/resume/education":
+        return _lines(("Education", ", ".join(filter(None, [_clean(get("designation")), _clean(get("institution"))]))),
+                      ("Period", get("period")), ("Location", get("location")), ("Details", get("description")))
+    if collection == "/resume/professional_summary":
+        return _lines(("Professional summary", get("summary")))
+    if collection == "/resume/technical_skills":
+        return _lines(("Technical skills", _skills(value)))
+    if collection in ("/about/skills", "/landing/skills-list"):
+        return _lines(("Skills", _skills(value)))
+    if collection == "/about/profile":
+        return _lines(*((key.replace("_", " ").capitalize(), get(key)) for key in
+                        ("name", "title", "location", "specialization", "experience_level", "education", "languages")))
+    if collection in ("/about/bio", "/landing/bio"):
+        return _lines(("About", get("bio")))
+    if collection == "/about/heading":
+        return _lines(("Headline", get("heading")))
+    return ""
+
+
+def split_text(text, size=CHUNK_CHARS, overlap=OVERLAP_CHARS):
+    """Split `text` into pieces of about `size` characters on sentence boundaries"""
+    if len(text) <= size:
+        return [text] if text else []
+    sentences = re.split(r"(?<=[.!?])\s+|\n+", text)
+    pieces, current = [], ""
+    for sentence in sentences:
+        if current and len(current) + len(sentence) + 1 > size:
+            pieces.append(current)
+            # Carry the tail of the previous piece over for context
+            current = current[-overlap:].split(" ", 1)[-1] if overlap else ""
+        current = f"{current} {sentence}".strip()
+        while len(current) > size:
+            pieces.append(current[:size])
+            current = current[size - overlap:]
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def record_chunks(collection, key, value):
+    """Chunks for the record at `collection`/`key`"""
+    source = f"{collection}/{key}"
+    return [{"id": f"{source}#{n}", "source": source, "text": text}
+            for n, text in enumerate(split_text(record_text(collection, value)))]
+
+
+def iter_records(tree):
+    """(collection, key, value) for every indexable record in the Firebase tree"""
+    for collection in RECORD_COLLECTIONS:
+        node = walk(tree, split_path(collection))
+        if isinstance(node, dict):
+            for key, value in node.items():
+                yield collection, key, value
+
+
+def portfolio_chunks(tree):
+    chunks = []
+    for collection, key, value in iter_records(tree or {}):
+        chunks.extend(record_chunks(collection, key, value))
+    return chunks
@@ -1,11 +1,9 @@
+import hashlib
 import json
-import boto3
 import os
 
-REGION = os.getenv("AWS_REGION", "us-east-2")
-
-# Bedrock Runtime client
-runtime = boto3.client("bedrock-runtime", region_name=REGION)
+from config.aws_clients import get_client
+from .context import estimate_tokens, prompt_stats
 
 # 🔒 STRONG SYSTEM PROMPT (THIS IS THE KEY)
 SYSTEM_PROMPT = """
@@ -40,20 +38,46 @@ Respond with:
 "Hi! I’m John’s portfolio assistant. You can ask about his projects, AWS work, cloud architecture, or technical experience."
 """
 
+# Blank lines and surrounding whitespace cost input tokens on every call
+SYSTEM_PROMPT = "\n".join(line.rstrip() for line in SYSTEM_PROMPT.strip().splitlines() if line.strip())
+
 # Claude 3 Haiku inference profile ARN (CHEAP + FAST + SUPPORTED)
 INFERENCE_PROFILE_ARN = os.getenv(
     "BEDROCK_INFERENCE_PROFILE_ARN",
     "arn:aws:bedrock:us-east-2:373342145992:inference-profile/us.anthropic.claude-3-haiku-20240307-v1:0"
 )
 
-def generate_answer(context: str, question: str) -> str:
+MAX_TOKENS = 300
+TEMPERATURE = 0.2
+
+# Send the system prompt as a cacheable prefix. Only for models with Bedrock
+# prompt caching, and only pays off once the prefix reaches the model's
+# minimum cacheable length (1,024-2,048 tokens): Claude 3 Haiku and the
+# ~300-token prompt above qualify for neither, so it is off by default.
+PROMPT_CACHING = os.getenv("BEDROCK_PROMPT_CACHING", "0") == "1"
+
+# Changes whenever the prompt or model settings do, so cached answers
+# generated under the old ones are not served (bedrock.answer_cache)
+PROMPT_VERSION = hashlib.sha256(
+    f"{SYSTEM_PROMPT}|{INFERENCE_PROFILE_ARN}|{MAX_TOKENS}|{TEMPERATURE}".encode("utf-8")
+).hexdigest()[:12]
+
+def estimate_prompt(context: str, question: str) -> int:
+    return estimate_tokens(SYSTEM_PROMPT) + estimate_tokens(context) + estimate_tokens(question) + 4
+
+
+def build_request(context: str, question: str) -> str:
     """
-    Generates a portfolio-focused answer using Claude 3 Haiku.
+    JSON request body for Claude; shared by the blocking and streaming calls.
     """
 
+    system = SYSTEM_PROMPT
+    if PROMPT_CACHING:
+        system = [{"type": "text", "text": SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}]
+
     body = {
         "anthropic_version": "bedrock-2023-05-31",
-        "system": SYSTEM_PROMPT,
+        "system": system,
         "messages": [
             {
                 "role": "user",
@@ -61,17 +85,60 @@ def generate_answer(context: str, question: str) -> str:
                 "content": f"{context}\n\nQuestion: {question}"
             }
         ],
-        "max_tokens": 300,
-        "temperature": 0.2
+        "max_tokens": MAX_TOKENS,
+        "temperature": TEMPERATURE
     }
+    return json.dumps(body)
 
-    response = runtime.invoke_model(
+
+def generate_answer(context: str, question: str) -> str:
+    """
+    Generates a portfolio-focused answer using Claude 3 Haiku.
+    """
+
+    response = get_client("bedrock-runtime").invoke_model(
         modelId=INFERENCE_PROFILE_ARN,
         contentType="application/json",
         accept="application/json",
-        body=json.dumps(body)
+        body=build_request(context, question)
     )
 
     result = json.loads(response["body"].read())
+    prompt_stats.record(estimate_prompt(context, question), result.get("usage"))
     return result["content"][0]["text"].strip()
 
+
+def stream_answer(context: str, question: str):
+    """
+    Same answer as generate_answer(), yielded as text fragments as Claude
+    produces them (invoke_model_with_response_stream).
+    """
+
+    response = get_client("bedrock-runtime").invoke_model_with_response_stream(
+        modelId=INFERENCE_PROFILE_ARN,
+        contentType="application/json",
+        accept="application/json",
+        body=build_request(context, question)
+    )
+
+    started = False
+    usage = {}
+    for event in response["body"]:
+        chunk = event.get("chunk")
+        if not chunk:
+            continue
+        message = json.loads(chunk["bytes"])
+        if message.get("type") == "message_start":
+            usage.update(message.get("message", {}).get("usage", {}))
+        elif message.get("type") == "message_delta":
+            usage.update(message.get("usage", {}))
+        if message.get("type") != "content_block_delta":
+            continue
+        text = message.get("delta", {}).get("text", "")
+        if not started:
+            # Match generate_answer(), which strips leading whitespace
+            text = text.lstrip()
+            started = bool(text)
+        if text:
+            yield text
+    prompt_stats.record(estimate_prompt(context, question), usage)
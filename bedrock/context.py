@@ -0,0 +1,104 @@
+"""Assemble the retrieved chunks into a prompt context that fits a token budget.
+
+build_context() drops duplicate and near-duplicate chunks (overlapping
+windows of the same record, the same passage indexed twice), then keeps
+the best-scored chunks that fit in CHAT_CONTEXT_TOKENS. prompt_stats keeps
+what each generation actually cost, so the budget can be tuned from real
+numbers; rag.py logs it with the cache counters (CHAT_STATS_EVERY).
+"""
+import math
+import os
+import re
+import threading
+from collections import deque
+
+CONTEXT_TOKENS = int(os.getenv("CHAT_CONTEXT_TOKENS", "1200"))
+# Chunks sharing at least this share of their word shingles count as duplicates
+DUPLICATE_OVERLAP = 0.8
+SHINGLE_SIZE = 3
+
+
+def estimate_tokens(text):
+    """Rough token count: ~4 characters per token for English prose"""
+    return math.ceil(len(text) / 4) if text else 0
+
+
+def _shingles(text):
+    words = re.findall(r"\w+", text.lower())
+    if len(words) < SHINGLE_SIZE:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+
+
+def dedupe(chunks):
+    """`chunks` (best first) without those mostly contained in a better one"""
+    kept, kept_shingles = [], []
+    for chunk in chunks:
+        shingles = _shingles(chunk["text"])
+        if not shingles:
+            continue
+        if any(len(shingles & other) >= DUPLICATE_OVERLAP * min(len(shingles), len(other))
+               for other in kept_shingles):
+            continue
+        kept.append(chunk)
+        kept_shingles.append(shingles)
+    return kept
+
+
+def build_context(chunks, budget=CONTEXT_TOKENS):
+    """
+    Context text from retrieved `chunks`: deduplicated, ranked by score and
+    trimmed to `budget` estimated tokens. Returns (text, chunks used).
+    """
+    ranked = sorted(chunks, key=lambda chunk: -(chunk.get("score") or 0.0))
+    used, total = [], 0
+    for chunk in dedupe(ranked):
+        cost = estimate_tokens(chunk["text"]) + 1
+        if total + cost > budget:
+            # A smaller chunk further down may still fit
+            continue
+        used.append(chunk)
+        total += cost
+    return "\n\n".join(chunk["text"] for chunk in used), used
+
+
+class PromptStats:
+    """Running totals and the most recent per-request prompt sizes"""
+
+    def __init__(self, keep=100):
+        self._lock = threading.Lock()
+        self.recent = deque(maxlen=keep)
+        self.requests = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.cache_read_tokens = 0
+
+    def record(self, estimated, usage):
+        usage = usage or {}
+        entry = {
+            "estimated_input": estimated,
+            "input_tokens": usage.get("input_tokens"),
+            "output_tokens": usage.get("output_tokens"),
+            "cache_read_tokens": usage.get("cache_read_input_tokens", 0),
+            "cache_write_tokens": usage.get("cache_creation_input_tokens", 0),
+        }
+        with self._lock:
+            self.recent.append(entry)
+            self.requests += 1
+            self.input_tokens += entry["input_tokens"] or estimated
+            self.output_tokens += entry["output_tokens"] or 0
+            self.cache_read_tokens += entry["cache_read_tokens"] or 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "input_tokens": self.input_tokens,
+                "output_tokens": self.output_tokens,
+                "cache_read_tokens": self.cache_read_tokens,
+                "avg_input_tokens": self.input_tokens / self.requests if self.requests else 0.0,
+                "last": self.recent[-1] if self.recent else None,
+            }
+
+
+prompt_stats = PromptStats()
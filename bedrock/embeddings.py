@@ -0,0 +1,82 @@
+"""Text embedders shared by the semantic answer cache and the local vector index.
+
+Each has a `name`, a fixed `dim` and `embed(text)` returning a unit-length
+float32 vector, so cosine similarity is a plain dot product.
+"""
+import json
+import os
+import zlib
+
+import numpy as np
+
+from config.aws_clients import get_client
+from .answer_cache import normalize_question
+
+# Words that carry no topic; left in, they make unrelated questions look alike
+STOPWORDS = frozenset("""
+a about all an and any are can could did do does done for from get give got has have he her
+him his how i in is it john know list me of on or please sathvik show some tell the their there
+to was what when where which who why with would you your
+""".split())
+
+
+class HashingEmbedder:
+    """Feature-hashed bag of words and character trigrams, L2-normalized"""
+    name = "hashing"
+
+    def __init__(self, dim=1024):
+        self.dim = dim
+
+    def _features(self, text):
+        words = [word for word in normalize_question(text).split() if word not in STOPWORDS]
+        for word in words:
+            yield word, 1.0
+            padded = f" {word} "
+            for i in range(len(padded) - 2):
+                yield "#" + padded[i:i + 3], 0.5
+        for first, second in zip(words, words[1:]):
+            yield f"{first} {second}", 0.5
+
+    def embed(self, text):
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for feature, weight in self._features(text):
+            h = zlib.crc32(feature.encode("utf-8"))
+            # The top bit picks the sign so collisions tend to cancel out
+            vector[h % self.dim] += weight if h & 0x80000000 else -weight
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+
+class TitanEmbedder:
+    name = "titan"
+
+    def __init__(self, model_id=None, dim=256, client=None):
+        self.model_id = model_id or os.getenv("CHAT_EMBEDDING_MODEL", "amazon.titan-embed-text-v2:0")
+        self.dim = dim
+        self._client = client
+
+    @property
+    def client(self):
+        return self._client or get_client("bedrock-runtime")
+
+    def embed(self, text):
+        response = self.client.invoke_model(
+            modelId=self.model_id,
+            contentType="application/json",
+            accept="application/json",
+            body=json.dumps({"inputText": text, "dimensions": self.dim, "normalize": True}),
+        )
+        vector = np.asarray(json.loads(response["body"].read())["embedding"], dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+
+EMBEDDERS = {"hashing": HashingEmbedder, "titan": TitanEmbedder}
+
+
+def get_embedder(name):
+    """Embedder registered as `name` (falls back to hashing for unknown names)"""
+    if name not in EMBEDDERS:
+        print(f"Unknown embedder '{name}', using hashing", flush=True)
+        name = "hashing"
+    return EMBEDDERS[name]()
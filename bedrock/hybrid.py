@@ -0,0 +1,100 @@
+"""Lexical retrieval pieces for the hybrid retriever (bedrock/retrievers.py).
+
+    BM25Index   in-memory inverted index over chunk texts (Okapi BM25)
+    rrf         reciprocal-rank fusion of several rankings
+    rerank      cheap local rescoring of the fused candidates
+
+Vector search finds paraphrases but can rank an exact term ("Terraform",
+"3-tier") below vaguely similar chunks; BM25 is the opposite. Fusing the
+two ranks and rescoring the short list by query-term coverage gets the
+right chunks into a smaller top-k.
+"""
+import math
+
+import numpy as np
+
+from .answer_cache import normalize_question
+from .embeddings import STOPWORDS
+
+
+def tokenize(text):
+    return normalize_question(text).split()
+
+
+class BM25Index:
+    def __init__(self, texts, k1=1.5, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self.size = len(texts)
+        docs = [tokenize(text) for text in texts]
+        lengths = np.array([len(doc) for doc in docs], dtype=np.float32)
+        avg = float(lengths.mean()) if self.size else 0.0
+        # Per-document length normalization, precomputed once
+        self._norm = k1 * (1 - b + b * lengths / avg) if avg else np.full(self.size, k1, dtype=np.float32)
+
+        postings = {}
+        for i, doc in enumerate(docs):
+            counts = {}
+            for term in doc:
+                counts[term] = counts.get(term, 0) + 1
+            for term, tf in counts.items():
+                postings.setdefault(term, ([], []))
+                postings[term][0].append(i)
+                postings[term][1].append(tf)
+        # term -> (idf, doc ids, term frequencies) as arrays for vectorized scoring
+        self._postings = {}
+        for term, (ids, tfs) in postings.items():
+            df = len(ids)
+            idf = math.log(1 + (self.size - df + 0.5) / (df + 0.5))
+            self._postings[term] = (idf, np.array(ids), np.array(tfs, dtype=np.float32))
+
+    def scores(self, query):
+        """BM25 score of every document for `query`"""
+        scores = np.zeros(self.size, dtype=np.float32)
+        for term in set(tokenize(query)):
+            posting = self._postings.get(term)
+            if posting is None:
+                continue
+            idf, ids, tfs = posting
+            scores[ids] += idf * tfs * (self.k1 + 1) / (tfs + self._norm[ids])
+        return scores
+
+    def search(self, query, k=20):
+        """[(document index, score)] of the best `k` documents with a non-zero score"""
+        scores = self.scores(query)
+        hits = np.flatnonzero(scores)
+        if not len(hits):
+            return []
+        top = hits[np.argsort(-scores[hits])][:k]
+        return [(int(i), float(scores[i])) for i in top]
+
+
+def rrf(rankings, k=60):
+    """Reciprocal-rank fusion: {id: sum of 1 / (k + rank)} over rankings of ids, best first"""
+    fused = {}
+    for ranking in rankings:
+        for rank, item in enumerate(ranking):
+            fused[item] = fused.get(item, 0.0) + 1.0 / (k + rank + 1)
+    return dict(sorted(fused.items(), key=lambda pair: -pair[1]))
+
+
+def rerank(query, candidates, fused_weight=0.5):
+    """
+    Rescore `candidates` (chunk dicts with a "fused" score) by how much of the
+    query they cover: the share of distinct query terms (minus stopwords)
+    they contain, plus a bonus for query bigrams ("3 tier", "step function")
+    they contain as-is.
+    """
+    terms = tokenize(query)
+    unique = set(terms) - STOPWORDS or set(terms)
+    bigrams = {f"{a} {b}" for a, b in zip(terms, terms[1:])}
+    if not unique or not candidates:
+        return candidates
+    top_fused = max(chunk["fused"] for chunk in candidates) or 1.0
+    for chunk in candidates:
+        words = tokenize(chunk["text"])
+        padded = f" {' '.join(words)} "
+        coverage = len(unique & set(words)) / len(unique)
+        phrase = sum(1 for bigram in bigrams if f" {bigram} " in padded) / len(bigrams) if bigrams else 0.0
+        chunk["rerank"] = coverage + 0.5 * phrase + fused_weight * chunk["fused"] / top_fused
+    return sorted(candidates, key=lambda chunk: -chunk["rerank"])
@@ -0,0 +1,253 @@
+"""Build the local vector index and keep it in step with admin edits.
+
+    python -m bedrock.indexer [--from-json FILE] [--embedder hashing|titan] [--out DIR]
+    python -m bedrock.indexer --compact
+
+Updates are incremental. The sidecar keeps a manifest of a content hash
+per Firebase record and per chunk, so:
+
+  - a record whose hash is unchanged is skipped entirely,
+  - a changed record is re-chunked, and only chunks whose text is new are
+    embedded (vectors of identical chunks are copied over),
+  - chunks of changed or deleted records become tombstones: they stay in
+    the matrix but are never returned, until compaction drops them once
+    they make up CHAT_INDEX_COMPACT_RATIO of the rows (or on --compact and
+    full builds).
+
+The admin app hands every write to IndexUpdater.schedule(), which
+re-reads only the affected records in a background thread.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows dev machines: the in-process lock still applies
+    fcntl = None
+
+from rtdb.session import TIMEOUT, get_session
+from rtdb.snapshot import join_path, split_path, walk
+from .chunking import RECORD_COLLECTIONS, record_chunks
+from .embeddings import get_embedder
+from .vector_index import DEFAULT_INDEX_DIR, SIDECAR_NAME, read_index, write_index
+
+FIREBASE_URL = os.getenv("FIREBASE_URL", "https://portfolio-536e2-default-rtdb.firebaseio.com/")
+
+# Compact once tombstones make up more than this share of the rows
+COMPACT_RATIO = float(os.getenv("CHAT_INDEX_COMPACT_RATIO", "0.25"))
+
+_write_lock = threading.Lock()
+
+
+def content_hash(value):
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:16]
+
+
+def is_indexed(path):
+    """Whether data at `path` can contain indexed records"""
+    parts = split_path(path)
+    for collection in RECORD_COLLECTIONS:
+        cparts = split_path(collection)
+        n = min(len(parts), len(cparts))
+        if parts[:n] == cparts[:n]:
+            return True
+    return False
+
+
+def record_scope(path):
+    """`path` cut down to the record it lies in (/projects/-Nx/title -> /projects/-Nx)"""
+    parts = split_path(path)
+    for collection in RECORD_COLLECTIONS:
+        cparts = split_path(collection)
+        if parts[:len(cparts)] == cparts and len(parts) > len(cparts) + 1:
+            return join_path(parts[:len(cparts) + 1])
+    return join_path(parts)
+
+
+def records_under(path, value):
+    """{source: (collection, key, record)} for the records in `value`, the data at `path`"""
+    parts = split_path(path)
+    found = {}
+    for collection in RECORD_COLLECTIONS:
+        cparts = split_path(collection)
+        if cparts[:len(parts)] == parts:
+            # The collection is at or below `path`
+            node = walk(value, cparts[len(parts):])
+            if isinstance(node, dict):
+                for key, record in node.items():
+                    found[f"{collection}/{key}"] = (collection, key, record)
+        elif parts[:len(cparts)] == cparts and len(parts) == len(cparts) + 1 and value is not None:
+            # `path` is a single record of the collection
+            found[path] = (collection, parts[-1], value)
+    return found
+
+
+def covers(path, source):
+    return path == "/" or source == path or source.startswith(path.rstrip("/") + "/")
+
+
+@contextmanager
+def locked(index_dir):
+    """Serialize index writers, across processes where fcntl is available"""
+    os.makedirs(index_dir, exist_ok=True)
+    with _write_lock, open(os.path.join(index_dir, ".lock"), "w") as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        yield
+
+
+def apply_changes(changes, index_dir=DEFAULT_INDEX_DIR, embedder_name=None, compact=False):
+    """
+    Update the index from `changes`, {path: data now at path (None if deleted)}.
+    Returns (index version, {"embedded", "reused", "deleted", "compacted"}).
+    """
+    stats = {"embedded": 0, "reused": 0, "deleted": 0, "compacted": False}
+    with locked(index_dir):
+        meta, vectors = read_index(index_dir)
+        name = embedder_name or (meta or {}).get("embedder") or os.getenv("CHAT_INDEX_EMBEDDER", "hashing")
+        embedder = get_embedder(name)
+        if meta is None or meta.get("embedder") != embedder.name or vectors.shape[1:] != (embedder.dim,):
+            # Nothing usable to build on: start from an empty index
+            meta, vectors = {"chunks": [], "records": {}}, np.zeros((0, embedder.dim), dtype=np.float32)
+
+        chunks = list(meta["chunks"])
+        records = dict(meta.get("records", {}))
+        rows = list(vectors)
+        # Vectors already computed, by chunk hash (tombstones included: an edit may be undone)
+        known = {chunk["hash"]: i for i, chunk in enumerate(chunks) if "hash" in chunk}
+        live = {}
+        for i, chunk in enumerate(chunks):
+            if not chunk.get("deleted"):
+                live.setdefault(chunk["source"], []).append(i)
+
+        def tombstone(source):
+            for i in live.pop(source, []):
+                chunks[i] = dict(chunks[i], deleted=True)
+                stats["deleted"] += 1
+
+        for path, value in changes.items():
+            current = records_under(path, value)
+            for source in [s for s in records if covers(path, s) and s not in current]:
+                tombstone(source)
+                del records[source]
+            for source, (collection, key, record) in current.items():
+                digest = content_hash(record)
+                if records.get(source) == digest:
+                    continue
+                tombstone(source)
+                for chunk in record_chunks(collection, key, record):
+                    chunk["hash"] = content_hash([embedder.name, chunk["text"]])
+                    if chunk["hash"] in known:
+                        rows.append(rows[known[chunk["hash"]]])
+                        stats["reused"] += 1
+                    else:
+                        rows.append(embedder.embed(chunk["text"]))
+                        stats["embedded"] += 1
+                    known[chunk["hash"]] = len(chunks)
+                    live.setdefault(source, []).append(len(chunks))
+                    chunks.append(chunk)
+                records[source] = digest
+
+        dead = sum(1 for chunk in chunks if chunk.get("deleted"))
+        if compact or dead > COMPACT_RATIO * max(len(chunks), 1):
+            keep = [i for i, chunk in enumerate(chunks) if not chunk.get("deleted")]
+            chunks = [chunks[i] for i in keep]
+            rows = [rows[i] for i in keep]
+            stats["compacted"] = True
+
+        matrix = np.vstack(rows).astype(np.float32) if rows else np.zeros((0, embedder.dim), dtype=np.float32)
+        version = write_index(index_dir, embedder.name, chunks, matrix, records)
+    return version, stats
+
+
+def build_index(tree, index_dir=DEFAULT_INDEX_DIR, embedder_name=None):
+    """Sync the index with the whole tree, re-embedding only what changed, and compact it"""
+    return apply_changes({"/": tree}, index_dir, embedder_name, compact=True)
+
+
+class IndexUpdater:
+    """Re-indexes records touched by writes, off the request thread"""
+
+    def __init__(self, index_dir=DEFAULT_INDEX_DIR):
+        self.index_dir = index_dir
+        self._pending = {}  # record-level path -> fetch function
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def enabled(self):
+        # Only maintain an index that has been built (CHAT_RETRIEVER=local deployments)
+        return os.path.exists(os.path.join(self.index_dir, SIDECAR_NAME))
+
+    def schedule(self, path, fetch):
+        """Re-index what is at `path` using `fetch(path)`, which must raise rather than return None on errors"""
+        if not is_indexed(path) or not self.enabled():
+            return
+        with self._lock:
+            self._pending[record_scope(path)] = fetch
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._thread = None
+                    return
+                batch, self._pending = self._pending, {}
+            changes = {}
+            for path, fetch in batch.items():
+                try:
+                    changes[path] = fetch(path)
+                except Exception as e:
+                    # Leave those records as they are rather than index a failed read as a deletion
+                    print(f"Index update: could not read {path}: {e}", flush=True)
+            if not changes:
+                continue
+            try:
+                version, stats = apply_changes(changes, self.index_dir)
+                print(f"Index update for {', '.join(changes)}: {stats} -> {version}", flush=True)
+            except Exception as e:
+                print(f"Index update failed: {e}", flush=True)
+
+
+def fetch_tree():
+    """The whole portfolio tree straight from the Firebase REST API"""
+    response = get_session().get(FIREBASE_URL.rstrip("/") + "/.json", timeout=TIMEOUT)
+    response.raise_for_status()
+    return response.json() or {}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or update the local vector index for the chatbot.")
+    parser.add_argument("--from-json", metavar="FILE",
+                        help="index a JSON dump of the Firebase tree instead of live data")
+    parser.add_argument("--embedder", default=None,
+                        help="hashing (local) or titan (Bedrock); default: the index's current "
+                             "embedder, else CHAT_INDEX_EMBEDDER, else hashing")
+    parser.add_argument("--out", default=DEFAULT_INDEX_DIR, help=f"index directory (default {DEFAULT_INDEX_DIR})")
+    parser.add_argument("--compact", action="store_true", help="only drop tombstoned rows")
+    args = parser.parse_args(argv)
+
+    if args.compact:
+        version, stats = apply_changes({}, args.out, args.embedder, compact=True)
+    else:
+        if args.from_json:
+            with open(args.from_json, encoding="utf-8") as f:
+                tree = json.load(f)
+        else:
+            tree = fetch_tree()
+        version, stats = build_index(tree, args.out, args.embedder)
+    print(f"Index {args.out} at version {version}: {stats}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
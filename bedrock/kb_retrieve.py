@@ -1,22 +1,22 @@
-import boto3
 import os
+import threading
+import time
 
-REGION = os.getenv("AWS_REGION", "us-east-2")
+from config.aws_clients import get_client
 
 def get_bedrock_client():
     kb_id = os.getenv("BEDROCK_KB_ID")
     if not kb_id:
         raise RuntimeError("BEDROCK_KB_ID is not set")
 
-    client = boto3.client(
-        "bedrock-agent-runtime",
-        region_name=REGION
-    )
-
-    return client, kb_id
+    return get_client("bedrock-agent-runtime"), kb_id
 
 
-def retrieve_context(question: str) -> str:
+def retrieve_chunks(question: str, k: int = 5) -> list:
+    """
+    Top-`k` knowledge base passages for `question` as
+    {"text", "score", "source"} dicts, best first.
+    """
     client, kb_id = get_bedrock_client()
 
     print(f"DEBUG: Retrieving context for query: '{question}'", flush=True)
@@ -26,7 +26,7 @@ def retrieve_context(question: str) -> str:
         retrievalQuery={"text": question},
         retrievalConfiguration={
             "vectorSearchConfiguration": {
-                "numberOfResults": 5
+                "numberOfResults": k
             }
         }
     )
@@ -38,6 +38,64 @@ def retrieve_context(question: str) -> str:
     for item in results:
         text = item.get("content", {}).get("text")
         if text:
-            chunks.append(text.strip())
+            location = item.get("location", {})
+            source = location.get("s3Location", {}).get("uri") or location.get("type", "")
+            chunks.append({"text": text.strip(), "score": item.get("score"), "source": source})
+
+    return chunks
+
+
+def retrieve_context(question: str) -> str:
+    return "\n\n".join(chunk["text"] for chunk in retrieve_chunks(question))
+
+
+# How often to ask Bedrock whether the knowledge base was re-synced
+KB_VERSION_CHECK_INTERVAL = int(os.getenv("BEDROCK_KB_VERSION_CHECK_INTERVAL", "300"))
+
+_kb_version = {"value": None, "checked": 0.0}
+_kb_version_lock = threading.Lock()
+
+
+def _latest_ingestion(kb_id: str) -> str:
+    """Finish time of the most recent completed ingestion job across the KB's data sources"""
+    agent = get_client("bedrock-agent")
+    latest = ""
+    sources = agent.list_data_sources(knowledgeBaseId=kb_id).get("dataSourceSummaries", [])
+    for source in sources:
+        jobs = agent.list_ingestion_jobs(
+            knowledgeBaseId=kb_id,
+            dataSourceId=source["dataSourceId"],
+            filters=[{"attribute": "STATUS", "operator": "EQ", "values": ["COMPLETE"]}],
+            sortBy={"attribute": "STARTED_AT", "order": "DESCENDING"},
+            maxResults=1,
+        ).get("ingestionJobSummaries", [])
+        if jobs:
+            latest = max(latest, jobs[0]["updatedAt"].isoformat())
+    return latest
+
 
-    return "\n\n".join(chunks)
+def kb_version() -> str:
+    """
+    Identifies the current knowledge base contents: its id, BEDROCK_KB_VERSION
+    (bump it to invalidate by hand) and the time of the last completed sync.
+    The sync time is re-checked at most every KB_VERSION_CHECK_INTERVAL seconds;
+    if it cannot be read (e.g. no bedrock:ListIngestionJobs permission) the
+    last known value is kept.
+    """
+    kb_id = os.getenv("BEDROCK_KB_ID", "")
+    with _kb_version_lock:
+        now = time.monotonic()
+        due = _kb_version["value"] is None or now - _kb_version["checked"] >= KB_VERSION_CHECK_INTERVAL
+        if due:
+            # Claim the check so concurrent requests keep using the old value meanwhile
+            _kb_version["checked"] = now
+        synced = _kb_version["value"]
+    if due:
+        try:
+            synced = _latest_ingestion(kb_id) if kb_id else ""
+        except Exception as e:
+            print(f"Could not read knowledge base sync time: {e}", flush=True)
+            synced = synced or ""
+        with _kb_version_lock:
+            _kb_version["value"] = synced
+    return f"{kb_id}:{os.getenv('BEDROCK_KB_VERSION', '')}:{synced or ''}"
@@ -8,8 +8,75 @@ load_dotenv()
 from config.secrets import load_secrets
 load_secrets()
 
-from .kb_retrieve import retrieve_context
-from .claude_generate import generate_answer
+from .retrievers import retrieve_chunks, kb_version
+from .context import build_context, prompt_stats
+from .claude_generate import generate_answer, stream_answer, PROMPT_VERSION
+from .answer_cache import AnswerCache, normalize_question
+from . import semantic_cache
+from coalesce.singleflight import single_flight
+
+# Answers to repeated questions, keyed on the normalized question.
+# CHAT_CACHE_TTL=0 disables it; CHAT_CACHE_DB persists it to a SQLite file.
+answer_cache = AnswerCache(
+    max_entries=int(os.getenv("CHAT_CACHE_SIZE", "512")),
+    ttl=int(os.getenv("CHAT_CACHE_TTL", "86400")),
+    path=os.getenv("CHAT_CACHE_DB") or None,
+)
+
+# Paraphrases of cached questions ("which certs has he got"), matched by
+# embedding similarity; see bedrock/semantic_cache.py for the CHAT_* settings
+similar_answers = semantic_cache.from_env()
+
+# A burst of the same question (a shared link) makes one Bedrock call, not one each
+in_flight = single_flight()
+
+# Log chat_stats() after every this many generated answers; 0 turns it off
+STATS_EVERY = int(os.getenv("CHAT_STATS_EVERY", "100"))
+
+
+def cache_version() -> str:
+    return f"{PROMPT_VERSION}:{kb_version()}"
+
+
+def chat_stats() -> dict:
+    """This process's answer cache, semantic cache and prompt size counters"""
+    return {
+        "answer_cache": answer_cache.stats(),
+        "semantic_cache": similar_answers.stats() if similar_answers else None,
+        "prompts": prompt_stats.stats(),
+    }
+
+
+def retrieve_context(question: str) -> str:
+    """Retrieved chunks for `question`, deduplicated and trimmed to the context budget"""
+    context, _used = build_context(retrieve_chunks(question))
+    return context
+
+
+def cached_answer(question: str):
+    """
+    (answer or None, version, question embedding) for `question`; the
+    version and embedding are needed again to store a fresh answer.
+    """
+    version = cache_version()
+    cached = answer_cache.get(question, version)
+    if cached is not None:
+        return cached, version, None
+
+    vector = similar_answers.embed(question) if similar_answers else None
+    if vector is not None:
+        cached, _similarity = similar_answers.get(vector, version, question)
+        if cached is not None:
+            answer_cache.put(question, version, cached)
+    return cached, version, vector
+
+
+def remember_answer(question: str, version: str, vector, answer: str):
+    answer_cache.put(question, version, answer)
+    if vector is not None:
+        similar_answers.put(vector, version, answer, question)
+    if STATS_EVERY and prompt_stats.requests and prompt_stats.requests % STATS_EVERY == 0:
+        print(f"Chat stats: {chat_stats()}", flush=True)
 
 
 def ask_portfolio(question: str) -> str:
@@ -19,12 +86,46 @@ def ask_portfolio(question: str) -> str:
     if len(question) < 2:
         return "Please ask a complete question."
 
-    print(f"DEBUG: rag.py calling retrieve_context for: '{question}'", flush=True)
-    
+    cached, version, vector = cached_answer(question)
+    if cached is not None:
+        return cached
+
+    key = f"chat:{version}:{normalize_question(question) or question}"
+    return in_flight.do(key, lambda: _answer(question, version, vector))
+
+
+def _answer(question: str, version: str, vector) -> str:
     print(f"DEBUG: rag.py calling retrieve_context for: '{question}'", flush=True)
     
     context = retrieve_context(question)
 
     # Pass context (even if empty) to the LLM so it can handle greetings/general queries
-    return generate_answer(context or "", question)
+    answer = generate_answer(context or "", question)
+    remember_answer(question, version, vector, answer)
+    return answer
+
+
+def stream_portfolio(question: str):
+    """
+    ask_portfolio() as a generator of text fragments. Cached answers come
+    back as a single fragment; fresh ones are streamed from Claude and only
+    cached once the stream has completed.
+    """
+    question = question.strip()
+
+    if len(question) < 2:
+        yield "Please ask a complete question."
+        return
+
+    cached, version, vector = cached_answer(question)
+    if cached is not None:
+        yield cached
+        return
+
+    context = retrieve_context(question)
 
+    parts = []
+    for text in stream_answer(context or "", question):
+        parts.append(text)
+        yield text
+    remember_answer(question, version, vector, "".join(parts).strip())
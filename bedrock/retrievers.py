@@ -0,0 +1,116 @@
+"""Pluggable retrieval backends for the chatbot, selected with CHAT_RETRIEVER.
+
+    bedrock   the Bedrock knowledge base (default; one network call per question)
+    local     the on-disk vector index from bedrock/vector_index.py, searched
+              in-process; works offline once the index is built
+    hybrid    the same index, with BM25 keyword search fused in and the
+              candidates reranked locally (bedrock/hybrid.py)
+
+Every retriever has `retrieve(question, k)` returning chunk dicts with at
+least "text", best first, and `version()` identifying the indexed content
+(part of the answer cache key, so re-indexing invalidates cached answers).
+"""
+import os
+import threading
+
+from . import kb_retrieve
+from .hybrid import BM25Index, rerank, rrf
+from .vector_index import DEFAULT_INDEX_DIR, VectorIndex
+
+TOP_K = int(os.getenv("CHAT_TOP_K", "5"))
+# How many candidates each ranking contributes to the hybrid fusion
+CANDIDATES = int(os.getenv("CHAT_HYBRID_CANDIDATES", "20"))
+
+
+class BedrockKBRetriever:
+    name = "bedrock"
+
+    def retrieve(self, question, k=TOP_K):
+        return kb_retrieve.retrieve_chunks(question, k)
+
+    def version(self):
+        return kb_retrieve.kb_version()
+
+
+class LocalVectorRetriever:
+    name = "local"
+
+    def __init__(self, index_dir=DEFAULT_INDEX_DIR):
+        self.index = VectorIndex(index_dir)
+
+    def retrieve(self, question, k=TOP_K):
+        return self.index.search(question, k)
+
+    def version(self):
+        return f"local:{self.index.version}"
+
+
+class HybridRetriever(LocalVectorRetriever):
+    name = "hybrid"
+
+    def __init__(self, index_dir=DEFAULT_INDEX_DIR, use_rerank=None):
+        super().__init__(index_dir)
+        self.use_rerank = use_rerank if use_rerank is not None else os.getenv("CHAT_RERANK", "1") != "0"
+        # (index version, BM25Index, chunk position of each BM25 document, sidecar)
+        self._bm25 = None
+        self._lock = threading.Lock()
+
+    def _keyword_index(self):
+        meta, _vectors, live, _embedder = self.index.current()
+        with self._lock:
+            if self._bm25 is None or self._bm25[0] != meta["version"]:
+                positions = [i for i, alive in enumerate(live) if alive]
+                bm25 = BM25Index([meta["chunks"][i]["text"] for i in positions])
+                self._bm25 = (meta["version"], bm25, positions, meta)
+            return self._bm25
+
+    def retrieve(self, question, k=TOP_K):
+        _version, bm25, positions, meta = self._keyword_index()
+        by_id = {}
+        vector_ranking = []
+        for chunk in self.index.search(question, CANDIDATES):
+            chunk["vector_score"] = chunk.pop("score")
+            by_id[chunk["id"]] = chunk
+            vector_ranking.append(chunk["id"])
+        keyword_ranking = []
+        for doc, score in bm25.search(question, CANDIDATES):
+            chunk = meta["chunks"][positions[doc]]
+            by_id.setdefault(chunk["id"], dict(chunk))["bm25"] = score
+            keyword_ranking.append(chunk["id"])
+
+        candidates = [dict(by_id[chunk_id], fused=score)
+                      for chunk_id, score in rrf([vector_ranking, keyword_ranking]).items()]
+        if self.use_rerank:
+            candidates = rerank(question, candidates)
+        for chunk in candidates:
+            chunk["score"] = chunk.get("rerank", chunk["fused"])
+        return candidates[:k]
+
+
+RETRIEVERS = {"bedrock": BedrockKBRetriever, "local": LocalVectorRetriever, "hybrid": HybridRetriever}
+
+_retrievers = {}
+_lock = threading.Lock()
+
+
+def get_retriever(name=None):
+    """Shared retriever for `name` (default: CHAT_RETRIEVER, else bedrock)"""
+    name = (name or os.getenv("CHAT_RETRIEVER", "bedrock")).lower()
+    if name not in RETRIEVERS:
+        raise RuntimeError(f"Unknown CHAT_RETRIEVER '{name}' (expected one of {', '.join(RETRIEVERS)})")
+    with _lock:
+        if name not in _retrievers:
+            _retrievers[name] = RETRIEVERS[name]()
+        return _retrievers[name]
+
+
+def retrieve_chunks(question: str, k: int = TOP_K) -> list:
+    return get_retriever().retrieve(question, k)
+
+
+def retrieve_context(question: str, k: int = TOP_K) -> str:
+    return "\n\n".join(chunk["text"] for chunk in retrieve_chunks(question, k))
+
+
+def kb_version() -> str:
+    return get_retriever().version()
@@ -0,0 +1,163 @@
+"""Answer cache that also matches paraphrased questions.
+
+Each cached question is stored as a unit-length embedding in one NumPy
+matrix; a lookup is a single matrix-vector product (cosine similarity
+against every entry) and the best match is served if it clears
+`threshold`. Sits behind the exact-match bedrock.answer_cache, which
+catches verbatim repeats without computing an embedding.
+
+Embedders (bedrock/embeddings.py):
+    hashing   local and free: hashed word and character n-grams
+    titan     Amazon Titan Text Embeddings on Bedrock, which also
+              matches synonyms ("certs" / "certifications")
+
+Settings: CHAT_SEMANTIC_CACHE=0 turns it off, CHAT_EMBEDDER picks the
+embedder (default "hashing"), CHAT_SEMANTIC_THRESHOLD overrides the
+similarity needed for a hit. Size and TTL follow CHAT_CACHE_SIZE/_TTL.
+"""
+import os
+import threading
+import time
+
+import numpy as np
+
+from .answer_cache import normalize_question
+from .embeddings import EMBEDDERS
+
+
+# Cosine similarity needed for a hit. Hashed n-grams only see shared wording, so
+# the local embedder mostly catches rephrasings that keep the same key terms.
+DEFAULT_THRESHOLDS = {"hashing": 0.95, "titan": 0.9}
+
+# One added "not" barely moves an embedding ("available for hire" vs "not
+# available for hire" scores 0.86 on hashing, over 0.95 for longer questions),
+# so a hit also needs the same negation words as the cached question
+NEGATIONS = frozenset("""
+no not never nor none neither without cannot cant dont doesnt didnt isnt wasnt arent werent
+hasnt havent hadnt wont wouldnt couldnt shouldnt
+""".split())
+
+
+def negations(question):
+    """The negation words in `question`, normalized like the answer cache keys"""
+    return frozenset(word for word in normalize_question(question).split() if word in NEGATIONS)
+
+
+class SemanticCache:
+    def __init__(self, embedder, threshold=0.9, max_entries=512, ttl=86400):
+        self.embedder = embedder
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._vectors = np.zeros((max_entries, embedder.dim), dtype=np.float32)
+        self._answers = [None] * max_entries
+        self._versions = [None] * max_entries
+        self._negations = [None] * max_entries
+        self._created = np.zeros(max_entries, dtype=np.float64)
+        self._used = np.zeros(max_entries, dtype=np.float64)
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.errors = 0
+
+    def embed(self, question):
+        """Embedding of `question`, or None if the embedder failed (treated as a miss)"""
+        try:
+            return self.embedder.embed(question)
+        except Exception as e:
+            self.errors += 1
+            print(f"Semantic cache: could not embed question: {e}", flush=True)
+            return None
+
+    def _live(self, version, now, negated=None):
+        """Boolean mask of filled slots that are fresh, from `version` and (if given) with `negated`"""
+        live = self._created[:self._size] > now - self.ttl
+        for i in np.flatnonzero(live):
+            if self._versions[i] != version or (negated is not None and self._negations[i] != negated):
+                live[i] = False
+        return live
+
+    def get(self, vector, version, question=""):
+        """(answer, similarity) of the closest cached question, or (None, best similarity)"""
+        if vector is None:
+            return None, 0.0
+        negated = negations(question)
+        with self._lock:
+            now = time.time()
+            if self._size:
+                scores = self._vectors[:self._size] @ vector
+                scores[~self._live(version, now, negated)] = -1.0
+                best = int(np.argmax(scores))
+                similarity = float(scores[best])
+                if similarity >= self.threshold:
+                    self._used[best] = now
+                    self.hits += 1
+                    return self._answers[best], similarity
+            else:
+                similarity = 0.0
+            self.misses += 1
+            return None, similarity
+
+    def put(self, vector, version, answer, question=""):
+        if vector is None or not answer:
+            return
+        negated = negations(question)
+        with self._lock:
+            now = time.time()
+            if self._size < self.max_entries:
+                slot = self._size
+                self._size += 1
+            else:
+                # Reuse an expired or outdated slot if there is one, else the least recently used
+                dead = np.flatnonzero(~self._live(version, now))
+                if len(dead):
+                    slot = int(dead[0])
+                else:
+                    slot = int(np.argmin(self._used))
+                    self.evictions += 1
+            self._vectors[slot] = vector
+            self._answers[slot] = answer
+            self._versions[slot] = version
+            self._negations[slot] = negated
+            self._created[slot] = now
+            self._used[slot] = now
+
+    def clear(self):
+        with self._lock:
+            self._size = 0
+            self._answers = [None] * self.max_entries
+            self._versions = [None] * self.max_entries
+            self._negations = [None] * self.max_entries
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "embedder": self.embedder.name,
+                "threshold": self.threshold,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "errors": self.errors,
+                "entries": self._size,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+def from_env():
+    """SemanticCache configured by CHAT_SEMANTIC_* / CHAT_EMBEDDER, or None if disabled"""
+    if os.getenv("CHAT_SEMANTIC_CACHE", "1").lower() in ("0", "false", "no", "off"):
+        return None
+    name = os.getenv("CHAT_EMBEDDER", "hashing").lower()
+    if name not in EMBEDDERS:
+        print(f"Unknown CHAT_EMBEDDER '{name}', using hashing", flush=True)
+        name = "hashing"
+    threshold = float(os.getenv("CHAT_SEMANTIC_THRESHOLD", DEFAULT_THRESHOLDS[name]))
+    return SemanticCache(
+        EMBEDDERS[name](),
+        threshold=threshold,
+        max_entries=int(os.getenv("CHAT_CACHE_SIZE", "512")),
+        ttl=int(os.getenv("CHAT_CACHE_TTL", "86400")),
+    )
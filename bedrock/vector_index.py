@@ -0,0 +1,145 @@
+"""Local vector index over the portfolio chunks (bedrock/chunking.py).
+
+Built and kept up to date by bedrock/indexer.py. On disk (CHAT_INDEX_DIR,
+default <repo>/.chat-index):
+
+    chunks.json        sidecar: embedder, dim, version, vectors file, chunk
+                       metadata and the per-record content-hash manifest
+    vectors-<id>.npy   float32 matrix, row i = unit embedding of chunks[i]
+
+The matrix is opened with mmap_mode="r", so worker processes share the
+page cache instead of each holding a copy. Every write produces a new
+vectors file and then atomically replaces chunks.json; readers notice the
+sidecar changed and reopen. Deleted chunks stay in the matrix as
+tombstones (skipped by search) until the indexer compacts it. Search is an
+exact top-k over one matrix-vector product, which stays well under a
+millisecond at portfolio scale (hundreds of chunks).
+"""
+import hashlib
+import json
+import os
+import threading
+import uuid
+
+import numpy as np
+
+from .embeddings import get_embedder
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_INDEX_DIR = os.getenv("CHAT_INDEX_DIR", os.path.join(BASE_DIR, ".chat-index"))
+SIDECAR_NAME = "chunks.json"
+
+
+def index_version(embedder_name, chunks):
+    """Hash of the searchable content: same live chunks, same version"""
+    digest = hashlib.sha256(embedder_name.encode("utf-8"))
+    for chunk in sorted((c for c in chunks if not c.get("deleted")), key=lambda c: c["id"]):
+        digest.update(f"\0{chunk['id']}\0{chunk['text']}".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def read_index(index_dir):
+    """(sidecar dict, vectors loaded into memory) of the current index, or (None, None)"""
+    try:
+        with open(os.path.join(index_dir, SIDECAR_NAME), encoding="utf-8") as f:
+            meta = json.load(f)
+        return meta, np.load(os.path.join(index_dir, meta["vectors"]))
+    except (OSError, ValueError, KeyError):
+        return None, None
+
+
+def write_index(index_dir, embedder_name, chunks, vectors, records=None):
+    """Atomically publish `chunks` and their `vectors` (row i <-> chunks[i]) as the current index"""
+    os.makedirs(index_dir, exist_ok=True)
+    version = index_version(embedder_name, chunks)
+    # Unique per write: a compacted matrix can have the same version but other rows
+    vectors_name = f"vectors-{uuid.uuid4().hex[:12]}.npy"
+    tmp = os.path.join(index_dir, f".{vectors_name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        np.save(f, np.ascontiguousarray(vectors, dtype=np.float32))
+    os.replace(tmp, os.path.join(index_dir, vectors_name))
+
+    sidecar = {
+        "embedder": embedder_name,
+        "dim": int(vectors.shape[1]) if vectors.ndim == 2 else 0,
+        "version": version,
+        "vectors": vectors_name,
+        "chunks": chunks,
+        "records": records or {},
+    }
+    sidecar_path = os.path.join(index_dir, SIDECAR_NAME)
+    try:
+        with open(sidecar_path, encoding="utf-8") as f:
+            previous = json.load(f).get("vectors")
+    except (OSError, ValueError):
+        previous = None
+    tmp = os.path.join(index_dir, f".{SIDECAR_NAME}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(sidecar, f, ensure_ascii=False)
+    os.replace(tmp, sidecar_path)
+
+    # Keep the previous matrix for readers that loaded the old sidecar a moment
+    # ago; anything older is unreferenced (open mappings survive the unlink)
+    for name in os.listdir(index_dir):
+        if name.startswith("vectors-") and name not in (vectors_name, previous):
+            try:
+                os.remove(os.path.join(index_dir, name))
+            except OSError:
+                pass
+    return version
+
+
+def embed_chunks(embedder, chunks):
+    if not chunks:
+        return np.zeros((0, embedder.dim), dtype=np.float32)
+    return np.vstack([embedder.embed(chunk["text"]) for chunk in chunks]).astype(np.float32)
+
+
+class VectorIndex:
+    def __init__(self, index_dir=DEFAULT_INDEX_DIR):
+        self.index_dir = index_dir
+        self.sidecar_path = os.path.join(index_dir, SIDECAR_NAME)
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._meta = None
+        self._vectors = None
+        self._live = None
+        self._embedder = None
+
+    def _load(self):
+        """(Re)open the index if the sidecar changed since the last load"""
+        try:
+            mtime = os.stat(self.sidecar_path).st_mtime_ns
+        except OSError:
+            raise RuntimeError(f"No vector index at {self.index_dir}; run python -m bedrock.indexer")
+        if mtime == self._mtime:
+            return
+        with open(self.sidecar_path, encoding="utf-8") as f:
+            meta = json.load(f)
+        vectors = np.load(os.path.join(self.index_dir, meta["vectors"]), mmap_mode="r")
+        if self._meta is None or self._meta["embedder"] != meta["embedder"]:
+            self._embedder = get_embedder(meta["embedder"])
+        live = np.array([not chunk.get("deleted") for chunk in meta["chunks"]], dtype=bool)
+        self._meta, self._vectors, self._live, self._mtime = meta, vectors, live, mtime
+
+    def current(self):
+        """(metadata, vectors, live-row mask, embedder) of the latest published index"""
+        with self._lock:
+            self._load()
+            return self._meta, self._vectors, self._live, self._embedder
+
+    @property
+    def version(self):
+        return self.current()[0]["version"]
+
+    def search(self, text, k=5):
+        """Top-`k` chunks for `text`, as chunk dicts with a "score" added"""
+        meta, vectors, live, embedder = self.current()
+        k = min(k, int(live.sum()))
+        if not k:
+            return []
+        scores = vectors @ embedder.embed(text)
+        scores[~live] = -np.inf
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [dict(meta["chunks"][i], score=float(scores[i])) for i in top]
@@ -0,0 +1,172 @@
+"""Single-flight request coalescing.
+
+When many callers ask for the same thing at the same moment (a shared link
+brings in a burst of identical chat questions, or every thread misses the
+same cold cache entry), only the first caller runs the upstream call; the
+others wait for it and receive the same result, or the same exception.
+Nothing is remembered afterwards: caching is the caller's job.
+
+    SingleFlight       coalesces threads of one process
+    FileSingleFlight   additionally coalesces gunicorn workers on one host,
+                       through a lock file per key; the leading worker leaves
+                       its result (JSON) next to the lock for the others
+
+Results are shared between callers, so treat them as read-only.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows dev machines: coalesce within the process only
+    fcntl = None
+
+# Directory for cross-worker lock and result files; unset keeps coalescing per process
+DEFAULT_DIR = os.getenv('COALESCE_DIR') or None
+
+
+class _Call:
+    __slots__ = ('done', 'value', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self):
+        self._calls = {}    # key -> _Call in flight
+        self._lock = threading.Lock()
+        self._stats = {'calls': 0, 'shared': 0}
+
+    def do(self, key, fn):
+        """Return fn(), sharing one run of it between concurrent calls with the same `key`"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._stats['calls'] += 1
+            else:
+                self._stats['shared'] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = self._run(key, fn)
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.value
+
+    def _run(self, key, fn):
+        return fn()
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, in_flight=len(self._calls))
+
+
+class FileSingleFlight(SingleFlight):
+    """
+    SingleFlight across processes: the worker holding the key's lock file runs
+    fn() and writes the result; workers that found the lock taken wait for it
+    and read that result. If the leader failed (no fresh result), a waiting
+    worker runs fn() itself. Values must be JSON-serialisable.
+    """
+
+    def __init__(self, directory, keep=60):
+        super().__init__()
+        self.directory = directory
+        # Result files older than this are deleted by later leaders
+        self.keep = keep
+        self._writes = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _files(self, key):
+        name = hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]
+        base = os.path.join(self.directory, name)
+        return f"{base}.lock", f"{base}.json"
+
+    def _run(self, key, fn):
+        lock_path, result_path = self._files(key)
+        started = time.time()
+        with open(lock_path, 'a') as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                # Another worker is on it: wait for it to finish, then read its result
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+                found, value = self._read(result_path, started)
+                if found:
+                    with self._lock:
+                        self._stats['shared'] += 1
+                    return value
+                return fn()
+            try:
+                value = fn()
+                self._write(result_path, value)
+                return value
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self, path, since):
+        """(True, value) if `path` was written after `since`, else (False, None)"""
+        try:
+            if os.stat(path).st_mtime < since:
+                return False, None
+            with open(path, encoding='utf-8') as f:
+                return True, json.load(f)
+        except (OSError, ValueError):
+            return False, None
+
+    def _write(self, path, value):
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(value, f)
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Failed to share coalesced result: {e}")
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return
+        self._writes += 1
+        if self._writes % 100 == 0:
+            self._prune()
+
+    def _prune(self):
+        cutoff = time.time() - self.keep
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            path = os.path.join(self.directory, name)
+            try:
+                if name.endswith('.json') and os.stat(path).st_mtime < cutoff:
+                    os.remove(path)
+            except OSError:
+                pass
+
+
+def single_flight(directory=DEFAULT_DIR):
+    """FileSingleFlight in `directory` where fcntl is available, else a per-process SingleFlight"""
+    if directory and fcntl:
+        return FileSingleFlight(directory)
+    return SingleFlight()
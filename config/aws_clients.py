@@ -0,0 +1,51 @@
+import os
+import threading
+
+import boto3
+from botocore.config import Config
+
+REGION = os.getenv("AWS_REGION", "us-east-2")
+
+# One tuned config for every client: enough pooled connections for the
+# worker's threads, bounded waits, and client-side rate adaptation on throttling
+CLIENT_CONFIG = Config(
+    max_pool_connections=int(os.getenv("AWS_MAX_POOL_CONNECTIONS", "10")),
+    connect_timeout=float(os.getenv("AWS_CONNECT_TIMEOUT", "3")),
+    read_timeout=float(os.getenv("AWS_READ_TIMEOUT", "30")),
+    retries={"mode": "adaptive", "total_max_attempts": int(os.getenv("AWS_MAX_ATTEMPTS", "3"))},
+)
+
+_lock = threading.Lock()
+_pid = None
+_session = None
+_clients = {}
+
+
+def get_client(service: str, region: str = None):
+    """
+    Shared boto3 client for `service`, created on first use.
+
+    Clients are thread-safe once built, but building one (loading the
+    service model, resolving credentials) is slow and boto3 sessions are
+    not thread-safe, so creation happens once per process under a lock.
+    After a fork (gunicorn --preload) the child starts a fresh session
+    instead of sharing the parent's connection pools.
+    """
+    global _pid, _session
+    key = (service, region or REGION)
+    pid = os.getpid()
+    if _pid == pid:
+        client = _clients.get(key)
+        if client is not None:
+            return client
+
+    with _lock:
+        if _pid != pid:
+            _pid = pid
+            _session = boto3.session.Session()
+            _clients.clear()
+        client = _clients.get(key)
+        if client is None:
+            client = _session.client(service, region_name=key[1], config=CLIENT_CONFIG)
+            _clients[key] = client
+        return client
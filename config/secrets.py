@@ -1,14 +1,15 @@
-import boto3
 import os
 import logging
 
+from config.aws_clients import get_client
+
 log = logging.getLogger(__name__)
 
 SSM_PATH = "/myportfolio/"
 
 def load_secrets():
     try:
-        ssm = boto3.client("ssm", region_name=os.getenv("AWS_REGION", "us-east-2"))
+        ssm = get_client("ssm")
 
         response = ssm.get_parameters_by_path(
             Path=SSM_PATH,
@@ -7,6 +7,15 @@ git pull origin main
 source .venv/bin/activate
 pip install -r requirements.txt
 
+# Responsive WebP/AVIF image variants, the bundled/minified CSS and JS served by
+# PortfolioMain, then .gz/.br variants of the text assets
+python -m frontend.images
+python -m frontend.bundle
+python -m frontend.compress
+
+# Chatbot vector index, used when CHAT_RETRIEVER=local (a failed build keeps the old index)
+python -m bedrock.indexer || echo "Vector index build failed; keeping the previous index"
+
 #git reset --hard
 #git clean -fd
 #git pull origin main
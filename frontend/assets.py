@@ -0,0 +1,110 @@
+"""Content-hash fingerprinting for files under a static folder.
+
+Every file gets a versioned name with a short hash of its bytes inserted
+before the extension (assets/css/main.css -> assets/css/main.3f9a1c2b7d.css),
+so a URL changes exactly when the file does and can be cached forever.
+"""
+import hashlib
+import mimetypes
+import os
+
+from flask import current_app, request, send_from_directory
+
+from frontend import compress
+
+# One year, the conventional "forever" for immutable assets
+IMMUTABLE_MAX_AGE = 31536000
+
+# Source maps are looked up by relative name from the file that references them;
+# .gz/.br are served in place of their original, never requested by name
+UNVERSIONED_SUFFIXES = ('.map',) + compress.VARIANT_SUFFIXES
+
+
+def file_hash(path, length=10):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(64 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()[:length]
+
+
+def fingerprinted_name(filename, digest):
+    """'assets/css/main.css' + 'abc' -> 'assets/css/main.abc.css'"""
+    root, ext = os.path.splitext(filename)
+    return f"{root}.{digest}{ext}"
+
+
+class AssetManifest:
+    def __init__(self, static_dir, files):
+        self.static_dir = static_dir
+        self.files = files  # original relative path -> fingerprinted relative path
+        self._originals = {v: k for k, v in files.items()}
+        self.version = hashlib.sha256(
+            ''.join(sorted(files.values())).encode('utf-8')).hexdigest()[:16]
+
+    @classmethod
+    def build(cls, static_dir):
+        files = {}
+        for root, _dirs, names in os.walk(static_dir):
+            for name in names:
+                if name.endswith(UNVERSIONED_SUFFIXES):
+                    continue
+                full = os.path.join(root, name)
+                rel = os.path.relpath(full, static_dir).replace(os.sep, '/')
+                files[rel] = fingerprinted_name(rel, file_hash(full))
+        return cls(static_dir, files)
+
+    def url_path(self, filename):
+        """Versioned name for `filename`, or `filename` itself if it is not in the manifest"""
+        return self.files.get(filename.lstrip('/'), filename)
+
+    def original(self, versioned):
+        """Original relative path for a versioned name, or None"""
+        return self._originals.get(versioned)
+
+
+def url_defaults(manifest):
+    """Flask url_defaults callback that rewrites url_for('static', filename=...)"""
+    def add_fingerprint(endpoint, values):
+        # In debug the files change under a running server, so keep plain URLs there
+        if endpoint == 'static' and 'filename' in values and not current_app.debug:
+            values['filename'] = manifest.url_path(values['filename'])
+    return add_fingerprint
+
+
+def install(app, manifest=None):
+    """Fingerprint url_for('static', ...) URLs and serve them as immutable.
+
+    The manifest is built once at startup. Requests for a versioned name are
+    served from the original file with a one-year immutable Cache-Control;
+    anything else keeps Flask's normal caching. Either way, a precompressed
+    .br/.gz sibling (python -m frontend.compress) is sent when the client
+    accepts it.
+    """
+    manifest = manifest or AssetManifest.build(app.static_folder)
+    app.url_defaults(url_defaults(manifest))
+
+    def static(filename):
+        original = manifest.original(filename)
+        path = original or filename
+        max_age = IMMUTABLE_MAX_AGE if original else None
+
+        variants = compress.available_variants(os.path.join(app.static_folder, *path.split('/')))
+        encoding = compress.pick_encoding(request, variants)
+        if encoding:
+            suffix = os.path.splitext(variants[encoding])[1]
+            response = send_from_directory(app.static_folder, path + suffix, max_age=max_age,
+                                           mimetype=mimetypes.guess_type(path)[0])
+            response.content_encoding = encoding
+        else:
+            response = send_from_directory(app.static_folder, path, max_age=max_age)
+        if variants:
+            response.vary.add('Accept-Encoding')
+        if original:
+            response.cache_control.public = True
+            response.cache_control.immutable = True
+        return response
+
+    app.view_functions['static'] = static
+    app.extensions['asset_manifest'] = manifest
+    return manifest
@@ -0,0 +1,447 @@
+"""Concatenate and minify the public page's CSS and JS into one file each.
+
+    python -m frontend.bundle            (from the repository root)
+
+Writes static/dist/bundle.css and static/dist/bundle.js plus a source map
+next to each. Bootstrap's stylesheet is purged of rules whose classes
+appear nowhere in the template or the bundled scripts. index.html uses the
+bundles whenever they exist (see PortfolioMain/app.py); without them it
+falls back to the individual files.
+
+The minifiers are deliberately conservative: they only drop comments and
+redundant whitespace. JavaScript keeps its line breaks so automatic
+semicolon insertion behaves exactly as before, and files that are already
+minified are passed through untouched.
+"""
+import bisect
+import json
+import os
+import re
+import sys
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STATIC_DIR = os.path.join(BASE_DIR, 'PortfolioMain', 'static')
+TEMPLATES = [os.path.join(BASE_DIR, 'PortfolioMain', 'templates', 'index.html')]
+
+# Same order as the <link>/<script> tags they replace in index.html
+CSS_SOURCES = [
+    'assets/vendor/bootstrap/css/bootstrap.min.css',
+    'assets/vendor/bootstrap-icons/bootstrap-icons.css',
+    'assets/vendor/aos/aos.css',
+    'assets/vendor/glightbox/css/glightbox.min.css',
+    'assets/vendor/swiper/swiper-bundle.min.css',
+    'assets/css/main.css',
+]
+JS_SOURCES = [
+    'assets/vendor/bootstrap/js/bootstrap.bundle.min.js',
+    'assets/vendor/php-email-form/validate.js',
+    'assets/vendor/aos/aos.js',
+    'assets/vendor/typed.js/typed.umd.js',
+    'assets/vendor/purecounter/purecounter_vanilla.js',
+    'assets/vendor/waypoints/noframework.waypoints.js',
+    'assets/vendor/isotope-layout/isotope.pkgd.min.js',
+    'assets/vendor/imagesloaded/imagesloaded.pkgd.min.js',
+    'assets/vendor/glightbox/js/glightbox.min.js',
+    'assets/vendor/swiper/swiper-bundle.min.js',
+    'assets/js/main.js',
+]
+# Only Bootstrap ships thousands of utility classes we never use
+PURGE_CSS = {'assets/vendor/bootstrap/css/bootstrap.min.css'}
+# State classes toggled at runtime under names built from other strings
+PURGE_SAFELIST = {'show', 'showing', 'active', 'collapsed', 'collapsing', 'fade', 'was-validated'}
+
+CSS_BUNDLE = 'dist/bundle.css'
+JS_BUNDLE = 'dist/bundle.js'
+
+SOURCE_MAP_COMMENT = re.compile(r'^\s*(//[#@] sourceMappingURL=.*|/\*[#@] sourceMappingURL=.*\*/)\s*$')
+
+
+# ---------- Source maps ----------
+
+_B64 = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'
+
+
+def vlq(value):
+    """Base64 VLQ encoding used by source map v3 mappings"""
+    value = (-value << 1) | 1 if value < 0 else value << 1
+    out = ''
+    while True:
+        digit = value & 31
+        value >>= 5
+        out += _B64[digit | 32 if value else digit]
+        if not value:
+            return out
+
+
+class SourceMap:
+    """Line-level map: every generated line points at one (source, line)"""
+
+    def __init__(self, sources):
+        self.sources = sources
+        self.lines = []  # (source index, 0-based source line) or None
+
+    def add(self, source, line):
+        self.lines.append((source, line) if source is not None else None)
+
+    def to_json(self, file):
+        mappings, prev_src, prev_line = [], 0, 0
+        for entry in self.lines:
+            if entry is None:
+                mappings.append('')
+                continue
+            src, line = entry
+            mappings.append(vlq(0) + vlq(src - prev_src) + vlq(line - prev_line) + vlq(0))
+            prev_src, prev_line = src, line
+        return json.dumps({'version': 3, 'file': file, 'sources': self.sources,
+                           'names': [], 'mappings': ';'.join(mappings)})
+
+
+# ---------- JavaScript ----------
+
+_REGEX_PREFIX = set('(,=:[!&|?{};+-*%<>~^')
+_REGEX_KEYWORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new',
+                   'delete', 'void', 'throw', 'instanceof', 'yield', 'await'}
+
+
+def is_minified(text):
+    return any(len(line) > 500 for line in text.splitlines())
+
+
+def _regex_allowed(out):
+    """Whether a '/' after the emitted text `out` starts a regex literal"""
+    stripped = out.rstrip()
+    if not stripped:
+        return True
+    if stripped[-1] in _REGEX_PREFIX:
+        return True
+    word = re.search(r'[A-Za-z_$]+$', stripped)
+    return bool(word) and word.group() in _REGEX_KEYWORDS
+
+
+def minify_js(text):
+    """[(line, 0-based source line)] with comments and redundant whitespace removed"""
+    if is_minified(text):
+        return [(line.rstrip(), n) for n, line in enumerate(text.split('\n'))
+                if line.strip() and not SOURCE_MAP_COMMENT.match(line)]
+
+    lines, buf = [], []
+    src_line, line_start = 0, 0
+    i, n = 0, len(text)
+    verbatim = False  # buf starts inside a string literal: keep its leading whitespace
+
+    def newline():
+        nonlocal verbatim
+        line = ''.join(buf)
+        line = line.rstrip() if verbatim else line.strip()
+        if line:
+            lines.append((line, line_start))
+        buf.clear()
+        verbatim = False
+
+    while i < n:
+        c = text[i]
+        nxt = text[i + 1] if i + 1 < n else ''
+        if c == '\n':
+            newline()
+            src_line += 1
+            line_start = src_line
+            i += 1
+        elif c in ' \t\r':
+            if buf and buf[-1] != ' ':
+                buf.append(' ')
+            i += 1
+        elif c in '"\'`':
+            j = i + 1
+            while j < n and text[j] != c:
+                j += 2 if text[j] == '\\' else 1
+            literal = text[i:j + 1]
+            if '\n' in literal:
+                # Template literal or backslash-continued string spanning lines:
+                # emit it verbatim, line by line
+                parts = literal.split('\n')
+                buf.append(parts[0])
+                for part in parts[1:]:
+                    line = ''.join(buf)
+                    lines.append((line if verbatim else line.lstrip(), line_start))
+                    buf.clear()
+                    verbatim = True
+                    src_line += 1
+                    line_start = src_line
+                    buf.append(part)
+            else:
+                buf.append(literal)
+            i = j + 1
+        elif c == '/' and nxt == '/':
+            while i < n and text[i] != '\n':
+                i += 1
+        elif c == '/' and nxt == '*':
+            end = text.find('*/', i + 2)
+            end = n if end == -1 else end + 2
+            comment = text[i:end]
+            if comment.startswith('/*!'):
+                # Keep license banners, one per line
+                for k, part in enumerate(comment.split('\n')):
+                    if k:
+                        newline()
+                        src_line += 1
+                        line_start = src_line
+                    buf.append(part.strip())
+            elif '\n' in comment:
+                # A multi-line comment counts as a line terminator for ASI
+                newline()
+                src_line += comment.count('\n')
+                line_start = src_line
+            elif buf and buf[-1] != ' ':
+                buf.append(' ')
+            i = end
+        elif c == '/' and _regex_allowed(''.join(buf)):
+            j, in_class = i + 1, False
+            while j < n and text[j] != '\n':
+                if text[j] == '\\':
+                    j += 2
+                    continue
+                if text[j] == '[':
+                    in_class = True
+                elif text[j] == ']':
+                    in_class = False
+                elif text[j] == '/' and not in_class:
+                    break
+                j += 1
+            j += 1
+            while j < n and (text[j].isalpha()):
+                j += 1
+            buf.append(text[i:j])
+            i = j
+        else:
+            buf.append(c)
+            i += 1
+    newline()
+    return lines
+
+
+# ---------- CSS ----------
+
+_CSS_STRING = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'')
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_CSS_URL = re.compile(r'url\(\s*([\'"]?)([^\'")]+)\1\s*\)')
+_CLASS = re.compile(r'\.(-?[_a-zA-Z][_a-zA-Z0-9-]*)')
+# :not(...) names classes that must be absent, so they never make a selector unused
+_NEGATION = re.compile(r':not\([^()]*\)')
+# At-rules whose block holds further rules (everything else is kept verbatim)
+_NESTING_AT_RULES = ('@media', '@supports', '@container', '@layer')
+
+
+def _outside_strings(text, fn):
+    """Apply `fn` to the parts of `text` that are not inside CSS string literals"""
+    out, pos = [], 0
+    for m in _CSS_STRING.finditer(text):
+        out.append(fn(text[pos:m.start()]))
+        out.append(m.group())
+        pos = m.end()
+    out.append(fn(text[pos:]))
+    return ''.join(out)
+
+
+def _squeeze(text):
+    def squeeze(part):
+        part = re.sub(r'\s+', ' ', part)
+        return re.sub(r'\s*([{};,>~])\s*', r'\1', part)
+    return _outside_strings(text, squeeze).strip()
+
+
+def _squeeze_declarations(body):
+    body = _squeeze(body)
+    body = _outside_strings(body, lambda part: re.sub(r'\s*:\s*', ':', part))
+    return body.rstrip(';')
+
+
+def _find_block_end(text, i):
+    """Index of the '}' closing the block that starts after text[i - 1] == '{'"""
+    depth = 1
+    while i < len(text):
+        c = text[i]
+        if c in '"\'':
+            m = _CSS_STRING.match(text, i)
+            i = m.end() if m else i + 1
+            continue
+        if c == '{':
+            depth += 1
+        elif c == '}':
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    return len(text)
+
+
+def parse_css(text, offset=0):
+    """Nodes as dicts: {'kind': 'rule'|'at', 'prelude', 'body'|'children', 'pos'}"""
+    nodes, i = [], 0
+    while i < len(text):
+        while i < len(text) and text[i].isspace():
+            i += 1
+        if i >= len(text):
+            break
+        start = i
+        while i < len(text) and text[i] not in '{;':
+            if text[i] in '"\'':
+                m = _CSS_STRING.match(text, i)
+                i = m.end() if m else i + 1
+            else:
+                i += 1
+        prelude = text[start:i].strip()
+        if i >= len(text) or text[i] == ';':
+            if prelude:
+                nodes.append({'kind': 'at', 'prelude': prelude, 'body': None, 'pos': offset + start})
+            i += 1
+            continue
+        end = _find_block_end(text, i + 1)
+        inner = text[i + 1:end]
+        if prelude.startswith(_NESTING_AT_RULES):
+            nodes.append({'kind': 'at', 'prelude': prelude, 'pos': offset + start,
+                          'children': parse_css(inner, offset + i + 1)})
+        elif prelude.startswith('@'):
+            nodes.append({'kind': 'at', 'prelude': prelude, 'body': inner, 'pos': offset + start})
+        else:
+            nodes.append({'kind': 'rule', 'prelude': prelude, 'body': inner, 'pos': offset + start})
+        i = end + 1
+    return nodes
+
+
+def split_selectors(selector):
+    """Split a selector list at top-level commas (not inside :is(...) etc.)"""
+    parts, depth, start = [], 0, 0
+    for i, c in enumerate(selector):
+        if c in '([':
+            depth += 1
+        elif c in ')]':
+            depth -= 1
+        elif c == ',' and depth == 0:
+            parts.append(selector[start:i])
+            start = i + 1
+    parts.append(selector[start:])
+    return [p.strip() for p in parts if p.strip()]
+
+
+def purge(nodes, used):
+    """Drop selectors whose classes are not all in `used`, and rules left empty"""
+    kept = []
+    for node in nodes:
+        if node['kind'] == 'rule':
+            bare = _CSS_STRING.sub('""', node['prelude'])
+            selectors = [s for s, b in zip(split_selectors(node['prelude']), split_selectors(bare))
+                         if all(cls in used for cls in _CLASS.findall(_NEGATION.sub('', b)))]
+            if selectors:
+                kept.append(dict(node, prelude=','.join(selectors)))
+        elif 'children' in node:
+            children = purge(node['children'], used)
+            if children:
+                kept.append(dict(node, children=children))
+        else:
+            kept.append(node)
+    return kept
+
+
+def serialize_css(nodes):
+    """Minified text of each top-level node, with its position in the source"""
+    def text(node):
+        prelude = _squeeze(node['prelude'])
+        if 'children' in node:
+            return prelude + '{' + ''.join(text(child) for child in node['children']) + '}'
+        if node['body'] is None:
+            return prelude + ';'
+        if node['kind'] == 'rule' or prelude.startswith(('@font-face', '@page')):
+            return prelude + '{' + _squeeze_declarations(node['body']) + '}'
+        return prelude + '{' + _squeeze(node['body']) + '}'
+    return [(text(node), node['pos']) for node in nodes]
+
+
+def rewrite_urls(css, source, bundle):
+    """Re-point relative url(...) references from `source`'s folder to `bundle`'s"""
+    src_dir = os.path.dirname(source)
+    out_dir = os.path.dirname(bundle)
+
+    def fix(m):
+        quote, url = m.group(1), m.group(2).strip()
+        if url.startswith(('data:', '/', '#')) or '://' in url:
+            return m.group()
+        path, sep, query = url.partition('?')
+        target = os.path.normpath(os.path.join(src_dir, path)).replace(os.sep, '/')
+        rel = os.path.relpath(target, out_dir or '.').replace(os.sep, '/')
+        return f'url({quote}{rel}{sep}{query}{quote})'
+    return _CSS_URL.sub(fix, css)
+
+
+def minify_css(text, source, bundle, used=None):
+    """[(line, 0-based source line)], one top-level rule per line"""
+    # Blank out comments but keep their newlines so positions still map to lines
+    original = rewrite_urls(text, source, bundle)
+    text = _CSS_COMMENT.sub(lambda m: '\n' * m.group().count('\n'), original)
+    newlines = [m.start() for m in re.finditer('\n', text)]
+    nodes = parse_css(text)
+    if used is not None:
+        nodes = purge(nodes, used)
+    lines = [(line, bisect.bisect_left(newlines, pos)) for line, pos in serialize_css(nodes)]
+    if sum(len(line) + 1 for line, _ in lines) >= len(original):
+        # Already minified on one line: one rule per line would only add newlines
+        return [(line.rstrip(), n) for n, line in enumerate(original.split('\n'))
+                if line.strip() and not SOURCE_MAP_COMMENT.match(line)]
+    return lines
+
+
+# ---------- Build ----------
+
+def used_tokens(paths):
+    """Every identifier-like token in the given files (PurgeCSS-style extraction)"""
+    tokens = set(PURGE_SAFELIST)
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            tokens.update(re.findall(r'[A-Za-z0-9_-]+', f.read()))
+    return tokens
+
+
+def write_bundle(static_dir, bundle, sources, minify, comment):
+    out_path = os.path.join(static_dir, *bundle.split('/'))
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    map_name = os.path.basename(bundle) + '.map'
+    rel_sources = [os.path.relpath(os.path.join(static_dir, s), os.path.dirname(out_path)).replace(os.sep, '/')
+                   for s in sources]
+    smap = SourceMap(rel_sources)
+    out = []
+    for index, source in enumerate(sources):
+        with open(os.path.join(static_dir, *source.split('/')), encoding='utf-8') as f:
+            text = f.read()
+        for line, src_line in minify(text, source):
+            out.append(line)
+            smap.add(index if src_line is not None else None, src_line)
+    out.append(comment.format(map_name))
+    smap.add(None, 0)
+    with open(out_path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(out) + '\n')
+    with open(out_path + '.map', 'w', encoding='utf-8') as f:
+        f.write(smap.to_json(os.path.basename(bundle)))
+    return out_path
+
+
+def build(static_dir=STATIC_DIR, templates=TEMPLATES):
+    """Write the CSS and JS bundles; returns their paths"""
+    used = used_tokens(list(templates) + [os.path.join(static_dir, *s.split('/')) for s in JS_SOURCES])
+
+    def css(text, source):
+        return minify_css(text, source, CSS_BUNDLE, used if source in PURGE_CSS else None)
+
+    def js(text, source):
+        # A lone ';' between files stops one file's trailing expression from
+        # being called by the next file's leading '('
+        return minify_js(text) + [(';', None)]
+
+    return [
+        write_bundle(static_dir, CSS_BUNDLE, CSS_SOURCES, css, '/*# sourceMappingURL={} */'),
+        write_bundle(static_dir, JS_BUNDLE, JS_SOURCES, js, '//# sourceMappingURL={}'),
+    ]
+
+
+if __name__ == '__main__':
+    for path in build():
+        print(f"Wrote {path} ({os.path.getsize(path)} bytes)")
+    sys.exit(0)
@@ -0,0 +1,102 @@
+"""Precompressed (gzip + brotli) variants of static files and rendered pages.
+
+    python -m frontend.compress [DIR ...]     (default: PortfolioMain/static)
+
+Writes a .gz and, when the optional `brotli` package is installed, a .br
+sibling next to every compressible file, at maximum compression. Serving
+code then picks the best variant the client accepts instead of sending
+the uncompressed bytes or compressing on every request.
+"""
+import gzip
+import os
+import sys
+
+try:
+    import brotli
+except ImportError:  # optional: gzip alone still works
+    brotli = None
+
+COMPRESSIBLE_SUFFIXES = ('.css', '.js', '.map', '.svg', '.json', '.txt', '.html', '.xml')
+# Below this, compression saves less than the extra header costs
+MIN_SIZE = 1024
+
+# Content-Encoding -> file suffix, in order of preference
+ENCODINGS = [('br', '.br'), ('gzip', '.gz')] if brotli else [('gzip', '.gz')]
+VARIANT_SUFFIXES = ('.br', '.gz')
+
+
+def compress(data, encoding):
+    if encoding == 'br':
+        return brotli.compress(data, quality=11)
+    # mtime=0 keeps the output (and so its ETag) identical across builds
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def is_compressible(path):
+    return path.endswith(COMPRESSIBLE_SUFFIXES)
+
+
+def precompress_file(path):
+    """Write missing or outdated variants of `path`; returns how many were written"""
+    if not is_compressible(path) or os.path.getsize(path) < MIN_SIZE:
+        return 0
+    written = 0
+    mtime = os.path.getmtime(path)
+    data = None
+    for encoding, suffix in ENCODINGS:
+        target = path + suffix
+        if os.path.exists(target) and os.path.getmtime(target) >= mtime:
+            continue
+        if data is None:
+            with open(path, 'rb') as f:
+                data = f.read()
+        packed = compress(data, encoding)
+        if len(packed) >= len(data):
+            continue
+        with open(target, 'wb') as f:
+            f.write(packed)
+        written += 1
+    return written
+
+
+def precompress_dir(root):
+    written = 0
+    for dirpath, _dirs, names in os.walk(root):
+        for name in names:
+            written += precompress_file(os.path.join(dirpath, name))
+    return written
+
+
+def pick_encoding(request, available):
+    """Best encoding in `available` that the request's Accept-Encoding allows"""
+    accepted = request.accept_encodings
+    for encoding, _suffix in ENCODINGS:
+        if encoding in available and accepted[encoding] > 0:
+            return encoding
+    return None
+
+
+def available_variants(path):
+    """Encodings with an up-to-date precompressed sibling of `path`"""
+    if not is_compressible(path):
+        return {}
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return {}
+    found = {}
+    for encoding, suffix in ENCODINGS:
+        try:
+            if os.path.getmtime(path + suffix) >= mtime:
+                found[encoding] = path + suffix
+        except OSError:
+            pass
+    return found
+
+
+if __name__ == '__main__':
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    roots = sys.argv[1:] or [os.path.join(base_dir, 'PortfolioMain', 'static')]
+    for root in roots:
+        print(f"{root}: {precompress_dir(root)} variants written"
+              + ('' if brotli else ' (gzip only: install brotli for .br)'))
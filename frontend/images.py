@@ -0,0 +1,124 @@
+"""Responsive image variants: resized, metadata-free WebP (and AVIF) copies.
+
+    python -m frontend.images [DIR]     (default: PortfolioMain/static/assets/img)
+
+For every JPEG/PNG/WebP under DIR, writes `<name>-<width>w.webp` (and
+`.avif` when Pillow was built with AVIF support) next to the original for
+each width in WIDTHS that is smaller than the original, plus one at the
+original width. The batch run records what it made in `variants.json` in
+DIR; images uploaded through the admin app store the same structure on
+their Firebase record instead. Templates turn either into
+<source srcset> entries via `image_sources()`.
+
+Pillow is optional: without it nothing is generated and pages fall back to
+the original <img>.
+"""
+import json
+import os
+import re
+import sys
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:
+    Image = None
+
+WIDTHS = (320, 640, 960, 1440)
+SOURCE_SUFFIXES = ('.jpg', '.jpeg', '.png', '.webp')
+VARIANT_NAME = re.compile(r'-\d+w\.(webp|avif)$')
+MANIFEST_NAME = 'variants.json'
+
+# Preferred first; browsers take the first <source> whose type they support
+FORMATS = [('avif', 'image/avif', {'quality': 50}),
+           ('webp', 'image/webp', {'quality': 80, 'method': 6})]
+
+
+def available_formats():
+    if Image is None:
+        return []
+    return [fmt for fmt in FORMATS if features.check(fmt[0])]
+
+
+def is_source_image(name):
+    return name.lower().endswith(SOURCE_SUFFIXES) and not VARIANT_NAME.search(name)
+
+
+def generate_variants(path, static_dir):
+    """Write resized variants of the image at `path`.
+
+    Returns {'width', 'height', <format>: [{'w': width, 'src': path}, ...]}
+    with `src` relative to `static_dir`, or {} if nothing could be made.
+    """
+    formats = available_formats()
+    if not formats:
+        return {}
+    try:
+        with Image.open(path) as im:
+            # Apply the EXIF rotation before it is stripped along with the rest of the metadata
+            im = ImageOps.exif_transpose(im)
+            im = im.convert('RGBA' if im.mode in ('RGBA', 'LA', 'P') else 'RGB')
+            width, height = im.size
+            widths = sorted({w for w in WIDTHS if w < width} | {width})
+            root = os.path.splitext(path)[0]
+            result = {'width': width, 'height': height}
+            for name, _mime, options in formats:
+                entries = []
+                for w in widths:
+                    target = f"{root}-{w}w.{name}"
+                    if not os.path.exists(target) or os.path.getmtime(target) < os.path.getmtime(path):
+                        resized = im if w == width else im.resize((w, round(height * w / width)), Image.LANCZOS)
+                        # No exif/icc_profile arguments: the variants carry no metadata
+                        resized.save(target, name.upper(), **options)
+                    rel = os.path.relpath(target, static_dir).replace(os.sep, '/')
+                    entries.append({'w': w, 'src': rel})
+                result[name] = entries
+            return result
+    except (OSError, ValueError) as e:
+        print(f"Could not generate image variants for {path}: {e}")
+        return {}
+
+
+def build_variants(img_dir, static_dir):
+    """Batch-generate variants for every image under `img_dir` and write its manifest"""
+    manifest = {}
+    for dirpath, _dirs, names in os.walk(img_dir):
+        for name in sorted(names):
+            if not is_source_image(name):
+                continue
+            path = os.path.join(dirpath, name)
+            variants = generate_variants(path, static_dir)
+            if variants:
+                manifest[os.path.relpath(path, static_dir).replace(os.sep, '/')] = variants
+    with open(os.path.join(img_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    return manifest
+
+
+def load_variants(img_dir):
+    """Manifest written by build_variants(), or {} if the batch has not run"""
+    try:
+        with open(os.path.join(img_dir, MANIFEST_NAME), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def image_sources(variants, url_for):
+    """[(mime type, srcset)] for <picture><source> elements, best format first"""
+    sources = []
+    for name, mime, _options in FORMATS:
+        entries = (variants or {}).get(name)
+        if entries:
+            srcset = ', '.join(f"{url_for('static', filename=e['src'])} {e['w']}w" for e in entries)
+            sources.append((mime, srcset))
+    return sources
+
+
+if __name__ == '__main__':
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    static_dir = os.path.join(base_dir, 'PortfolioMain', 'static')
+    img_dir = sys.argv[1] if len(sys.argv) > 1 else os.path.join(static_dir, 'assets', 'img')
+    if not available_formats():
+        sys.exit("Pillow with WebP support is required: pip install Pillow")
+    manifest = build_variants(img_dir, static_dir)
+    print(f"Variants for {len(manifest)} images recorded in {os.path.join(img_dir, MANIFEST_NAME)}")
@@ -0,0 +1,97 @@
+"""Cache of fully rendered pages keyed by a hash of the data they were built from.
+
+A page is rendered once per distinct content version and its bytes are
+reused until the data changes. Responses carry a strong ETag (the version)
+and Last-Modified (when that version was first rendered) so browsers and
+proxies can revalidate with a conditional GET and get a 304. Compressed
+copies of the body are made once per version and kept with it.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+from flask import current_app
+
+from frontend import compress
+
+
+class CachedPage:
+    def __init__(self, body, version, last_modified):
+        self.body = body
+        self.version = version
+        self.last_modified = last_modified
+        self._encoded = {}
+
+    def encoded(self, encoding):
+        """Body compressed with `encoding`, computed on first use"""
+        if encoding not in self._encoded:
+            self._encoded[encoding] = compress.compress(self.body, encoding)
+        return self._encoded[encoding]
+
+
+def content_version(source, salt=''):
+    """Stable hash of JSON-like data (dict order does not matter)"""
+    digest = hashlib.sha256(salt.encode('utf-8'))
+    digest.update(json.dumps(source, sort_keys=True, separators=(',', ':'), default=str).encode('utf-8'))
+    return digest.hexdigest()[:32]
+
+
+class RenderCache:
+    def __init__(self, salt='', max_entries=4):
+        # Mixed into every version, e.g. a hash of the template source, so a
+        # deploy that only changes markup still produces new ETags
+        self.salt = salt
+        self.max_entries = max_entries
+        self._pages = OrderedDict()  # version -> CachedPage
+        self._lock = threading.Lock()
+        # The read cache hands back the same object until the data changes,
+        # so hashing can be skipped when we see the last source again
+        self._last_source = None
+        self._last_version = None
+
+    def version_of(self, source):
+        with self._lock:
+            if source is self._last_source and self._last_version is not None:
+                return self._last_version
+        version = content_version(source, self.salt)
+        with self._lock:
+            self._last_source, self._last_version = source, version
+        return version
+
+    def page(self, source, render):
+        """CachedPage for `source`, calling `render()` only for an unseen version"""
+        version = self.version_of(source)
+        with self._lock:
+            page = self._pages.get(version)
+            if page is not None:
+                self._pages.move_to_end(version)
+                return page
+
+        body = render()
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        page = CachedPage(body, version, datetime.now(timezone.utc).replace(microsecond=0))
+        with self._lock:
+            self._pages[version] = page
+            while len(self._pages) > self.max_entries:
+                self._pages.popitem(last=False)
+        return page
+
+    def respond(self, page, request):
+        """Response for `page`, downgraded to 304 when the client's copy is current"""
+        encoding = compress.pick_encoding(request, [name for name, _suffix in compress.ENCODINGS])
+        if encoding:
+            response = current_app.response_class(page.encoded(encoding), mimetype='text/html')
+            response.content_encoding = encoding
+            # Each representation needs its own strong validator
+            response.set_etag(f"{page.version}-{encoding}")
+        else:
+            response = current_app.response_class(page.body, mimetype='text/html')
+            response.set_etag(page.version)
+        response.vary.add('Accept-Encoding')
+        response.last_modified = page.last_modified
+        # Let browsers keep the page but revalidate it on every visit
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
@@ -0,0 +1,144 @@
+"""Read-through cache for Firebase Realtime Database GETs.
+
+Entries are keyed by database path. Each path has a TTL; once it expires
+the entry is still served for `stale_ttl` more seconds while a background
+thread refreshes it (stale-while-revalidate), and it is also served if the
+refresh fails (stale-if-error). Memory is bounded with LRU eviction.
+
+Cached values are shared between requests: callers must treat them as
+read-only.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from rtdb.snapshot import join_path, split_path
+
+
+def cache_key(path, query=None):
+    """Normalised key for a path plus optional query string"""
+    key = join_path(split_path(path))
+    return f"{key}?{query}" if query else key
+
+
+def _key_parts(key):
+    return split_path(key.split('?', 1)[0])
+
+
+class ReadCache:
+    def __init__(self, default_ttl=60, ttls=None, stale_ttl=600, max_entries=256):
+        self.default_ttl = default_ttl
+        # Longest matching prefix wins, e.g. {'/links': 300, '/projects': 30}
+        self.ttls = sorted(((split_path(p), t) for p, t in (ttls or {}).items()),
+                           key=lambda item: len(item[0]), reverse=True)
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+
+        self._entries = OrderedDict()   # key -> (value, stored_at, ttl)
+        self._refreshing = set()
+        self._generation = 0            # bumped by invalidate(); guards late refreshes
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'stale_hits': 0, 'misses': 0,
+                       'refreshes': 0, 'errors': 0, 'evictions': 0}
+
+    @property
+    def generation(self):
+        """Bumped by every invalidate() and clear()"""
+        return self._generation
+
+    def ttl_for(self, key):
+        parts = _key_parts(key)
+        for prefix, ttl in self.ttls:
+            if parts[:len(prefix)] == prefix:
+                return ttl
+        return self.default_ttl
+
+    def get_or_load(self, key, loader):
+        """Return the cached value for `key`, calling `loader()` on a miss.
+
+        Exceptions from `loader` propagate only when nothing (not even an
+        expired entry) is cached for the key.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, stored_at, ttl = entry
+                age = now - stored_at
+                if age < ttl:
+                    self._entries.move_to_end(key)
+                    self._stats['hits'] += 1
+                    return value
+                if age < ttl + self.stale_ttl:
+                    self._entries.move_to_end(key)
+                    self._stats['stale_hits'] += 1
+                    if key not in self._refreshing:
+                        self._refreshing.add(key)
+                        threading.Thread(target=self._refresh, args=(key, loader),
+                                         daemon=True).start()
+                    return value
+            self._stats['misses'] += 1
+            generation = self._generation
+
+        try:
+            value = loader()
+        except Exception:
+            with self._lock:
+                self._stats['errors'] += 1
+                entry = self._entries.get(key)
+            if entry is not None:
+                return entry[0]
+            raise
+        self._store(key, value, generation)
+        return value
+
+    def _refresh(self, key, loader):
+        with self._lock:
+            generation = self._generation
+        try:
+            value = loader()
+        except Exception:
+            with self._lock:
+                self._stats['errors'] += 1
+        else:
+            self._store(key, value, generation)
+            with self._lock:
+                self._stats['refreshes'] += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _store(self, key, value, generation):
+        with self._lock:
+            # A write invalidated this path while we were fetching: the value
+            # may predate it, so let the next read fetch again.
+            if generation != self._generation:
+                return
+            self._entries[key] = (value, time.monotonic(), self.ttl_for(key))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+
+    def invalidate(self, path):
+        """Drop `path`, every cached ancestor and every cached descendant"""
+        parts = split_path(path)
+        with self._lock:
+            self._generation += 1
+            for key in list(self._entries):
+                kparts = _key_parts(key)
+                n = min(len(parts), len(kparts))
+                if kparts[:n] == parts[:n]:
+                    del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats, entries=len(self._entries))
+        lookups = stats['hits'] + stats['stale_hits'] + stats['misses']
+        stats['hit_rate'] = (stats['hits'] + stats['stale_hits']) / lookups if lookups else 0.0
+        return stats
@@ -0,0 +1,77 @@
+"""Cached fingerprint of the admin credentials for the admin app's login check.
+
+Instead of reading the credentials from Firebase on every admin request,
+the admin app keeps an HMAC fingerprint of the stored username and
+password for `ttl` seconds, and each session carries the fingerprint
+computed when it logged in; checking a request is a string compare.
+
+The cached fingerprint is dropped as soon as anything under the
+credentials path is written: by the writing worker through invalidate(),
+and by every other admin worker through the invalidation journal, which
+calls invalidate() / clear() like it does on a ReadCache. The TTL only
+bounds how long a change made in the Firebase console goes unnoticed.
+"""
+import hashlib
+import hmac
+import threading
+import time
+
+from rtdb.snapshot import split_path
+
+
+def fingerprint(secret, username, password):
+    """Keyed hash of a username/password pair; safe to keep in the session cookie"""
+    key = secret.encode('utf-8') if isinstance(secret, str) else secret
+    message = f"{username}\0{password}".encode('utf-8')
+    return hmac.new(key, message, hashlib.sha256).hexdigest()
+
+
+class CredentialCache:
+    def __init__(self, path, loader, secret, ttl=30, journal=None):
+        self.path = path
+        # loader(path) -> dict with 'admin_username' / 'admin_password', or None if unreadable
+        self.loader = loader
+        self.secret = secret
+        self.ttl = ttl
+        # Optional rtdb.invalidation.InvalidationJournal (its own instance: readers keep an offset)
+        self.journal = journal
+
+        self._parts = split_path(path)
+        self._value = None
+        self._stored_at = 0.0
+        self._generation = 0    # bumped by invalidate(); guards late loads
+        self._lock = threading.Lock()
+
+    def fingerprint(self, username, password):
+        return fingerprint(self.secret, username, password)
+
+    def current(self):
+        """Fingerprint of the stored credentials, or None if they can't be read"""
+        if self.journal is not None:
+            self.journal.apply(self)
+        with self._lock:
+            if self._value is not None and time.monotonic() - self._stored_at < self.ttl:
+                return self._value
+            generation = self._generation
+
+        data = self.loader(self.path)
+        if not data or not data.get('admin_username'):
+            return None
+        value = self.fingerprint(data.get('admin_username'), data.get('admin_password'))
+        with self._lock:
+            # Credentials written while we were reading: don't keep what may be the old ones
+            if generation == self._generation:
+                self._value, self._stored_at = value, time.monotonic()
+        return value
+
+    def invalidate(self, path):
+        """Forget the fingerprint if `path` is the credentials path, above or below it"""
+        parts = split_path(path)
+        n = min(len(parts), len(self._parts))
+        if parts[:n] == self._parts[:n]:
+            self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._value = None
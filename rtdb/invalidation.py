@@ -0,0 +1,84 @@
+"""Cross-process cache invalidation between the admin and public apps.
+
+The two apps run as separate services on the same host. The admin app
+appends every database path it writes to a small journal file; the public
+app checks that file before serving a cached read and drops only the cache
+entries under the paths that changed since it last looked.
+
+The journal is append-only (each publish is a single O_APPEND write, so
+lines from different admin workers never interleave). When it grows past
+`max_bytes` it is replaced by an empty file; readers notice the new inode
+and clear their whole cache, since they can no longer tell what they
+missed.
+"""
+import os
+import threading
+
+DEFAULT_JOURNAL_PATH = os.getenv(
+    'FIREBASE_INVALIDATION_JOURNAL',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.rtdb-invalidations'),
+)
+
+
+class InvalidationJournal:
+    def __init__(self, path=DEFAULT_JOURNAL_PATH, max_bytes=64 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Readers start at the current end of the journal: a fresh cache has nothing to drop
+        self._inode, self._offset = self._position()
+
+    def _position(self):
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None, 0
+        return st.st_ino, st.st_size
+
+    @property
+    def position(self):
+        """(inode, offset) applied up to; readers at the same position have dropped the same paths"""
+        return self._inode, self._offset
+
+    def publish(self, *paths):
+        """Record that `paths` changed (called by the writer after each write)"""
+        data = ''.join(f"{p}\n" for p in paths if p).encode('utf-8')
+        if not data:
+            return
+        try:
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, data)
+                size = os.fstat(fd).st_size
+            finally:
+                os.close(fd)
+            if size > self.max_bytes:
+                tmp = f"{self.path}.{os.getpid()}.tmp"
+                open(tmp, 'wb').close()
+                os.replace(tmp, self.path)
+        except OSError as e:
+            print(f"Failed to publish cache invalidation for {paths}: {e}")
+
+    def apply(self, cache):
+        """Invalidate every path published since the last call on `cache`"""
+        inode, size = self._position()
+        if inode == self._inode and size == self._offset:
+            return  # fast path: nothing written
+        with self._lock:
+            if inode != self._inode:
+                # Journal created or rotated since we last looked
+                if self._inode is not None:
+                    cache.clear()
+                self._inode, self._offset = inode, 0
+            try:
+                with open(self.path, 'rb') as f:
+                    f.seek(self._offset)
+                    data = f.read()
+            except OSError:
+                return
+            # Leave a partially written trailing line for the next call
+            end = data.rfind(b'\n') + 1
+            self._offset += end
+            for line in data[:end].decode('utf-8', 'replace').splitlines():
+                if line:
+                    cache.invalidate(line)
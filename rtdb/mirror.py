@@ -0,0 +1,237 @@
+"""Live in-memory mirror of the Realtime Database, kept current by its streaming API.
+
+A GET with `Accept: text/event-stream` keeps the connection open: Firebase
+first sends a `put` of the whole subtree, then a `put` or `patch` event for
+every change, and a `keep-alive` every ~30 seconds. LiveMirror applies those
+events to a local tree on a background thread, so reads are dict lookups
+that are at most one event behind the database, without TTLs or polling.
+
+Updates are copy-on-write: each event builds a new root that shares every
+untouched branch with the previous one, and swaps it in at once. A reader
+holding the old root keeps a consistent view, and unchanged sections keep
+their identity (the render cache relies on that). Don't mutate what get()
+returns.
+
+Each process holds its own connection (the thread is started again after a
+fork). When the stream drops it reconnects with backoff; until a connection
+delivers events again the tree is refreshed with a plain full GET. `ready`
+is False while the tree is older than `max_stale` seconds, so callers can
+fall back to their normal read path.
+"""
+import json
+import os
+import threading
+import time
+
+import requests
+
+from rtdb.session import TIMEOUT, get_session
+from rtdb.snapshot import join_path, split_path, walk
+
+
+def set_path(tree, parts, value):
+    """Copy of `tree` with `value` at `parts` (None deletes); untouched branches are shared"""
+    if not parts:
+        return value
+    key, rest = parts[0], parts[1:]
+    if isinstance(tree, list) and key.isdigit():
+        # Firebase sends children keyed 0..n as JSON arrays
+        copy = list(tree)
+        i = int(key)
+        copy.extend([None] * (i + 1 - len(copy)))
+        copy[i] = set_path(copy[i], rest, value)
+        while copy and copy[-1] is None:
+            copy.pop()
+        return copy or None
+    if isinstance(tree, list):
+        tree = {str(i): item for i, item in enumerate(tree) if item is not None}
+    copy = dict(tree) if isinstance(tree, dict) else {}
+    child = set_path(copy.get(key), rest, value)
+    if child is None:
+        copy.pop(key, None)
+    else:
+        copy[key] = child
+    # Firebase has no empty nodes: removing the last child removes the parent
+    return copy or None
+
+
+def iter_events(lines):
+    """(event, data) pairs from the lines of a text/event-stream response"""
+    event, data = None, []
+    for line in lines:
+        if not line:
+            if event or data:
+                yield event or 'message', '\n'.join(data)
+            event, data = None, []
+            continue
+        if line.startswith(':'):
+            continue
+        field, _, value = line.partition(':')
+        if value.startswith(' '):
+            value = value[1:]
+        if field == 'event':
+            event = value
+        elif field == 'data':
+            data.append(value)
+
+
+class LiveMirror:
+    def __init__(self, url, path='/', max_stale=120, retry_delay=1.0, max_retry_delay=60.0, read_timeout=90):
+        self.url = url.rstrip('/')
+        self.path = join_path(split_path(path))
+        self.max_stale = max_stale
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        # Longer than the keep-alive interval: a silent connection is a dead one
+        self.read_timeout = read_timeout
+
+        self._base_parts = split_path(path)
+        self._tree = None
+        self._loaded = False        # whether a put or snapshot has filled _tree yet
+        self._fresh_at = None       # monotonic time the tree was last known current
+        self._received = False      # whether the current connection delivered anything
+        self._response = None
+        self._pid = None
+        self._thread = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._stats = {'events': 0, 'connects': 0, 'snapshots': 0, 'errors': 0}
+
+    @property
+    def endpoint(self):
+        return f"{self.url}/{self.path.strip('/')}.json"
+
+    def start(self):
+        """Start the stream thread in this process, if it isn't running here yet"""
+        pid = os.getpid()
+        if self._pid == pid:
+            return self
+        with self._lock:
+            if self._pid != pid:
+                self._pid = pid
+                self._stop = threading.Event()
+                self._thread = threading.Thread(target=self._run, name='firebase-mirror', daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        response = self._response
+        if response is not None:
+            response.close()
+
+    @property
+    def ready(self):
+        fresh_at = self._fresh_at
+        return fresh_at is not None and time.monotonic() - fresh_at < self.max_stale
+
+    def wait(self, timeout=None):
+        """Block until the first full tree has arrived (or `timeout`); returns `ready`"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.ready:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def get(self, path, key=None):
+        """Same calling convention as FirebaseApplication.get, answered from the mirror"""
+        parts = split_path(path)
+        if key:
+            parts.append(str(key))
+        if parts[:len(self._base_parts)] != self._base_parts:
+            raise ValueError(f"{join_path(parts)} is outside mirror {self.path}")
+        return walk(self._tree, parts[len(self._base_parts):])
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        fresh_at = self._fresh_at
+        stats['ready'] = self.ready
+        stats['age'] = time.monotonic() - fresh_at if fresh_at is not None else None
+        return stats
+
+    def _run(self):
+        session = requests.Session()
+        delay = self.retry_delay
+        while not self._stop.is_set():
+            self._received = False
+            try:
+                self._stream(session)
+            except Exception as e:
+                self._count('errors')
+                print(f"Firebase mirror stream ended: {e}")
+            if self._stop.is_set():
+                break
+            if self._received:
+                # It was working: reconnect promptly, the new stream resends everything
+                delay = self.retry_delay
+            else:
+                # Can't stream right now; keep the tree current the slow way meanwhile
+                self._load_snapshot()
+            self._stop.wait(delay)
+            delay = min(delay * 2, self.max_retry_delay)
+
+    def _stream(self, session):
+        response = session.get(self.endpoint, headers={'Accept': 'text/event-stream'},
+                               stream=True, timeout=(TIMEOUT[0], self.read_timeout))
+        self._response = response
+        try:
+            response.raise_for_status()
+            self._count('connects')
+            response.encoding = 'utf-8'
+            for event, data in iter_events(response.iter_lines(chunk_size=None, decode_unicode=True)):
+                if self._stop.is_set():
+                    return
+                self._handle(event, data)
+        finally:
+            self._response = None
+            response.close()
+
+    def _handle(self, event, data):
+        if event in ('put', 'patch'):
+            message = json.loads(data)
+            self._apply(event, split_path(message.get('path')), message.get('data'))
+        elif event == 'keep-alive':
+            with self._lock:
+                # Vouches for a tree we already have, not for the empty one before the first put
+                if self._loaded:
+                    self._fresh_at = time.monotonic()
+        elif event == 'cancel':
+            # Security rules no longer allow reading this location
+            raise RuntimeError(f"stream cancelled by the server: {data}")
+        elif event == 'auth_revoked':
+            raise RuntimeError("stream credential expired")
+        self._received = True
+
+    def _apply(self, event, parts, data):
+        with self._lock:
+            tree = self._tree
+            if event == 'put':
+                tree = set_path(tree, parts, data)
+            else:
+                for child, value in (data or {}).items():
+                    tree = set_path(tree, parts + split_path(child), value)
+            self._tree = tree
+            self._loaded = True
+            self._fresh_at = time.monotonic()
+            self._stats['events'] += 1
+
+    def _load_snapshot(self):
+        try:
+            response = get_session().get(self.endpoint, timeout=TIMEOUT)
+            response.raise_for_status()
+            tree = response.json() if response.text else None
+        except (requests.exceptions.RequestException, ValueError) as e:
+            self._count('errors')
+            print(f"Firebase mirror snapshot failed: {e}")
+            return
+        with self._lock:
+            self._tree = tree
+            self._loaded = True
+            self._fresh_at = time.monotonic()
+            self._stats['snapshots'] += 1
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
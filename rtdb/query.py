@@ -0,0 +1,31 @@
+"""Query parameters for Firebase REST reads that don't need a whole subtree.
+
+    shallow=True               just the child keys ({key: true, ...}), no values
+    order_by + limit_to_first  the first N children by key ('$key') or by a child
+    order_by + equal_to        only the children whose ordered value matches
+
+Both Firebase wrappers take these as keyword arguments to get(); cached
+reads are keyed on the path plus the query string (rtdb.cache.cache_key).
+Ordering by anything other than '$key', '$value' or '$priority' needs an
+".indexOn" rule for that child in the database rules.
+"""
+import json
+from urllib.parse import urlencode
+
+
+def query_string(shallow=False, order_by=None, limit_to_first=None, equal_to=None):
+    """URL query for a GET ('' for a plain read); values JSON-encoded as the REST API expects"""
+    if shallow and (order_by is not None or limit_to_first is not None or equal_to is not None):
+        raise ValueError("shallow reads can't be combined with orderBy / limitToFirst / equalTo")
+    if order_by is None and (limit_to_first is not None or equal_to is not None):
+        raise ValueError("limit_to_first and equal_to need order_by")
+    params = []
+    if shallow:
+        params.append(('shallow', 'true'))
+    if order_by is not None:
+        params.append(('orderBy', json.dumps(order_by)))
+    if equal_to is not None:
+        params.append(('equalTo', json.dumps(equal_to)))
+    if limit_to_first is not None:
+        params.append(('limitToFirst', str(int(limit_to_first))))
+    return urlencode(params)
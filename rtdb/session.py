@@ -0,0 +1,66 @@
+"""Shared keep-alive HTTP session for the Firebase REST wrappers.
+
+Module-level requests.get/put/... open a new TCP + TLS connection per call.
+A Session with a pooled HTTPAdapter keeps connections to the database host
+alive between calls, and lets us apply timeouts and retries in one place.
+"""
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connections kept per host; size it to the number of threads that may call
+# Firebase at once in one worker process (request threads + cache refreshes)
+POOL_SIZE = int(os.getenv('FIREBASE_POOL_SIZE', '10'))
+# (connect, read) seconds: a hung Firebase call must not hang the worker
+TIMEOUT = (float(os.getenv('FIREBASE_CONNECT_TIMEOUT', '3.05')),
+           float(os.getenv('FIREBASE_READ_TIMEOUT', '10')))
+RETRIES = int(os.getenv('FIREBASE_RETRIES', '3'))
+
+# POST creates a new push id each time, so it is never retried
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'PUT', 'PATCH', 'DELETE'})
+# A conditional (if-match) write isn't idempotent either: if the first attempt
+# landed but its response was lost, the resend gets a 412 for our own write
+READ_METHODS = frozenset({'GET', 'HEAD'})
+
+_lock = threading.Lock()
+_sessions = {}
+_session_pid = None
+
+
+def build_session(pool_size=POOL_SIZE, retries=RETRIES, methods=IDEMPOTENT_METHODS):
+    """New Session with a connection pool and backoff retries on `methods`"""
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=methods,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_session(conditional=False):
+    """Process-wide session, rebuilt after fork so workers never share sockets
+
+    conditional=True gives the session for if-match writes, which only retries reads.
+    """
+    global _session_pid
+    methods = READ_METHODS if conditional else IDEMPOTENT_METHODS
+    pid = os.getpid()
+    session = _sessions.get(methods) if _session_pid == pid else None
+    if session is None:
+        with _lock:
+            if _session_pid != pid:
+                _sessions.clear()
+                _session_pid = pid
+            session = _sessions.get(methods)
+            if session is None:
+                session = _sessions[methods] = build_session(methods=methods)
+    return session
@@ -0,0 +1,66 @@
+"""In-memory view over a Firebase Realtime Database subtree.
+
+Instead of issuing one REST GET per section, a page fetches the common
+ancestor of every path it needs in a single request and then reads each
+section out of the resulting tree.
+"""
+
+
+def split_path(path):
+    """Split '/a/b/c' (or 'a/b/c/') into ['a', 'b', 'c']"""
+    return [part for part in str(path or '').split('/') if part]
+
+
+def join_path(parts):
+    """Inverse of split_path: ['a', 'b'] -> '/a/b'"""
+    return '/' + '/'.join(parts)
+
+
+def common_path(paths):
+    """Deepest path that is an ancestor of (or equal to) every given path"""
+    split = [split_path(p) for p in paths]
+    if not split:
+        return '/'
+    prefix = []
+    for parts in zip(*split):
+        if any(part != parts[0] for part in parts):
+            break
+        prefix.append(parts[0])
+    return join_path(prefix)
+
+
+def walk(tree, parts):
+    """Follow `parts` down a nested dict, returning None when a level is missing"""
+    node = tree
+    for part in parts:
+        if isinstance(node, dict):
+            node = node.get(part)
+        elif isinstance(node, list) and part.isdigit() and int(part) < len(node):
+            # Firebase returns children keyed 0..n as JSON arrays
+            node = node[int(part)]
+        else:
+            return None
+        if node is None:
+            return None
+    return node
+
+
+class Snapshot:
+    """A single fetched subtree that can answer reads for any path beneath it"""
+
+    def __init__(self, base, tree):
+        self.base = join_path(split_path(base))
+        self.tree = tree
+        self._base_parts = split_path(base)
+
+    def __bool__(self):
+        return self.tree is not None
+
+    def get(self, path, key=None):
+        """Same calling convention as FirebaseApplication.get, but served from memory"""
+        parts = split_path(path)
+        if key:
+            parts.append(str(key))
+        if parts[:len(self._base_parts)] != self._base_parts:
+            raise ValueError(f"{join_path(parts)} is outside snapshot {self.base}")
+        return walk(self.tree, parts[len(self._base_parts):])
@@ -0,0 +1,32 @@
+"""frontend.bundle: purging unused Bootstrap rules."""
+import os
+
+from frontend.bundle import CSS_BUNDLE, JS_SOURCES, PURGE_CSS, STATIC_DIR, TEMPLATES, minify_css, used_tokens
+
+BUTTON_CSS = """
+.btn-check:checked+.btn,:not(.btn-check)+.btn:active,.btn:first-child:active{color:red}
+:not(.btn-check)+.btn:active:focus-visible{box-shadow:none}
+.toast:not(.show){display:none}
+.carousel-item{float:left}
+"""
+
+
+def test_purge_ignores_classes_inside_not():
+    css = '\n'.join(line for line, _ in minify_css(BUTTON_CSS, 'a.css', 'dist/b.css', {'btn', 'toast'}))
+
+    assert ':not(.btn-check)+.btn:active,.btn:first-child:active{' in css
+    assert ':not(.btn-check)+.btn:active:focus-visible{' in css
+    assert '.toast:not(.show){' in css
+    assert '.btn-check:checked' not in css
+    assert 'carousel-item' not in css
+
+
+def test_bootstrap_keeps_pressed_button_style():
+    source, = PURGE_CSS
+    with open(os.path.join(STATIC_DIR, *source.split('/')), encoding='utf-8') as f:
+        text = f.read()
+    used = used_tokens(list(TEMPLATES) + [os.path.join(STATIC_DIR, *s.split('/')) for s in JS_SOURCES])
+    css = '\n'.join(line for line, _ in minify_css(text, source, CSS_BUNDLE, used))
+
+    assert ':not(.btn-check)+.btn:active' in css
+    assert ':not(.btn-check)+.btn:active:focus-visible' in css
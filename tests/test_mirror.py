@@ -0,0 +1,95 @@
+"""rtdb.mirror: copy-on-write tree updates and stream event handling (no network)."""
+import pytest
+
+from rtdb.mirror import LiveMirror, iter_events, set_path
+
+
+def test_set_path_shares_untouched_branches():
+    tree = {'about': {'name': 'John'}, 'landing': {'skills': {'a': 1}}}
+    updated = set_path(tree, ['landing', 'skills', 'b'], 2)
+
+    assert updated == {'about': {'name': 'John'}, 'landing': {'skills': {'a': 1, 'b': 2}}}
+    assert tree == {'about': {'name': 'John'}, 'landing': {'skills': {'a': 1}}}
+    assert updated['about'] is tree['about']
+    assert updated['landing'] is not tree['landing']
+
+
+def test_set_path_in_arrays():
+    assert set_path(['a', 'b'], ['3'], 'd') == ['a', 'b', None, 'd']
+    assert set_path(['a', 'b', 'c'], ['2'], None) == ['a', 'b']
+    # A non-numeric key turns the array into the object Firebase really holds
+    assert set_path(['a', None, 'c'], ['x'], 1) == {'0': 'a', '2': 'c', 'x': 1}
+
+
+def test_set_path_delete_prunes_empty_parents():
+    tree = {'links': {'id': {'email': 'e'}}, 'about': {'name': 'John'}}
+    assert set_path(tree, ['links', 'id', 'email'], None) == {'about': {'name': 'John'}}
+    assert set_path({'only': {'child': 1}}, ['only', 'child'], None) is None
+    assert set_path(['a'], ['0'], None) is None
+    assert set_path(tree, [], None) is None
+
+
+def test_iter_events():
+    lines = [
+        ': comment',
+        'event: put',
+        'data: {"path": "/", "data": {"a": 1}}',
+        '',
+        'event: keep-alive',
+        'data: null',
+        '',
+        'data: first',
+        'data:second',
+        '',
+        '',
+    ]
+    assert list(iter_events(lines)) == [
+        ('put', '{"path": "/", "data": {"a": 1}}'),
+        ('keep-alive', 'null'),
+        ('message', 'first\nsecond'),
+    ]
+
+
+def test_handle_put_and_patch():
+    mirror = LiveMirror('https://example.firebaseio.com', path='/portfolio')
+    mirror._handle('put', '{"path": "/", "data": {"about": {"name": "John"}, "links": {"email": "e"}}}')
+    about = mirror.get('/portfolio/about')
+
+    mirror._handle('patch', '{"path": "/links", "data": {"phone": "p", "email": null}}')
+    assert mirror.get('/portfolio/links') == {'phone': 'p'}
+    assert mirror.get('/portfolio', 'about') is about
+
+    mirror._handle('put', '{"path": "/links", "data": null}')
+    assert mirror.get('/portfolio') == {'about': {'name': 'John'}}
+    assert mirror.ready
+    assert mirror._received
+    assert mirror.stats()['events'] == 3
+    with pytest.raises(ValueError):
+        mirror.get('/other')
+
+
+def test_handle_keep_alive_before_first_put_is_not_ready():
+    mirror = LiveMirror('https://example.firebaseio.com')
+    mirror._handle('keep-alive', 'null')
+    assert not mirror.ready
+    assert mirror._received
+
+
+def test_handle_keep_alive_refreshes_without_changes():
+    mirror = LiveMirror('https://example.firebaseio.com', max_stale=60)
+    mirror._handle('put', '{"path": "/", "data": {"a": 1}}')
+    mirror._fresh_at -= 120
+    assert not mirror.ready
+    mirror._handle('keep-alive', 'null')
+    assert mirror.ready
+    assert mirror.get('/') == {'a': 1}
+    assert mirror.stats()['events'] == 1
+
+
+def test_handle_cancel_ends_the_stream():
+    mirror = LiveMirror('https://example.firebaseio.com')
+    with pytest.raises(RuntimeError):
+        mirror._handle('cancel', 'Permission denied')
+    with pytest.raises(RuntimeError):
+        mirror._handle('auth_revoked', 'credential is no longer valid')
+    assert not mirror._received